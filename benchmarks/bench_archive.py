@@ -0,0 +1,133 @@
+"""
+기사 기록/다이제스트 보관소 벤치마크
+
+1) 같은 항목의 딕셔너리와 __slots__ 기사 기록(Article) 수만 개의 메모리 사용량(tracemalloc),
+2) 합성 기사(요약 포함)로 하루 한 번 다이제스트를 --days일 동안 보관할 때의 추가 시간과 디스크 크기(압축률),
+3) 보관소를 다시 열 때(색인 읽기) 시간과 URL/날짜 조회 지연,
+4) 최근 30일/전체 기간 검색의 첫 검색(전체 기간은 두 글자 역색인 생성 포함)과 이후 검색 지연,
+   같은 검색을 기간 안의 다이제스트를 모두 풀어 훑는 방식으로 할 때의 지연
+을 측정한다.
+
+사용법:
+    python benchmarks/bench_archive.py [--days 365] [--per-day 30] [--records 50000] [--queries 50] [--limit 10]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import synthetic_article, synthetic_sentence  # noqa: E402
+from modules.article import Article  # noqa: E402
+from modules.archive import DigestArchive  # noqa: E402
+
+PRESS = ["연합뉴스", "뉴시스", "KBS", "MBC", "SBS", "조선일보", "중앙일보", "한겨레", "경향신문", "매일경제"]
+CATEGORIES = ["정치", "경제", "사회", "생활/문화", "세계", "IT/과학"]
+
+def make_article(rng, number):
+    return Article(synthetic_sentence(rng), f"https://n.news.naver.com/mnews/article/001/{number:010d}",
+                   rng.choice(PRESS), rng.choice(CATEGORIES), "2025-01-01 08:00:00",
+                   synthetic_article(rng, min_sentences=3, max_sentences=3))
+
+def measure_memory(count, rng):
+    """기사 count개를 딕셔너리와 Article로 만들 때의 메모리 (문자열은 공유하여 컨테이너 크기만 비교)"""
+    template = make_article(rng, 0)
+    results = {}
+    for name, build in (("dict", lambda idx: template.to_dict()),
+                        ("Article", lambda idx: Article(template.title, template.link, template.press,
+                                                        template.category, template.timestamp,
+                                                        template.summary, []))):
+        tracemalloc.start()
+        records = [build(idx) for idx in range(count)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = size / len(records)
+        del records
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 기록/다이제스트 보관소 벤치마크")
+    parser.add_argument("--days", type=int, default=365, help="보관할 다이제스트 수 (하루 한 번)")
+    parser.add_argument("--per-day", type=int, default=30, help="다이제스트 하나의 기사 수")
+    parser.add_argument("--records", type=int, default=50000, help="메모리 측정에 사용할 기사 기록 수")
+    parser.add_argument("--queries", type=int, default=50, help="검색 횟수")
+    parser.add_argument("--limit", type=int, default=10, help="검색 결과 최대 기사 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    memory = measure_memory(args.records, rng)
+    print(f"기사 기록 {args.records}개: dict {memory['dict']:.0f}B/개, Article {memory['Article']:.0f}B/개 "
+          f"({memory['Article'] / memory['dict']:.0%})")
+
+    digests = []
+    for day in range(args.days):
+        date = time.strftime("%Y%m%d", time.gmtime(1704067200 + day * 86400))
+        digests.append((date, [make_article(rng, day * args.per_day + idx) for idx in range(args.per_day)]))
+    total = args.days * args.per_day
+    raw = sum(len(json.dumps([article.to_dict() for article in articles], ensure_ascii=False).encode("utf-8"))
+              for _, articles in digests)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = os.path.join(tmp, "archive")
+        archive = DigestArchive(directory)
+        start = time.perf_counter()
+        for date, articles in digests:
+            archive.append(articles, date)
+        append_seconds = time.perf_counter() - start
+        archive.close()
+        disk = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"\n다이제스트 {args.days}개 (기사 {total}개) 보관: {append_seconds:.2f}초 "
+              f"({append_seconds / args.days * 1000:.2f}ms/다이제스트)")
+        print(f"디스크 {disk / 1024:.0f}KiB (JSON {raw / 1024:.0f}KiB 대비 {disk / raw:.0%}, 색인 포함)")
+
+        start = time.perf_counter()
+        archive = DigestArchive(directory)
+        print(f"다시 열기(색인 읽기): {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        links = [article.link for _, articles in digests for article in articles]
+        sample = rng.sample(links, min(1000, len(links)))
+        start = time.perf_counter()
+        for link in sample:
+            archive.get(link)
+        lookup = (time.perf_counter() - start) / len(sample)
+        dates = [date for date, _ in digests]
+        start = time.perf_counter()
+        for date in rng.sample(dates, min(100, len(dates))):
+            archive.by_date(date)
+        by_date = (time.perf_counter() - start) / min(100, len(dates))
+        print(f"URL 조회 {lookup * 1e6:.0f}us, 날짜 조회 {by_date * 1000:.2f}ms")
+
+        # 검색어: 보관된 기사 제목의 두 단어 (모두 포함하는 기사)
+        titles = [article.title.split() for _, articles in digests for article in articles]
+        queries = [" ".join(rng.sample(words, 2)) for words in rng.sample(titles, args.queries)]
+        print(f"\n검색 {len(queries)}회 (최대 {args.limit}건)")
+        print(f"{'range':>6} {'first ms':>9} {'search ms':>10} {'scan ms':>8} {'hits':>6}")
+        for days in (30, 0):
+            since = dates[max(0, len(dates) - days)] if days else None
+            start = time.perf_counter()
+            archive.search(queries[0], since=since, limit=args.limit)
+            first = time.perf_counter() - start
+            start = time.perf_counter()
+            hits = sum(len(archive.search(query, since=since, limit=args.limit)) for query in queries)
+            indexed = (time.perf_counter() - start) / len(queries)
+
+            # 비교 기준: 기간 안의 다이제스트 압축을 모두 풀어 제목/요약을 훑는 방식
+            start = time.perf_counter()
+            for query in queries:
+                terms = query.casefold().split()
+                [article for date in dates if not since or date >= since for article in archive.by_date(date)
+                 if all(term in f"{article.title}\n{article.summary}".casefold() for term in terms)]
+            scan = (time.perf_counter() - start) / len(queries)
+            print(f"{f'{days}d' if days else 'all':>6} {first * 1000:>9.1f} {indexed * 1000:>10.2f} "
+                  f"{scan * 1000:>8.2f} {hits / len(queries):>6.1f}")
+        archive.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+여러 섹션 목록 수집과 키워드 필터 벤치마크
+
+1) 로컬 HTTP 서버(응답 지연 주입)에 섹션 여러 개와 목록 페이지 여러 개를 두고, 목록 페이지를
+   한 번에 하나씩 받는 경우(--listing-workers 1)와 동시에 받는 경우의 소요 시간과 요청한 목록 페이지 수를
+   비교한다. limit를 앞 페이지에서 채우면 뒤 페이지를 받지 않는지도 함께 확인한다.
+2) 합성 기사 제목에 키워드 수백 개를 적용할 때 키워드마다 `in`으로 검사하는 방식, 정규식 하나로 합친 방식,
+   KeywordMatcher(Aho-Corasick)의 처리량(제목/초)을 비교한다.
+
+사용법:
+    python benchmarks/bench_collect.py [--sections 100 101 102 103 104 105] [--page-size 20] [--pages 5]
+        [--limits 10 60 200] [--latency-ms 100] [--listing-workers 8]
+        [--titles 20000] [--keywords 10 100 500] [--repeat 3]
+"""
+import os
+import re
+import sys
+import time
+import random
+import logging
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import synthetic_sentence  # noqa: E402
+from benchmarks.servers import FixtureHTTPServer  # noqa: E402
+
+def collect(server, limit, pages, workers):
+    """목록 수집 한 번의 (소요 시간, 기사 수, 요청한 목록 페이지 수)"""
+    import modules.fetch_news as fetch_news
+
+    fetch_news.LISTING_WORKERS = workers
+    before = server.listing_requests
+    start = time.perf_counter()
+    articles = fetch_news.fetch_news(limit=limit, keyword_filter=[], dedup_threshold=None,
+                                     sections=server.sections, pages=pages, base_url=server.base_url)
+    return time.perf_counter() - start, len(articles), server.listing_requests - before
+
+def bench_listing(args):
+    count = len(args.sections) * args.page_size * args.pages
+    print(f"섹션 {len(args.sections)}개 x 페이지 {args.pages}개 (페이지당 {args.page_size}건), "
+          f"응답 지연 {args.latency_ms:g}ms")
+    print(f"{'limit':>6} {'workers':>8} {'seconds':>8} {'articles':>9} {'pages':>6}")
+    with FixtureHTTPServer(count, latency_ms=args.latency_ms, sections=args.sections,
+                           page_size=args.page_size) as server:
+        for limit in args.limits:
+            for workers in (1, args.listing_workers):
+                best = min((collect(server, limit, args.pages, workers) for _ in range(args.repeat)),
+                           key=lambda result: result[0])
+                print(f"{limit:>6} {workers:>8} {best[0]:>8.2f} {best[1]:>9} {best[2]:>6}")
+
+def make_keywords(count, rng):
+    """제목에 가끔 나오는 단어와 나오지 않는 임의 단어를 섞은 키워드 목록"""
+    from benchmarks.corpus import SUBJECTS, OBJECTS
+
+    vocabulary = sorted({word for phrase in SUBJECTS + OBJECTS for word in phrase.split()})
+    keywords = []
+    while len(keywords) < count:
+        if rng.random() < 0.05:
+            keywords.append(rng.choice(vocabulary)[:-1])
+        else:
+            keywords.append("".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 4))))
+    return keywords
+
+def bench_keywords(args):
+    from modules.keywords import KeywordMatcher
+
+    rng = random.Random(42)
+    titles = [synthetic_sentence(rng) for _ in range(args.titles)]
+    print(f"\n제목 {len(titles)}개")
+    print(f"{'keywords':>8} {'loop t/s':>11} {'regex t/s':>11} {'matcher t/s':>12} {'matched':>8}")
+    for count in args.keywords:
+        keywords = make_keywords(count, rng)
+        folded = [keyword.casefold() for keyword in keywords]
+        pattern = re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+        matcher = KeywordMatcher(keywords)
+
+        def loop(title):
+            title = title.casefold()
+            return any(keyword in title for keyword in folded)
+
+        rates, results = [], []
+        for check in (loop, lambda title: pattern.search(title) is not None, matcher.matches):
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                matched = [check(title) for title in titles]
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            rates.append(len(titles) / best)
+            results.append(matched)
+        if not results[0] == results[1] == results[2]:
+            print(f"[오류] 키워드 {count}개에서 결과가 서로 다릅니다", file=sys.stderr)
+        print(f"{count:>8} {rates[0]:>11.0f} {rates[1]:>11.0f} {rates[2]:>12.0f} {sum(results[2]):>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 섹션 목록 수집과 키워드 필터 벤치마크")
+    parser.add_argument("--sections", nargs="+", default=["100", "101", "102", "103", "104", "105"],
+                        help="섹션 번호")
+    parser.add_argument("--page-size", type=int, default=20, help="목록 페이지당 기사 수")
+    parser.add_argument("--pages", type=int, default=5, help="섹션당 목록 페이지 수")
+    parser.add_argument("--limits", type=int, nargs="+", default=[10, 60, 200], help="수집할 기사 수")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="HTTP 응답 지연 (밀리초)")
+    parser.add_argument("--listing-workers", type=int, default=8, help="동시에 받을 목록 페이지 수")
+    parser.add_argument("--titles", type=int, default=20000, help="키워드 필터를 적용할 제목 수")
+    parser.add_argument("--keywords", type=int, nargs="+", default=[10, 100, 500], help="키워드 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    bench_listing(args)
+    bench_keywords(args)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
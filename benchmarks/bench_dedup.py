@@ -0,0 +1,100 @@
+"""
+유사 중복 기사 탐지 벤치마크
+
+1) 한 단어만 다른 짧은 한국어 제목("영업이익 증가"/"영업이익 감소") 등 판정 사례를 이전 제목 비교 방식
+   (문자 bigram, 기준 0.6)과 현재 방식(단어 단위, BRIEFY_DEDUP_TITLE_THRESHOLD)으로 확인하고,
+2) 제목이 같아도 본문이 다르면 본문 비교(collapse_duplicates)에서 합치지 않는지 확인한 뒤,
+3) 합성 제목/본문 수천 개를 인덱스에 추가하는 처리량을 측정한다.
+
+사용법:
+    python benchmarks/bench_dedup.py [--count 5000]
+
+Note:
+    - 판정 사례가 기대와 다르면 종료 코드 1
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import synthetic_article, synthetic_sentence  # noqa: E402
+from modules.article import Article  # noqa: E402
+from modules.dedup import NearDuplicateIndex, BODY_THRESHOLD, TITLE_THRESHOLD  # noqa: E402
+
+# (제목 1, 제목 2, 같은 기사 후보인지)
+TITLE_CASES = [
+    ("삼성전자 3분기 영업이익 증가", "삼성전자 3분기 영업이익 감소", False),
+    ("한미 정상회담 서울서 개최", "한미 정상회담 부산서 개최", False),
+    ("코스피 2,500선 회복", "코스피 2,500선 붕괴", False),
+    ("美 연준 기준금리 동결", "美 연준, 기준금리 동결", True),
+    ("정부, 내년 예산 656조원 편성", "정부 내년 예산 656조원 편성", True),
+    ("日 총리 방한…한일 정상회담 개최 예정", "日 총리 방한…한일 정상회담 개최 예정", True),
+]
+
+def title_match(index_args, first, second):
+    index = NearDuplicateIndex(**index_args)
+    index.add(0, first)
+    return index.add(1, second) is not None
+
+def check_titles():
+    """제목 판정 사례를 출력하고 기대와 다른 사례 수를 반환"""
+    legacy = {"threshold": 0.6, "shingle_size": 2}
+    current = {"threshold": TITLE_THRESHOLD, "shingle_size": 1, "words": True}
+    failures = 0
+    print(f"{'legacy':>7} {'current':>8} {'expected':>9}  titles")
+    for first, second, expected in TITLE_CASES:
+        old, new = title_match(legacy, first, second), title_match(current, first, second)
+        failures += new != expected
+        print(f"{str(old):>7} {str(new):>8} {str(expected):>9}  {first} / {second}"
+              f"{'' if new == expected else '  [실패]'}")
+    return failures
+
+def check_body_confirmation(rng):
+    """제목이 같고 본문이 다른 두 기사는 본문 비교에서 둘 다 남는지, 본문이 같으면 합쳐지는지 확인"""
+    import main
+
+    title = "삼성전자 3분기 영업이익 발표"
+    body = synthetic_article(rng, min_sentences=8, max_sentences=8)
+    other = synthetic_article(rng, min_sentences=8, max_sentences=8)
+    failures = 0
+    for contents, expected in (([body, other], 2), ([body, body], 1)):
+        articles = [Article(title, f"https://n.news.naver.com/mnews/article/00{idx}/0000000001", press)
+                    for idx, press in enumerate(("연합뉴스", "뉴시스"))]
+        kept = sum(1 for content in main.collapse_duplicates(articles, contents) if content)
+        failures += kept != expected
+        print(f"본문 {'같음' if contents[0] == contents[1] else '다름'}: 남은 기사 {kept}개 (기대 {expected}개)"
+              f"{'' if kept == expected else '  [실패]'}")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="유사 중복 기사 탐지 벤치마크")
+    parser.add_argument("--count", type=int, default=5000, help="처리량 측정에 사용할 제목/본문 수")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    rng = random.Random(42)
+    failures = check_titles()
+    print()
+    failures += check_body_confirmation(rng)
+
+    titles = [synthetic_sentence(rng) for _ in range(args.count)]
+    bodies = [synthetic_article(rng, min_sentences=5, max_sentences=15) for _ in range(args.count // 5)]
+    print(f"\n{'index':>6} {'docs':>6} {'docs/s':>9} {'matches':>8}")
+    for name, index, texts in (
+        ("title", NearDuplicateIndex(TITLE_THRESHOLD, shingle_size=1, words=True), titles),
+        ("body", NearDuplicateIndex(BODY_THRESHOLD, shingle_size=5), bodies),
+    ):
+        start = time.perf_counter()
+        matches = sum(1 for idx, text in enumerate(texts) if index.add(idx, text) is not None)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>6} {len(texts):>6} {len(texts) / elapsed:>9.0f} {matches:>8}")
+
+    print("\n[통과]" if not failures else f"\n[실패] 기대와 다른 판정 {failures}건")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+기사 페이지 스트리밍 다운로드 벤치마크
+
+로컬 HTTP 서버의 기사 페이지를 전체 다운로드(BRIEFY_FETCH_STREAM=0)와 스트리밍 다운로드로 받아
+기사당 시간, 다운로드한 바이트, 본문 추출에 사용한 바이트(본문 컨테이너 크기), 새로 연 연결 수,
+최대 Python 힙 사용량을 비교하고 두 방식의 추출 결과가 같은지 확인한다.
+
+사용법:
+    python benchmarks/bench_download.py [--articles 60] [--latency-ms 0] [--drain-bytes 0 16384 65536] [--repeat 3]
+
+Note:
+    - --drain-bytes는 읽기를 멈춘 뒤 남은 본문을 마저 읽을 기준 (BRIEFY_FETCH_DRAIN_BYTES,
+      0이면 항상 연결을 닫음). 기준이 크면 연결을 재사용하는 대신 본문 뒤쪽을 모두 받음
+    - 로컬 서버에서는 새 연결 비용(TCP/TLS 핸드셰이크 왕복)이 거의 없으므로 연결 수는 따로 확인
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.servers import FixtureHTTPServer  # noqa: E402
+
+def download(server, stream, drain_bytes, trace=False):
+    """기사 전체를 한 번 받은 (소요 시간, 본문 목록, 카운터(새 연결 수 포함), 최대 힙 바이트)"""
+    import modules.fetch_article as fetch_article
+    from modules import metrics
+
+    fetch_article.STREAM = stream
+    fetch_article.DRAIN_BYTES = drain_bytes
+    if trace:
+        tracemalloc.start()
+    opened = server.connections
+    start = time.perf_counter()
+    with metrics.run("bench_download", output_dir="") as run:
+        contents = [fetch_article.fetch_article(url, use_cache=False) for url in server.article_urls]
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    run.counters["connections_opened"] = server.connections - opened
+    return elapsed, contents, run.counters, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 페이지 스트리밍 다운로드 벤치마크")
+    parser.add_argument("--articles", type=int, default=60, help="기사 수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="HTTP 응답 지연 (밀리초)")
+    parser.add_argument("--drain-bytes", type=int, nargs="+", default=[0, 16384, 65536],
+                        help="스트리밍에서 남은 본문을 마저 읽을 기준 (바이트)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    os.environ["BRIEFY_HEDGE"] = "0"
+
+    print(f"기사 {args.articles}개, 응답 지연 {args.latency_ms:g}ms")
+    print(f"{'mode':>14} {'ms/article':>11} {'KB down':>9} {'KB used':>9} {'used %':>7} {'conns':>6} {'peak KB':>8}")
+    with FixtureHTTPServer(args.articles, latency_ms=args.latency_ms) as server:
+        modes = [("full", False, 0)] + [(f"stream/{drain}", True, drain) for drain in args.drain_bytes]
+        baseline = None
+        for label, stream, drain in modes:
+            # 시간은 tracemalloc 없이 측정하고, 메모리는 따로 한 번 더 실행하여 측정
+            elapsed, contents, counters, _ = min((download(server, stream, drain) for _ in range(args.repeat)),
+                                                 key=lambda result: result[0])
+            peak = download(server, stream, drain, trace=True)[3]
+            if baseline is None:
+                baseline = contents
+            elif contents != baseline:
+                print(f"[오류] {label}: 전체 다운로드와 추출 결과가 다릅니다", file=sys.stderr)
+
+            downloaded = counters.get("http_bytes", 0)
+            used = counters.get("article_bytes_used", 0)
+            used_share = f"{used / downloaded * 100:>6.1f}%" if stream and downloaded else f"{'-':>7}"
+            used_kb = f"{used / 1024:>9.1f}" if stream else f"{'-':>9}"
+            print(f"{label:>14} {elapsed / args.articles * 1000:>11.2f} {downloaded / 1024:>9.1f} "
+                  f"{used_kb} {used_share} {counters['connections_opened']:>6} {peak / 1024:>8.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+fetch_article 본문 추출 마이크로 벤치마크
+
+저장된 네이버 기사 HTML 파일로 lxml 빠른 경로와 기존 BeautifulSoup 경로의
+기사당 파싱 시간과 최대 메모리를 비교하고, 두 경로의 추출 결과가 같은지 확인한다.
+
+사용법:
+    python benchmarks/bench_extract.py [HTML 파일 또는 디렉토리 ...] [--repeat N] [--engine lxml|soup|both]
+
+Note:
+    - 메모리는 tracemalloc 기준 기사당 최대 Python 힙 사용량과 프로세스 최대 RSS를 함께 보고
+    - libxml2의 네이티브 메모리는 tracemalloc에 잡히지 않으므로,
+      RSS 비교는 --engine으로 경로별로 따로 실행하여 확인
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+import resource
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.fetch_article import extract_content  # noqa: E402
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "articles")
+
+def load_pages(paths):
+    """HTML 파일 경로(또는 디렉토리) 목록에서 (이름, 바이트) 목록을 만든다"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.html"))))
+        else:
+            files.append(path)
+
+    pages = []
+    for file in files:
+        with open(file, "rb") as f:
+            pages.append((os.path.basename(file), f.read()))
+    return pages
+
+def measure(pages, fast, repeat):
+    """경로 하나의 기사당 평균 시간(ms)과 최대 tracemalloc 사용량(KB)을 측정"""
+    times = []
+    peaks = []
+    outputs = {}
+    for name, html in pages:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            outputs[name] = extract_content(html, name, fast=fast, encoding="utf-8")
+        times.append((time.perf_counter() - start) / repeat * 1000)
+
+        tracemalloc.start()
+        extract_content(html, name, fast=fast, encoding="utf-8")
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+
+    return times, peaks, outputs
+
+def main():
+    parser = argparse.ArgumentParser(description="fetch_article 본문 추출 벤치마크")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_FIXTURES], help="HTML 파일 또는 디렉토리")
+    parser.add_argument("--repeat", type=int, default=20, help="기사당 반복 횟수")
+    parser.add_argument("--engine", choices=["lxml", "soup", "both"], default="both")
+    args = parser.parse_args()
+
+    pages = load_pages(args.paths)
+    if not pages:
+        print("벤치마크할 HTML 파일이 없습니다.")
+        return 1
+
+    engines = {"lxml": True, "soup": False}
+    if args.engine != "both":
+        engines = {args.engine: engines[args.engine]}
+
+    results = {}
+    print(f"기사 {len(pages)}개, 반복 {args.repeat}회")
+    print(f"{'engine':<8}{'mean ms':>10}{'p95 ms':>10}{'peak KB':>10}")
+    for engine, fast in engines.items():
+        times, peaks, outputs = measure(pages, fast, args.repeat)
+        results[engine] = outputs
+        p95 = statistics.quantiles(times, n=20)[-1] if len(times) > 1 else times[0]
+        print(f"{engine:<8}{statistics.mean(times):>10.2f}{p95:>10.2f}{max(peaks):>10.0f}")
+
+    # ru_maxrss 단위: Linux는 KB, macOS는 바이트
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        maxrss //= 1024
+    print(f"프로세스 최대 RSS: {maxrss} KB")
+
+    if len(results) == 2:
+        mismatches = [name for name, _ in pages if results["lxml"][name] != results["soup"][name]]
+        if mismatches:
+            print(f"추출 결과 불일치: {', '.join(mismatches)}")
+            return 1
+        print("추출 결과 일치")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
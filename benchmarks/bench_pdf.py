@@ -0,0 +1,88 @@
+"""
+PDF 렌더링 벤치마크
+
+합성 기사 100개, 1,000개, 10,000개를 create_news_pdf(전체 메모리)와
+stream_news_pdf(구간 스트리밍)로 렌더링하여 시간과 최대 RSS, 파일 크기를 비교한다.
+
+사용법:
+    python benchmarks/bench_pdf.py [--counts 100 1000 10000] [--mode create|stream|both]
+
+Note:
+    - 실행 디렉토리의 fonts/ 아래에 malgun.ttf, malgunbd.ttf가 있어야 함
+    - 최대 RSS를 정확히 비교하기 위해 (모드, 기사 수)마다 별도 프로세스에서 실행
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def synthetic_digest(count: int, seed: int = 7):
+    """요약된 기사(Article)를 하나씩 생성하는 제너레이터"""
+    from benchmarks.corpus import synthetic_sentence
+    from modules.article import Article
+
+    rng = random.Random(seed)
+    for i in range(count):
+        yield Article(
+            title=synthetic_sentence(rng)[:60],
+            summary=" ".join(synthetic_sentence(rng) for _ in range(4)),
+            link=f"https://n.news.naver.com/mnews/article/001/{i:010d}",
+            press=rng.choice(["연합뉴스", "뉴시스", "KBS", "조선일보"]),
+            category="세계",
+            timestamp="2026-10-18 08:00:00"
+        )
+
+def run_worker(mode: str, count: int):
+    """현재 프로세스에서 렌더링 한 번을 수행하고 결과를 JSON으로 출력"""
+    import logging
+    from modules.abstractive import peak_rss_mb
+    from modules.create_pdf import create_news_pdf, stream_news_pdf
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        if mode == "stream":
+            path = os.path.join(tmp, "digest.pdf")
+            stream_news_pdf(synthetic_digest(count), "bench", path)
+        else:
+            path = create_news_pdf(list(synthetic_digest(count)), "bench")
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+        if mode != "stream":
+            os.remove(path)
+
+    print(json.dumps({"mode": mode, "count": count, "seconds": elapsed,
+                      "peak_rss_mb": peak_rss_mb(), "bytes": size}))
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 렌더링 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--mode", choices=["create", "stream", "both"], default="both")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.mode, args.counts[0])
+        return 0
+
+    modes = ["create", "stream"] if args.mode == "both" else [args.mode]
+    print(f"{'mode':<8}{'articles':>10}{'seconds':>10}{'peak RSS MB':>14}{'bytes':>14}")
+    for count in args.counts:
+        for mode in modes:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--worker", "--mode", mode, "--counts", str(count)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:<8}{count:>10}{result['seconds']:>10.2f}{result['peak_rss_mb']:>14.0f}{result['bytes']:>14,}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
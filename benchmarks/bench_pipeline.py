@@ -0,0 +1,281 @@
+"""
+오프라인 전 단계 파이프라인 벤치마크
+
+로컬 HTTP 서버가 저장된 네이버 섹션/기사 HTML을 재생하고 로컬 SMTP 서버가 메일을 받는 환경에서
+fetch_news(목록 파싱), fetch_article(본문 추출), summarize_article(요약),
+create_news_pdf(PDF 렌더링), send_bulk_email(발송)을 기사 수를 늘려가며 측정한다.
+단계별 처리량, p50/p95 지연, 최대 메모리를 출력하고 JSON으로 저장하여 실행 간 회귀를 비교한다.
+
+사용법:
+    python benchmarks/bench_pipeline.py [--counts 10 100 500] [--latency-ms 20] [--jitter-ms 30]
+        [--error-rate 0.02] [--slow-rate 0.05 --slow-ms 5000] [--workers 4]
+        [--output results.json] [--compare baseline.json]
+
+Note:
+    - 지연 항목: fetch_news는 목록 요청 한 번, fetch_article/summarize는 기사 하나,
+      create_pdf는 렌더링 한 번, send_email은 수신자 한 명(연결과 발송 포함) 기준
+    - 메모리 항목: peak_heap_kb는 tracemalloc으로 단계를 한 번 더 실행하여 측정한 Python 힙 최대값,
+      rss_mb는 단계 종료 시점의 프로세스 최대 RSS (누적)
+    - 목록 파싱은 합성 제목끼리 합쳐지지 않도록 제목 유사 중복 제거 없이 측정
+    - --error-rate로 주입한 오류는 공유 세션의 재시도(BRIEFY_HTTP_RETRIES, BRIEFY_HTTP_BACKOFF)로 처리됨
+    - --slow-rate로 주입한 긴 지연은 중복 요청(BRIEFY_HEDGE)으로 처리됨 (fetch_article의 hedged/hedge_wins)
+    - PDF 단계는 --fonts 디렉토리에 malgun.ttf, malgunbd.ttf가 없으면 건너뜀
+"""
+import os
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.servers import FixtureHTTPServer, SMTPSink  # noqa: E402
+from modules.abstractive import peak_rss_mb  # noqa: E402
+
+DEFAULT_OUTPUT_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+def percentile(values, q):
+    """최근접 순위 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+def timed_calls(func, items, workers=1):
+    """items 각각에 func를 호출하고 (결과 목록, 호출별 시간 목록, 전체 시간)을 반환"""
+    def call(item):
+        start = time.perf_counter()
+        result = func(item)
+        return result, time.perf_counter() - start
+
+    start = time.perf_counter()
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outputs = list(executor.map(call, items))
+    else:
+        outputs = [call(item) for item in items]
+    elapsed = time.perf_counter() - start
+    return [result for result, _ in outputs], [seconds for _, seconds in outputs], elapsed
+
+def measure_stage(func, items, units, workers=1, memory=True):
+    """
+    단계 하나를 측정하는 함수
+
+    Args:
+        func: 항목 하나를 처리하는 함수
+        items: 처리할 항목 목록
+        units (int): 처리량 계산에 사용할 단위 수 (예: 기사 수)
+        workers (int): 동시 호출 수
+        memory (bool): tracemalloc 측정 실행 여부
+
+    Returns:
+        (결과 목록, 단계 통계 딕셔너리)
+    """
+    results, latencies, elapsed = timed_calls(func, items, workers)
+    stats = {
+        "items": len(items),
+        "units": units,
+        "seconds": round(elapsed, 4),
+        "throughput_per_s": round(units / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+    }
+    if memory:
+        tracemalloc.start()
+        timed_calls(func, items, workers)
+        stats["peak_heap_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+    stats["rss_mb"] = round(peak_rss_mb(), 1)
+    return results, stats
+
+def run_pipeline(count, args):
+    """기사 count개로 전 단계를 한 번 측정"""
+    from modules.fetch_news import fetch_news
+    from modules.fetch_article import fetch_article
+    from modules.summarize import summarize_article
+    from modules.article import Article
+    from modules.create_pdf import create_news_pdf
+    from modules.send_email import send_bulk_email
+    from modules import metrics
+
+    stages = {}
+    with FixtureHTTPServer(count, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                           error_rate=args.error_rate, seed=args.seed,
+                           slow_rate=args.slow_rate, slow_ms=args.slow_ms) as server:
+        listings, stages["fetch_news"] = measure_stage(
+            lambda _: fetch_news(limit=count, dedup_threshold=None, sections=server.sections, base_url=server.base_url),
+            range(args.repeat), units=count * args.repeat, memory=args.memory
+        )
+        articles = listings[0]
+        requests_before, errors_before = server.requests, server.errors
+
+        with metrics.run("bench", output_dir="") as metrics_run:
+            contents, stages["fetch_article"] = measure_stage(
+                lambda article: fetch_article(article.link, use_cache=False),
+                articles, units=len(articles), workers=args.workers, memory=args.memory
+            )
+        stages["fetch_article"]["failures"] = sum(1 for content in contents if not content)
+        stages["fetch_article"]["server_requests"] = server.requests - requests_before
+        stages["fetch_article"]["injected_errors"] = server.errors - errors_before
+        stages["fetch_article"]["hedged"] = metrics_run.counters.get("http_hedges", 0)
+        stages["fetch_article"]["hedge_wins"] = metrics_run.counters.get("http_hedge_wins", 0)
+
+    texts = [content for content in contents if content]
+    summaries, stages["summarize"] = measure_stage(
+        lambda text: summarize_article(text, use_cache=False),
+        texts, units=len(texts), memory=args.memory
+    )
+    stages["summarize"]["failures"] = sum(1 for summary in summaries if not summary)
+
+    digest = [
+        Article(article.title, article.link, article.press, article.category, article.timestamp,
+                summary or text[:200])
+        for article, text, summary in zip(articles, texts, summaries)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = None
+        if os.path.exists(os.path.join(args.fonts, "malgun.ttf")):
+            cwd = os.getcwd()
+            os.symlink(os.path.abspath(args.fonts), os.path.join(tmp, "fonts"))
+            os.chdir(tmp)
+            try:
+                paths, stages["create_pdf"] = measure_stage(
+                    lambda _: create_news_pdf(digest, "bench"),
+                    range(args.repeat), units=len(digest) * args.repeat, memory=args.memory
+                )
+                pdf_path = os.path.abspath(paths[0])
+                stages["create_pdf"]["bytes"] = os.path.getsize(pdf_path)
+            finally:
+                os.chdir(cwd)
+        else:
+            print(f"폰트가 없어 PDF 단계를 건너뜁니다: {args.fonts}", file=sys.stderr)
+
+        with SMTPSink() as sink:
+            def send(recipients):
+                results = send_bulk_email(recipients, "bench", "벤치마크 메일", pdf_path,
+                                          pool_size=args.workers, rate=0, retries=0,
+                                          host=sink.host, port=sink.port, use_ssl=False)
+                return sum(1 for result in results.values() if result["ok"])
+
+            # 지연: 수신자 한 명씩 (연결 포함), 처리량: 한 번에 여러 수신자
+            _, stages["send_email"] = measure_stage(
+                send, [[f"user{idx}@example.com"] for idx in range(args.repeat)],
+                units=args.repeat, memory=args.memory
+            )
+            recipients = [f"user{idx}@example.com" for idx in range(args.recipients)]
+            start = time.perf_counter()
+            sent = send(recipients)
+            elapsed = time.perf_counter() - start
+            stages["send_email"].update({
+                "bulk_recipients": len(recipients),
+                "bulk_sent": sent,
+                "throughput_per_s": round(sent / elapsed, 2),
+                "message_bytes": sink.bytes // max(sink.messages, 1)
+            })
+
+    return {"count": count, "stages": stages}
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(baseline_path, report, tolerance):
+    """
+    이전 결과와 p50 지연 및 처리량을 비교하여 회귀 항목 수를 반환
+
+    Note:
+        - p50이 tolerance 비율보다 느려졌거나 처리량이 tolerance 비율보다 줄어들면 회귀로 판정
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {run["count"]: run["stages"] for run in json.load(f)["runs"]}
+
+    regressions = 0
+    print(f"\n기준 결과와 비교: {baseline_path} (허용 {tolerance:.0%})")
+    print(f"{'articles':>8} {'stage':<14}{'p50 ms':>18}{'throughput/s':>22}")
+    for run in report["runs"]:
+        for stage, stats in run["stages"].items():
+            old = baseline.get(run["count"], {}).get(stage)
+            if not old:
+                continue
+            p50_change = (stats["p50_ms"] - old["p50_ms"]) / old["p50_ms"] if old["p50_ms"] else 0.0
+            old_rate, new_rate = old.get("throughput_per_s") or 0, stats.get("throughput_per_s") or 0
+            rate_change = (new_rate - old_rate) / old_rate if old_rate else 0.0
+            regressed = p50_change > tolerance or rate_change < -tolerance
+            regressions += regressed
+            print(f"{run['count']:>8} {stage:<14}{stats['p50_ms']:>10.2f} ({p50_change:+6.1%})"
+                  f"{new_rate:>13.1f} ({rate_change:+6.1%}){'  회귀' if regressed else ''}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 전 단계 파이프라인 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 500], help="기사 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="HTTP 응답 지연 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=30.0, help="HTTP 응답 지연 무작위 추가분 최대값")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답(503) 주입 확률")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="긴 지연 응답 주입 확률")
+    parser.add_argument("--slow-ms", type=float, default=5000.0, help="긴 지연 응답에 더할 지연 (밀리초)")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("BRIEFY_MAX_WORKERS", "4")),
+                        help="기사 수집 동시 요청 수와 SMTP 연결 수")
+    parser.add_argument("--repeat", type=int, default=5, help="목록 파싱/PDF/단건 발송 반복 횟수")
+    parser.add_argument("--recipients", type=int, default=50, help="대량 발송 수신자 수")
+    parser.add_argument("--fonts", default=os.path.join(ROOT, "fonts"), help="PDF 폰트 디렉토리")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="tracemalloc 측정 생략")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/pipeline_{시각}.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="회귀 판정 허용 비율")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    # 로컬 SMTP 서버는 인증을 지원하지 않으므로 로그인하지 않도록 비밀번호 제거
+    # (send_email 임포트 시 .env를 불러오므로 임포트 후 제거)
+    import modules.send_email  # noqa: F401
+    os.environ["EMAIL_USERNAME"] = "bench@example.com"
+    os.environ.pop("EMAIL_PASSWORD", None)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "runs": []
+    }
+
+    print(f"{'articles':>8} {'stage':<14}{'items':>7}{'seconds':>9}{'per sec':>10}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'heap KB':>10}{'RSS MB':>8}")
+    for count in args.counts:
+        run = run_pipeline(count, args)
+        report["runs"].append(run)
+        for stage, stats in run["stages"].items():
+            print(f"{count:>8} {stage:<14}{stats['items']:>7}{stats['seconds']:>9.2f}"
+                  f"{stats['throughput_per_s'] or 0:>10.1f}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+                  f"{stats.get('peak_heap_kb', 0):>10}{stats['rss_mb']:>8.0f}")
+
+    output = args.output or os.path.join(
+        DEFAULT_OUTPUT_DIR, f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+
+    if args.compare:
+        return 1 if compare(args.compare, report, args.tolerance) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
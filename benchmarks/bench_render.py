@@ -0,0 +1,109 @@
+"""
+다이제스트 형식별 렌더링/메시지 크기 벤치마크
+
+합성 기사(요약 포함)로 기사 수를 늘려가며
+1) PDF(NewsPDF, 폰트 서브셋 포함)와 HTML(Jinja2, CSS 인라인 템플릿) 렌더링 시간,
+2) HTML 템플릿 준비(premailer 인라인 + 컴파일) 한 번의 시간과, 메시지마다 premailer를 실행하는 방식의 렌더링 시간,
+3) pdf(첨부), html(본문), both(본문 + 첨부) 형식의 MIME 인코딩된 메시지 크기
+를 측정한다.
+
+사용법:
+    python benchmarks/bench_render.py [--counts 10 50 200] [--repeat 5]
+
+Note:
+    - PDF 렌더링은 --fonts 디렉토리에 malgun.ttf, malgunbd.ttf가 없으면 건너뜀
+    - 메시지 크기는 SMTP로 전송되는 바이트 (To 헤더 제외, base64 인코딩 포함)
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_subscribers import make_articles  # noqa: E402
+
+def best_of(repeat, func):
+    """repeat번 실행한 최소 시간 (초)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="다이제스트 형식별 렌더링/메시지 크기 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 50, 200], help="다이제스트 기사 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--fonts", default=os.path.join(ROOT, "fonts"), help="PDF 폰트 디렉토리")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    from premailer import Premailer
+    from modules import create_html
+    from modules.renderers import FORMATS, get_renderer
+    from modules.send_email import build_message
+
+    start = time.perf_counter()
+    create_html._load_template()
+    print(f"HTML 템플릿 준비 (프로세스당 한 번): {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    fonts = os.path.exists(os.path.join(args.fonts, "malgun.ttf"))
+    if not fonts:
+        print(f"폰트가 없어 PDF 렌더링을 건너뜁니다: {args.fonts}", file=sys.stderr)
+    formats = [name for name in FORMATS if fonts or "pdf" not in FORMATS[name]]
+
+    rng = random.Random(42)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        if fonts:
+            os.symlink(os.path.abspath(args.fonts), os.path.join(tmp, "fonts"))
+        os.chdir(tmp)
+        try:
+            print(f"\n{'articles':>8} {'html ms':>8} {'premailer ms':>13} {'pdf ms':>8} " +
+                  " ".join(f"{name + ' KB':>9}" for name in formats))
+            for count in args.counts:
+                articles = make_articles(count, rng)
+                html = get_renderer("html")
+                html_path = html.filename("bench")
+                html_seconds = best_of(args.repeat, lambda: html.render(articles, "bench", html_path))
+
+                # 비교 기준: 메시지마다 premailer로 CSS를 인라인 (템플릿 원문을 매번 렌더링 후 변환)
+                with open(os.path.join(create_html.TEMPLATE_DIR, create_html.TEMPLATE_NAME), encoding="utf-8") as f:
+                    source = create_html._load_template().environment.from_string(f.read())
+                premailer_seconds = best_of(args.repeat, lambda: Premailer(
+                    source.render(date="bench", title="뉴스 요약", articles=articles, skipped=()), keep_style_tags=False,
+                    remove_classes=True, disable_validation=True, allow_network=False,
+                    cssutils_logging_level=logging.CRITICAL).transform())
+
+                pdf_path = None
+                pdf_seconds = None
+                if fonts:
+                    pdf = get_renderer("pdf")
+                    pdf_path = pdf.filename("bench")
+                    pdf_seconds = best_of(args.repeat, lambda: pdf.render(articles, "bench", pdf_path))
+
+                with open(html_path, encoding="utf-8") as f:
+                    body = f.read()
+                sizes = []
+                for name in formats:
+                    names = FORMATS[name]
+                    message = build_message("briefy@example.com", "bench", "텍스트 본문",
+                                            pdf_path if "pdf" in names else None,
+                                            body if "html" in names else None)
+                    sizes.append(len(message) / 1024)
+                print(f"{count:>8} {html_seconds * 1000:>8.2f} {premailer_seconds * 1000:>13.1f} "
+                      f"{pdf_seconds * 1000 if pdf_seconds is not None else float('nan'):>8.1f} " +
+                      " ".join(f"{size:>9.1f}" for size in sizes))
+        finally:
+            os.chdir(cwd)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+문장 분리/필터링 벤치마크
+
+합성 기사 본문 수천 개로 기존 방식(정규식 split 후 문장마다 re.search/startswith, 문장 문자열 복사)과
+modules.sentences(한 번 순회, 원문 위치 반환, 배치 API)의 처리량(기사/초)과 찾은 후보 문장 수를 비교한다.
+문장 사이 공백이 있는 본문과 get_text(strip=True) 결과처럼 붙어 있는 본문("했다.이번")을 모두 측정한다.
+측정 전에 문장 경계 사례(소수점, 영문 약어, 인용문, 붙어 있는 문장)의 분리 결과를 확인한다.
+
+사용법:
+    python benchmarks/bench_sentences.py [--count 3000] [--repeat 5]
+
+Note:
+    - 분리 사례가 기대와 다르면 종료 코드 1
+"""
+import os
+import re
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import synthetic_articles  # noqa: E402
+from modules.sentences import candidate_spans, candidate_spans_batch, sentence_spans  # noqa: E402
+
+# (본문, 기대하는 문장 목록)
+SENTENCE_CASES = [
+    ("금리가 3.5%로 올랐다. 시장은 안정적이다.", ["금리가 3.5%로 올랐다.", "시장은 안정적이다."]),
+    ("이번 조치는 U.S. 정부가 했다. 반응은 엇갈렸다.", ["이번 조치는 U.S. 정부가 했다.", "반응은 엇갈렸다."]),
+    ("미국(U.S.) 정부가 발표했다. Mr. Kim이 답했다.", ["미국(U.S.) 정부가 발표했다.", "Mr. Kim이 답했다."]),
+    ("회의가 끝났다.이번 결정은 example.com에 공개됐다.", ["회의가 끝났다.", "이번 결정은 example.com에 공개됐다."]),
+    ('그는 "내일 발표한다."라고 말했다. 다음 일정은 미정이다.', ['그는 "내일 발표한다."라고 말했다.', "다음 일정은 미정이다."]),
+    ("새 모델 이름은 AI. 출시는 내년이다.", ["새 모델 이름은 AI.", "출시는 내년이다."]),
+]
+
+def legacy_split(text):
+    """이전 split_sentences 구현 (비교 기준)"""
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    filtered_sentences = []
+    for s in sentences:
+        s = s.strip()
+        if (30 <= len(s) <= 200 and
+            not re.search(r'(제공|특파원|기자|저작권|구독|뉴스|기사|전재)', s) and
+            not s.startswith(('▶', '■', '※', '☞', '#', '@'))):
+            filtered_sentences.append(s)
+    return filtered_sentences
+
+def best_of(repeat, func):
+    """repeat번 실행한 (최소 시간, 마지막 결과)"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def check_sentences():
+    """문장 분리 사례를 확인하고 기대와 다른 사례 수를 반환"""
+    failures = 0
+    for text, expected in SENTENCE_CASES:
+        sentences = [text[start:end] for start, end in sentence_spans(text)]
+        if sentences != expected:
+            failures += 1
+            print(f"[실패] {text!r}\n  결과: {sentences}\n  기대: {expected}")
+    print(f"문장 분리 사례 {len(SENTENCE_CASES) - failures}/{len(SENTENCE_CASES)}개 통과\n")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="문장 분리/필터링 벤치마크")
+    parser.add_argument("--count", type=int, default=3000, help="기사 본문 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    failures = check_sentences()
+    print(f"{'body':>8} {'method':>8} {'articles/s':>11} {'sentences':>10} {'usable':>7}")
+    for spaced in (True, False):
+        texts = synthetic_articles(args.count, spaced=spaced)
+        methods = [
+            ("legacy", lambda: [legacy_split(text) for text in texts]),
+            ("spans", lambda: [candidate_spans(text) for text in texts]),
+            ("batch", lambda: candidate_spans_batch(texts)),
+        ]
+        for name, func in methods:
+            elapsed, results = best_of(args.repeat, func)
+            sentences = sum(len(result) for result in results)
+            # 요약할 수 있는 기사 (후보 문장 2개 이상)
+            usable = sum(1 for result in results if len(result) >= 2)
+            print(f"{'spaced' if spaced else 'joined':>8} {name:>8} {len(texts) / elapsed:>11.0f} "
+                  f"{sentences:>10} {usable:>7}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
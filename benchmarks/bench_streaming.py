@@ -0,0 +1,161 @@
+"""
+단계별 실행과 스트리밍 파이프라인의 전체 소요 시간 비교 벤치마크
+
+로컬 HTTP 서버(응답 지연 주입)에서 목록 해석, 본문 수집, 요약, PDF 렌더링을
+1) 단계마다 모든 기사를 처리한 뒤 다음 단계로 넘어가는 방식(batch)과
+2) 단계를 크기가 제한된 큐로 연결해 겹쳐 실행하는 방식(stream, modules.pipeline)으로 실행하여
+전체 소요 시간을 비교한다. batch 방식의 단계별 시간 합계와 가장 느린 단계 시간도 함께 출력한다.
+
+사용법:
+    python benchmarks/bench_streaming.py [--counts 10 50 200] [--latency-ms 100] [--jitter-ms 50]
+        [--fetch-workers 4] [--summarize-workers 1] [--queue 8] [--repeat 3]
+
+Note:
+    - 요약에 실패한 기사는 bench_pipeline.py와 같이 본문 앞 200자를 요약으로 사용
+    - PDF 단계는 --fonts 디렉토리에 malgun.ttf, malgunbd.ttf가 없으면 건너뜀
+    - 캐시 영향을 없애기 위해 기사 캐시와 요약 캐시를 사용하지 않음
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.servers import FixtureHTTPServer  # noqa: E402
+
+def make_steps(args):
+    """두 방식이 공유하는 기사 단위 처리 함수"""
+    from modules.fetch_article import fetch_article
+    from modules.summarize import summarize_article
+
+    def fetch(article):
+        content = fetch_article(article.link, use_cache=False)
+        return (article, content) if content else None
+
+    def summarize(item):
+        article, content = item
+        article.summary = summarize_article(content, use_cache=False) or content[:200]
+        return article
+
+    return fetch, summarize
+
+def render(records, path, fonts):
+    """PDF를 렌더링하고 기사 수를 반환 (폰트가 없으면 기사만 소비)"""
+    from modules.create_pdf import stream_news_pdf
+
+    if not fonts:
+        return sum(1 for _ in records)
+    count = 0
+
+    def counted():
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    stream_news_pdf(counted(), "bench", path)
+    return count
+
+def run_batch(server, count, args, path, fonts):
+    """단계별 실행 (각 단계 시간과 전체 시간)"""
+    from modules.fetch_news import fetch_news
+
+    fetch, summarize = make_steps(args)
+    stages = {}
+    start = time.perf_counter()
+
+    begin = time.perf_counter()
+    articles = fetch_news(limit=count, dedup_threshold=None, sections=server.sections, base_url=server.base_url)
+    stages["fetch_news"] = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.fetch_workers) as executor:
+        items = [item for item in executor.map(fetch, articles) if item]
+    stages["fetch_article"] = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.summarize_workers) as executor:
+        records = list(executor.map(summarize, items))
+    stages["summarize"] = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    rendered = render(iter(records), path, fonts)
+    stages["render"] = time.perf_counter() - begin
+
+    return time.perf_counter() - start, stages, rendered
+
+def run_stream(server, count, args, path, fonts):
+    """스트리밍 실행 (전체 시간과 첫 기사가 렌더링 단계에 도착한 시간)"""
+    from modules.fetch_news import iter_news
+    from modules.pipeline import Pipeline, Stage
+
+    fetch, summarize = make_steps(args)
+    start = time.perf_counter()
+    first = None
+
+    def records():
+        nonlocal first
+        pipeline = Pipeline(
+            iter_news(limit=count, dedup_threshold=None, sections=server.sections, base_url=server.base_url),
+            [Stage("fetch", fetch, workers=args.fetch_workers),
+             Stage("summarize", summarize, workers=args.summarize_workers)],
+            queue_size=args.queue
+        )
+        for record in pipeline:
+            if first is None:
+                first = time.perf_counter() - start
+            yield record
+
+    rendered = render(records(), path, fonts)
+    return time.perf_counter() - start, first or 0.0, rendered
+
+def main():
+    parser = argparse.ArgumentParser(description="단계별 실행과 스트리밍 파이프라인 비교 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 50, 200], help="기사 수")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="HTTP 응답 지연 (밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=50.0, help="HTTP 응답 지연 무작위 추가분 최대값")
+    parser.add_argument("--fetch-workers", type=int, default=4, help="본문 수집 스레드 수")
+    parser.add_argument("--summarize-workers", type=int, default=1, help="요약 스레드 수")
+    parser.add_argument("--queue", type=int, default=8, help="단계 사이 큐 크기")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--fonts", default=os.path.join(ROOT, "fonts"), help="PDF 폰트 디렉토리")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    fonts = os.path.exists(os.path.join(args.fonts, "malgun.ttf"))
+    if not fonts:
+        print(f"폰트가 없어 PDF 렌더링 없이 측정합니다: {args.fonts}", file=sys.stderr)
+
+    print(f"{'articles':>8} {'batch s':>9} {'stage sum':>10} {'slowest':>18} {'stream s':>9} "
+          f"{'first s':>8} {'speedup':>8}")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        if fonts:
+            os.symlink(os.path.abspath(args.fonts), os.path.join(tmp, "fonts"))
+        os.chdir(tmp)
+        try:
+            for count in args.counts:
+                batch, stream = None, None
+                with FixtureHTTPServer(count, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms) as server:
+                    for _ in range(args.repeat):
+                        result = run_batch(server, count, args, "batch.pdf", fonts)
+                        batch = result if batch is None or result[0] < batch[0] else batch
+                        result = run_stream(server, count, args, "stream.pdf", fonts)
+                        stream = result if stream is None or result[0] < stream[0] else stream
+
+                total, stages, _ = batch
+                slowest = max(stages, key=stages.get)
+                print(f"{count:>8} {total:>9.2f} {sum(stages.values()):>10.2f} "
+                      f"{slowest:>12} {stages[slowest]:>5.2f} {stream[0]:>9.2f} {stream[1]:>8.2f} "
+                      f"{total / stream[0]:>7.2f}x")
+        finally:
+            os.chdir(cwd)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+구독자별 다이제스트 선택/렌더링 벤치마크
+
+합성 기사(요약 포함)와 관심사가 무작위인 구독자 수천 명으로
+1) 역색인 생성과 구독자별 기사 선택(ArticleIndex.group) 시간과 서로 다른 다이제스트 수,
+2) 다이제스트 PDF를 현재 프로세스에서 순서대로 렌더링할 때와 프로세스 풀에서 렌더링할 때의 시간
+을 측정한다. 구독자 한 명당 선택 비용(마이크로초)도 함께 출력한다.
+
+사용법:
+    python benchmarks/bench_subscribers.py [--articles 50] [--subscribers 1000 10000]
+        [--keywords 200] [--render-workers 4] [--render-limit 40]
+
+Note:
+    - PDF 렌더링은 --fonts 디렉토리에 malgun.ttf, malgunbd.ttf가 없으면 건너뜀
+    - 렌더링은 다이제스트 중 앞의 --render-limit개만 측정 (순서대로 렌더링 시간이 길어지지 않도록)
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpus import synthetic_article, synthetic_sentence  # noqa: E402
+
+PRESS = ["연합뉴스", "뉴시스", "KBS", "MBC", "SBS", "조선일보", "중앙일보", "한겨레", "경향신문", "매일경제"]
+SECTIONS = ["100", "101", "102", "103", "104", "105"]
+
+def make_articles(count, rng):
+    from modules.article import Article
+    from modules.fetch_news import SECTION_NAMES
+
+    articles = []
+    for idx in range(count):
+        articles.append(Article(
+            title=synthetic_sentence(rng),
+            summary=synthetic_article(rng, min_sentences=3, max_sentences=3),
+            link=f"https://n.news.naver.com/mnews/article/001/{idx:010d}",
+            press=rng.choice(PRESS),
+            category=SECTION_NAMES[rng.choice(SECTIONS)],
+            timestamp="2025-01-01 08:00:00",
+            alternates=[{"press": rng.choice(PRESS), "link": f"https://example.com/{idx}"}]
+            if rng.random() < 0.2 else [],
+        ))
+    return articles
+
+def make_subscribers(count, vocabulary, rng):
+    from modules.subscribers import Subscriber
+
+    subscribers = []
+    for idx in range(count):
+        subscribers.append(Subscriber(
+            f"user{idx}@example.com",
+            keywords=rng.sample(vocabulary, rng.randint(0, 5)),
+            sections=rng.sample(SECTIONS, rng.randint(0, 2)),
+            press=rng.sample(PRESS, rng.randint(0, 1)),
+            limit=rng.choice([5, 10]),
+        ))
+    return subscribers
+
+def main():
+    parser = argparse.ArgumentParser(description="구독자별 다이제스트 선택/렌더링 벤치마크")
+    parser.add_argument("--articles", type=int, default=50, help="이번 실행에서 요약한 기사 수")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1000, 10000], help="구독자 수")
+    parser.add_argument("--keywords", type=int, default=200, help="구독자 키워드 어휘 크기")
+    parser.add_argument("--render-workers", type=int, default=4, help="렌더링 프로세스 수")
+    parser.add_argument("--render-limit", type=int, default=40, help="렌더링을 측정할 다이제스트 수")
+    parser.add_argument("--fonts", default=os.path.join(ROOT, "fonts"), help="PDF 폰트 디렉토리")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    from modules.subscribers import ArticleIndex
+
+    rng = random.Random(42)
+    articles = make_articles(args.articles, rng)
+    words = sorted({word for article in articles for word in article.title.split() if len(word) >= 2})
+    vocabulary = rng.sample(words, min(args.keywords, len(words)))
+
+    print(f"기사 {len(articles)}개, 키워드 어휘 {len(vocabulary)}개")
+    print(f"{'subscribers':>11} {'select s':>9} {'us/sub':>7} {'variants':>9} {'empty':>6}")
+    groups = {}
+    for count in args.subscribers:
+        subscribers = make_subscribers(count, vocabulary, rng)
+        start = time.perf_counter()
+        keywords = set().union(*(subscriber.keywords for subscriber in subscribers))
+        groups = ArticleIndex(articles, keywords).group(subscribers)
+        elapsed = time.perf_counter() - start
+        empty = len(groups.pop((), []))
+        print(f"{count:>11} {elapsed:>9.3f} {elapsed / count * 1e6:>7.1f} {len(groups):>9} {empty:>6}")
+
+    if not os.path.exists(os.path.join(args.fonts, "malgun.ttf")):
+        print(f"폰트가 없어 PDF 렌더링을 건너뜁니다: {args.fonts}", file=sys.stderr)
+        return 0
+
+    from modules.create_pdf import create_news_pdfs
+
+    selections = list(groups)[:args.render_limit]
+    print(f"\n다이제스트 {len(selections)}개 렌더링")
+    print(f"{'workers':>7} {'seconds':>8} {'pdf/s':>7}")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.symlink(os.path.abspath(args.fonts), os.path.join(tmp, "fonts"))
+        os.chdir(tmp)
+        try:
+            for workers in sorted({1, args.render_workers}):
+                files = {f"digest_{workers}_{number}.pdf": selection for number, selection in enumerate(selections)}
+                start = time.perf_counter()
+                created = create_news_pdfs(articles, files, "bench", workers=workers)
+                elapsed = time.perf_counter() - start
+                print(f"{workers:>7} {elapsed:>8.2f} {sum(created.values()) / elapsed:>7.1f}")
+        finally:
+            os.chdir(cwd)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
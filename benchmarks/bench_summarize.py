@@ -0,0 +1,51 @@
+"""
+요약 엔진 처리량 벤치마크
+
+같은 합성 기사 묶음으로 요약 엔진별 처리량(기사/초)과 최대 RSS를 측정한다.
+
+사용법:
+    python benchmarks/bench_summarize.py [--count N] [--engine extractive|textrank|abstractive]
+
+Note:
+    - 최대 RSS는 프로세스 단위이므로 엔진별로 따로 실행하여 비교
+    - abstractive 엔진은 BRIEFY_ABSTRACTIVE_MODEL 디렉토리에 모델이 있어야 함
+    - 캐시 효과를 배제하기 위해 요약 캐시를 사용하지 않음
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import synthetic_articles  # noqa: E402
+from modules.abstractive import peak_rss_mb  # noqa: E402
+from modules.summarize import summarize_article, summarize_articles  # noqa: E402
+
+def main():
+    parser = argparse.ArgumentParser(description="요약 엔진 처리량 벤치마크")
+    parser.add_argument("--count", type=int, default=200, help="요약할 기사 수")
+    parser.add_argument("--engine", choices=["extractive", "textrank", "abstractive"], default="textrank")
+    args = parser.parse_args()
+
+    texts = synthetic_articles(args.count)
+    baseline_rss = peak_rss_mb()
+
+    start = time.perf_counter()
+    if args.engine == "extractive":
+        summaries = [summarize_article(text, use_cache=False) for text in texts]
+    else:
+        # 모델/라이브러리 로딩 시간은 처리량에서 제외
+        summarize_articles(texts[:1], use_cache=False, engine=args.engine)
+        start = time.perf_counter()
+        summaries = summarize_articles(texts, use_cache=False, engine=args.engine)
+    elapsed = time.perf_counter() - start
+
+    done = sum(1 for summary in summaries if summary)
+    print(f"엔진: {args.engine}")
+    print(f"기사 {len(texts)}개 중 {done}개 요약, {elapsed:.3f}초 ({len(texts) / elapsed:.1f}개/초)")
+    print(f"최대 RSS: {peak_rss_mb():.0f}MB (시작 시 {baseline_rss:.0f}MB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+CLI 시작 시간(임포트 시간) 검사
+
+`python -X importtime main.py run --dry-run`을 실행하여 main.py가 추가로 임포트하는 모듈의
+임포트 시간 합계를 예산과 비교하고, 무거운 의존성(bs4, requests, fpdf 등)을 불러오면 실패로 처리한다.
+GitHub Actions나 cron의 짧은 명령이 쓰지 않는 라이브러리를 임포트하는 회귀를 잡기 위해 사용한다.
+
+사용법:
+    python benchmarks/check_import_time.py [--budget-ms 150] [--top 10] [--repeat 3] [-- run --dry-run]
+
+Note:
+    - 인터프리터 시작(site, .pth 파일 등)에서 임포트되는 모듈은 `python -X importtime -c pass`로
+      측정하여 제외
+    - 임포트 시간은 각 모듈 자체 시간(self)의 합계이며, 흔들림을 줄이기 위해 --repeat 회 중 최소값 사용
+    - 측정한 명령이 예외로 끝나거나(Traceback) 종료 코드가 0, 1이 아니면 실패로 처리
+      (일찍 중단된 실행은 모듈을 덜 임포트하므로 통과로 잘못 판정하지 않도록)
+    - 위반이 있으면 종료 코드 1
+"""
+import os
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 짧은 명령에서 임포트하면 안 되는 무거운 모듈 (최상위 패키지 이름)
+FORBIDDEN = ["bs4", "lxml", "requests", "urllib3", "fpdf", "yagmail", "numpy", "scipy", "sklearn",
+             "torch", "transformers"]
+
+# 측정한 명령의 정상 종료 코드 (run --dry-run은 설정이 없으면 1을 반환)
+OK_CODES = (0, 1)
+
+def import_times(args, env=None):
+    """
+    -X importtime 출력을 파싱하여 모듈별 자체 임포트 시간(마이크로초)을 반환하는 함수
+
+    Args:
+        args (list): python 뒤에 붙일 인자 목록
+        env (dict): 환경 변수
+
+    Returns:
+        dict: {모듈 이름: 자체 임포트 시간}
+
+    Raises:
+        RuntimeError: 명령이 예외로 끝났거나 종료 코드가 OK_CODES에 없는 경우 (명령의 출력 포함)
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime"] + args, cwd=ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    times = {}
+    output = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            output.append(line)
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[0])
+
+    if result.returncode not in OK_CODES or any(line.startswith("Traceback (most recent call last)")
+                                                for line in output):
+        tail = "\n".join((result.stdout.splitlines() + output)[-20:])
+        raise RuntimeError(f"python {' '.join(args)} 실행 실패 (종료 코드 {result.returncode})\n{tail}")
+    return times
+
+def measure(command, repeat):
+    """
+    명령을 repeat회 실행하여 인터프리터 시작 이후 임포트된 모듈과 시간 합계를 측정하는 함수
+
+    Returns:
+        tuple: (모듈별 자체 시간 딕셔너리, 합계 밀리초) - 합계가 가장 작은 실행 기준
+    """
+    # 예약 작업 설정이나 .env 없이도 같은 경로로 실행되도록 현재 환경 그대로 사용
+    env = dict(os.environ)
+    baseline = set(import_times(["-c", "pass"], env))
+    best = None
+    for _ in range(repeat):
+        times = {name: us for name, us in import_times(["main.py"] + command, env).items() if name not in baseline}
+        total = sum(times.values()) / 1000
+        if best is None or total < best[1]:
+            best = (times, total)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI 시작 시간(임포트 시간) 검사")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("BRIEFY_IMPORT_BUDGET_MS", "150")),
+                        help="허용하는 임포트 시간 합계 (밀리초, 기본값: BRIEFY_IMPORT_BUDGET_MS 또는 150)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 모듈 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    parser.add_argument("command", nargs="*", default=["run", "--dry-run"],
+                        help="main.py에 전달할 명령 (기본값: run --dry-run)")
+    args = parser.parse_args()
+
+    try:
+        times, total = measure(args.command, args.repeat)
+    except RuntimeError as e:
+        print(f"[실패] {e}")
+        return 1
+    print(f"main.py {' '.join(args.command)}: 모듈 {len(times)}개, 임포트 시간 {total:.1f}ms "
+          f"(예산 {args.budget_ms:.0f}ms)")
+    for name, us in sorted(times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {us / 1000:7.2f}ms  {name}")
+
+    violations = []
+    heavy = sorted(name for name in times if name.split(".")[0] in FORBIDDEN)
+    if heavy:
+        violations.append(f"무거운 모듈 임포트: {', '.join(heavy[:10])}")
+    if total > args.budget_ms:
+        violations.append(f"임포트 시간 예산 초과: {total:.1f}ms > {args.budget_ms:.0f}ms")
+
+    for violation in violations:
+        print(f"[실패] {violation}")
+    if not violations:
+        print("[통과]")
+    return 1 if violations else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
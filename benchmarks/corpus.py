@@ -0,0 +1,54 @@
+"""
+벤치마크용 합성 기사 본문 생성기
+
+실제 네이버 기사와 비슷한 문장 길이, 문장 부호, 기자/저작권 문구를 포함한 본문을 만든다.
+같은 seed는 항상 같은 본문을 생성하므로 실행 간 결과를 비교할 수 있다.
+"""
+import random
+from typing import List
+
+SUBJECTS = ["미국 정부는", "유럽연합 집행위원회는", "중국 상무부는", "일본 총리는", "국제통화기금은",
+            "세계보건기구는", "영국 중앙은행은", "독일 연방정부는", "유엔 안전보장이사회는", "인도 재무부는"]
+OBJECTS = ["공급망 협력 방안을", "새로운 규제안을", "금리 인하 가능성을", "성장률 전망치를",
+           "수출 통제 조치를", "휴전 협상 일정을", "에너지 가격 안정 대책을", "반도체 투자 계획을"]
+VERBS = ["발표했다.", "검토하고 있다고 밝혔다.", "다음 달 논의할 예정이라고 설명했다.",
+         "소폭 하향 조정했다.", "강하게 비판했다.", "단계적으로 시행하겠다고 말했다."]
+CLAUSES = ["이번 주 열린 회의에서", "현지 언론 보도에 따르면", "시장 전문가들의 우려 속에",
+           "지난해 같은 기간과 비교해", "양국 정상회담을 앞두고", ""]
+BOILERPLATE = ["홍길동 특파원 hong@example.com", "ⓒ 연합뉴스, 무단 전재-재배포 금지",
+               "▶ 관련 기사 더 보기", "구독하고 최신 뉴스를 받아보세요."]
+
+def synthetic_sentence(rng: random.Random) -> str:
+    """합성 문장 하나를 생성"""
+    clause = rng.choice(CLAUSES)
+    parts = [clause, rng.choice(SUBJECTS), rng.choice(OBJECTS), rng.choice(VERBS)]
+    if rng.random() < 0.15:
+        parts.insert(2, f'"{rng.choice(OBJECTS)} 재검토할 것"이라며')
+    return " ".join(part for part in parts if part)
+
+def synthetic_article(rng: random.Random, min_sentences: int = 8, max_sentences: int = 40,
+                      spaced: bool = True) -> str:
+    """
+    합성 기사 본문 하나를 생성
+
+    Args:
+        rng (random.Random): 난수 생성기
+        min_sentences (int): 최소 문장 수
+        max_sentences (int): 최대 문장 수
+        spaced (bool): 문장 사이 공백 여부 (False면 get_text(strip=True) 결과처럼 붙여 씀)
+    """
+    sentences = [synthetic_sentence(rng) for _ in range(rng.randint(min_sentences, max_sentences))]
+    sentences.extend(rng.sample(BOILERPLATE, 2))
+    return (" " if spaced else "").join(sentences)
+
+def synthetic_articles(count: int, seed: int = 42, spaced: bool = True) -> List[str]:
+    """
+    합성 기사 본문 목록을 생성
+
+    Args:
+        count (int): 생성할 기사 수
+        seed (int): 난수 seed
+        spaced (bool): 문장 사이 공백 여부
+    """
+    rng = random.Random(seed)
+    return [synthetic_article(rng, spaced=spaced) for _ in range(count)]
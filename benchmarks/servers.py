@@ -0,0 +1,294 @@
+"""
+벤치마크용 로컬 서버
+
+- FixtureHTTPServer: 저장된 네이버 섹션/기사 HTML을 재생하는 HTTP 서버
+  (여러 섹션과 목록 페이지, 응답 지연, 일부 요청의 긴 지연, 오류 응답을 주입할 수 있음)
+- SMTPSink: 받은 메일을 저장하지 않고 개수와 크기만 세는 SMTP 서버
+
+news.naver.com과 Gmail에 접속하지 않고 수집부터 발송까지 전 단계를 측정하기 위해 사용한다.
+"""
+import os
+import sys
+import re
+import glob
+import html
+import json
+import time
+import random
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.corpus import synthetic_article
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SECTION_FIXTURE = os.path.join(FIXTURES, "sections", "section_104.html")
+ARTICLE_FIXTURES = os.path.join(FIXTURES, "articles")
+
+_ITEM_PATTERN = re.compile(r'<li class="sa_item.*?</li>', re.S)
+_BODY_PATTERN = re.compile(r'(<article id="dic_area"[^>]*>).*?(<div class="reporter_area")', re.S)
+_SENTENCE_END = re.compile(r'(?<=다\.) ')
+
+def _listing_items(indices, base_url: str) -> str:
+    """
+    저장된 섹션 페이지의 기사 항목을 반복하여 indices 번호 기사들의 목록 항목 HTML을 만드는 함수
+
+    Note:
+        - 링크는 로컬 서버의 /article/{번호}로 바꾸고, 제목 뒤에 번호를 붙여 서로 다르게 만듦
+    """
+    with open(SECTION_FIXTURE, encoding="utf-8") as f:
+        templates = _ITEM_PATTERN.findall(f.read())
+    items = []
+    for idx in indices:
+        item = re.sub(r'href="[^"]*"', f'href="{base_url}/article/{idx}"', templates[idx % len(templates)])
+        item = item.replace("</strong>", f" ({idx})</strong>", 1)
+        items.append(item)
+    return "\n".join(items)
+
+def _listing_page(indices, base_url: str) -> bytes:
+    """저장된 섹션 페이지의 기사 항목을 indices 번호 기사들로 바꾼 목록 첫 페이지를 만드는 함수"""
+    with open(SECTION_FIXTURE, encoding="utf-8") as f:
+        page = f.read()
+    templates = _ITEM_PATTERN.findall(page)
+    start = page.index(templates[0])
+    end = page.index(templates[-1]) + len(templates[-1])
+    return (page[:start] + _listing_items(indices, base_url) + page[end:]).encode("utf-8")
+
+def _listing_more(indices, base_url: str) -> bytes:
+    """"기사 더보기" 응답과 같이 목록 항목 HTML을 renderedComponent에 담은 JSON을 만드는 함수"""
+    component = f'<ul class="sa_list">\n{_listing_items(indices, base_url)}\n</ul>'
+    return json.dumps({"renderedComponent": {"SECTION_ARTICLE_LIST": component}},
+                      ensure_ascii=False).encode("utf-8")
+
+def _article_pages(count: int, seed: int):
+    """
+    저장된 기사 페이지의 본문을 합성 본문으로 바꿔 기사 count개의 페이지를 만드는 함수
+
+    Note:
+        - 페이지 구조(스크립트, 본문 컨테이너, 기자 정보, 저작권 문구)는 저장된 페이지를 그대로 사용
+        - 본문이 서로 다르므로 유사 중복 제거로 합쳐지지 않음
+    """
+    templates = []
+    for path in sorted(glob.glob(os.path.join(ARTICLE_FIXTURES, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            templates.append(f.read())
+
+    rng = random.Random(seed)
+    pages = []
+    for idx in range(count):
+        body = html.escape(synthetic_article(rng, spaced=True), quote=False)
+        body = _SENTENCE_END.sub("<br><br>\n", body)
+        template = templates[idx % len(templates)]
+        pages.append(_BODY_PATTERN.sub(lambda match: f"{match.group(1)}\n{body}\n{match.group(2)}", template, count=1)
+                     .encode("utf-8"))
+    return pages
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """클라이언트가 응답을 다 받기 전에 연결을 닫는 경우(스트리밍 다운로드)를 오류로 출력하지 않는 서버"""
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+class FixtureHTTPServer:
+    """
+    저장된 네이버 HTML을 재생하는 로컬 HTTP 서버
+
+    경로:
+        /section/{섹션}: 섹션 목록 첫 페이지
+        /section/template/SECTION_ARTICLE_LIST?sid={섹션}&pageNo={페이지}: 다음 목록 페이지 (JSON)
+        /article/{번호}: 기사 페이지
+
+    기사 count개는 섹션에 번갈아 나누고(0번은 첫 섹션, 1번은 둘째 섹션, ...),
+    섹션마다 page_size개씩 목록 페이지로 나눈다.
+    """
+
+    def __init__(self, count: int, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: int = 42,
+                 slow_rate: float = 0.0, slow_ms: float = 0.0, sections=("104",), page_size: int = 0):
+        """
+        Args:
+            count (int): 목록과 기사 페이지 수
+            latency_ms (float): 모든 응답에 더할 지연 (밀리초)
+            jitter_ms (float): 지연에 더할 균등 분포 무작위 지연의 최대값 (밀리초)
+            error_rate (float): error_status로 응답할 확률 (0~1, 재시도 동작 측정용)
+            error_status (int): 주입할 오류 응답 상태 코드
+            seed (int): 본문 생성과 지연/오류 주입에 사용할 seed
+            slow_rate (float): slow_ms만큼 더 늦게 응답할 확률 (0~1, 꼬리 지연/중복 요청 측정용)
+            slow_ms (float): 느린 응답에 더할 지연 (밀리초)
+            sections (Sequence[str]): 섹션 번호 목록
+            page_size (int): 목록 페이지 하나의 기사 수 (0이면 섹션의 모든 기사를 첫 페이지에 표시)
+        """
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.slow_rate = slow_rate
+        self.slow = slow_ms / 1000
+        self.slow_responses = 0
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self.connections = 0
+        self.listing_requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._server = _QuietHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self.sections = list(sections)
+        self.section_url = f"{self.base_url}/section/{self.sections[0]}"
+        self.article_urls = [f"{self.base_url}/article/{idx}" for idx in range(count)]
+        self._pages = {}
+        for position, sid in enumerate(self.sections):
+            indices = list(range(position, count, len(self.sections)))
+            size = page_size or max(len(indices), 1)
+            chunks = [indices[start:start + size] for start in range(0, len(indices), size)] or [[]]
+            self._pages[sid] = [_listing_page(chunks[0], self.base_url)] + \
+                [_listing_more(chunk, self.base_url) for chunk in chunks[1:]]
+        self._articles = _article_pages(count, seed)
+        self._thread = None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                delay, fail = server._next_response()
+                if delay:
+                    time.sleep(delay)
+                url = urlparse(self.path)
+                if fail:
+                    self._send(server.error_status, b"injected error")
+                elif url.path.startswith("/section/"):
+                    self._listing(url)
+                elif self.path.startswith("/article/"):
+                    try:
+                        self._send(200, server._articles[int(self.path.rsplit("/", 1)[1])])
+                    except (ValueError, IndexError):
+                        self._send(404, b"not found")
+                else:
+                    self._send(404, b"not found")
+
+            def _listing(self, url):
+                with server._lock:
+                    server.listing_requests += 1
+                if url.path == "/section/template/SECTION_ARTICLE_LIST":
+                    query = parse_qs(url.query)
+                    sid = query.get("sid", [""])[0]
+                    page = int(query.get("pageNo", ["1"])[0])
+                else:
+                    sid, page = url.path.rsplit("/", 1)[1], 1
+                pages = server._pages.get(sid)
+                if pages is None:
+                    self._send(404, b"not found")
+                elif page <= 1:
+                    self._send(200, pages[0])
+                elif page <= len(pages):
+                    self._send(200, pages[page - 1], "application/json; charset=utf-8")
+                else:
+                    self._send(200, _listing_more([], server.base_url), "application/json; charset=utf-8")
+
+            def _send(self, status, body, content_type="text/html; charset=utf-8"):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _next_response(self):
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+            if self.slow_rate > 0 and self._rng.random() < self.slow_rate:
+                delay += self.slow
+                self.slow_responses += 1
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        return delay, fail
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+class SMTPSink:
+    """
+    받은 메일의 개수와 크기만 기록하는 로컬 SMTP 서버 (AUTH, TLS 미지원)
+
+    send_bulk_email을 host/port와 use_ssl=False로 지정하고
+    EMAIL_PASSWORD 없이 호출하면 로그인 없이 이 서버로 발송한다.
+    """
+
+    def __init__(self):
+        self.messages = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+        sink = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line):
+                self.wfile.write(line.encode("ascii") + b"\r\n")
+
+            def handle(self):
+                self.reply("220 briefy-bench ESMTP")
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    command = line.decode("ascii", "replace").strip().upper()
+                    if command.startswith("EHLO"):
+                        self.wfile.write(b"250-briefy-bench\r\n250-8BITMIME\r\n250 SIZE 52428800\r\n")
+                    elif command.startswith("HELO"):
+                        self.reply("250 briefy-bench")
+                    elif command.startswith("DATA"):
+                        self.reply("354 End data with <CR><LF>.<CR><LF>")
+                        size = 0
+                        for data_line in self.rfile:
+                            if data_line in (b".\r\n", b".\n"):
+                                break
+                            size += len(data_line)
+                        sink._record(size)
+                        self.reply("250 OK")
+                    elif command.startswith("QUIT"):
+                        self.reply("221 Bye")
+                        return
+                    else:
+                        # MAIL, RCPT, RSET, NOOP 등은 모두 수락
+                        self.reply("250 OK")
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.host, self.port = self._server.server_address
+
+    def _record(self, size):
+        with self._lock:
+            self.messages += 1
+            self.bytes += size
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
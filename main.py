@@ -1,16 +1,16 @@
 # 필요한 라이브러리 임포트
 import os                  # 환경 변수 및 파일 시스템 작업용
-import time               # 시간 지연 및 스케줄링 관련 기능용
-import schedule          # 정기적인 작업 스케줄링을 위한 라이브러리
+import sys                # 명령행 종료 코드 처리용
+import time               # 발송 지연 시간 계산용
 import logging           # 로그 기록을 위한 라이브러리
+import itertools         # 스트리밍 다이제스트의 기사 수 제한용
 from datetime import datetime  # 날짜 및 시간 처리용
 
 # 사용자 정의 모듈 임포트
-from modules.fetch_news import fetch_news           # 뉴스 데이터 수집 모듈
-from modules.fetch_article import fetch_article     # 개별 기사 내용 수집 모듈
-from modules.summarize import summarize_article     # 기사 요약 모듈
-from modules.create_pdf import create_news_pdf      # PDF 생성 모듈
-from modules.send_email import send_email          # 이메일 전송 모듈
+# 수집(bs4, requests), 요약(numpy, scikit-learn), PDF(fpdf), 이메일(yagmail) 모듈은
+# 시작 시간을 줄이기 위해 각 하위 명령에서 처음 사용할 때 임포트
+from modules import metrics                         # 단계별 실행 계측 모듈 (표준 라이브러리만 사용)
+from modules import deadline                        # 작업 시간 예산 모듈 (표준 라이브러리만 사용)
 
 # 로깅 설정
 # level=logging.INFO: 정보성 메시지부터 기록
@@ -21,125 +21,937 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()]  # 콘솔에 로그 출력
 )
 
-def process_articles(articles):
+# 동시 처리 및 요약 설정
+# BRIEFY_MAX_WORKERS: 기사 처리에 사용할 최대 스레드 수
+# BRIEFY_HOST_RATE: 호스트당 초당 허용 요청 수 (기존 1초 지연을 대체)
+MAX_WORKERS = int(os.getenv("BRIEFY_MAX_WORKERS", "4"))
+HOST_RATE = float(os.getenv("BRIEFY_HOST_RATE", "1.0"))
+# BRIEFY_SUMMARIZER: 요약 방식 (extractive: 기존 앞 문장 추출, textrank: TF-IDF/TextRank 배치 요약,
+#                    abstractive: 로컬 seq2seq 모델 생성형 요약)
+SUMMARIZER = os.getenv("BRIEFY_SUMMARIZER", "extractive")
+# BRIEFY_DIGEST: 다이제스트 구성 방식 (new: 이번 실행의 새 기사, top: 오늘 처리한 기사 중 주요 기사)
+DIGEST = os.getenv("BRIEFY_DIGEST", "new")
+# BRIEFY_PIPELINE: 작업 실행 방식 (stream: 수집/요약/PDF 렌더링을 큐로 연결해 겹쳐 실행,
+#                  batch: 단계마다 모든 기사를 처리한 뒤 다음 단계 실행)
+# BRIEFY_PIPELINE_WORKERS: 스트리밍 단계별 스레드 수 (예: fetch=4,summarize=2)
+PIPELINE = os.getenv("BRIEFY_PIPELINE", "stream")
+PIPELINE_WORKERS = os.getenv("BRIEFY_PIPELINE_WORKERS", "")
+# BRIEFY_COLLECT_LIMIT: 구독자별 다이제스트를 만들 때 한 번에 수집/요약할 최대 기사 수 (모든 구독자 관심사 기준)
+COLLECT_LIMIT = int(os.getenv("BRIEFY_COLLECT_LIMIT", "50"))
+
+def fetch_content(article, rate_limiter=None):
     """
-    수집된 뉴스 기사들을 처리하고 요약하는 함수
+    단일 뉴스 기사의 본문을 수집하는 함수
     
     Args:
-        articles (list): 처리할 뉴스 기사 목록
+        article (Article): 처리할 뉴스 기사
+        rate_limiter (HostRateLimiter, optional): 호스트별 요청 속도 제한기
+        
+    Returns:
+        str: 기사 본문, 실패 시 None
+    """
+    try:
+        # 작업 시간 예산을 모두 사용했으면 수집하지 않고 다이제스트의 미포함 목록에 추가
+        if deadline.expired():
+            return skip_article(article)
+        
+        logging.info(f"처리 중인 기사: {article.title}")
+        
+        metrics.article(article.link, title=article.title)
+        
+        # 호스트별 요청 속도 제한 (서버 부담 방지)
+        if rate_limiter:
+            waited = rate_limiter.acquire(article.link)
+            metrics.article(article.link, rate_limit_wait_seconds=round(waited, 4))
+        
+        from modules.fetch_article import fetch_article
+        
+        # 기사 본문 수집
+        with metrics.timed(article.link, "fetch_seconds"):
+            content = fetch_article(article.link)
+        if not content:
+            if deadline.expired():
+                return skip_article(article)
+            logging.warning(f"기사 내용을 가져올 수 없음: {article.title}")
+            metrics.incr("fetch_failures")
+            metrics.article(article.link, status="fetch_failed")
+            return None
+        return content
+        
+    except Exception as e:
+        logging.error(f"기사 처리 중 오류 발생: {e}")
+        metrics.incr("fetch_failures")
+        metrics.article(article.link, status="fetch_failed")
+        return None
+
+def skip_article(article):
+    """
+    작업 시간 예산 초과로 처리하지 못한 기사를 기록하는 함수
+    
+    Args:
+        article (Article): 뉴스 기사
+        
+    Returns:
+        None: 처리 결과 없음 (fetch_content 등의 실패 반환값으로 사용)
+    """
+    deadline.skip(article)
+    metrics.incr("deadline_skips")
+    metrics.article(article.link, title=article.title, status="skipped_deadline")
+    return None
+
+def build_record(article, summary):
+    """
+    기사에 요약을 채워 요약된 기사 기록으로 만드는 함수
+    
+    Args:
+        article (Article): 뉴스 기사
+        summary (str): 기사 요약
+        
+    Returns:
+        Article: 요약된 기사 (새로 복사하지 않고 입력 기사에 요약을 채워 반환)
+    """
+    article.summary = summary
+    return article
+
+def collapse_duplicates(articles, contents, threshold=None):
+    """
+    본문이 유사한 기사를 하나로 합치는 함수
+    
+    Args:
+        articles (list): 뉴스 기사 목록
+        contents (list): 기사별 본문 (수집 실패 시 None)
+        threshold (float, optional): 본문 유사 중복 판정 기준 (기본값: BRIEFY_DEDUP_BODY_THRESHOLD)
         
     Returns:
-        list: 요약된 기사 정보를 담은 딕셔너리 리스트
+        list: 기사별 본문 (중복으로 합쳐진 기사는 None)
+        
+    Note:
+        - 먼저 나온 기사를 대표로 남기고, 중복 기사의 언론사는 대표 기사의 alternates에 추가
+    """
+    from modules.dedup import NearDuplicateIndex, add_alternate, BODY_THRESHOLD
+    
+    if threshold is None:
+        threshold = BODY_THRESHOLD
+    if not threshold:
+        return contents
+    
+    index = NearDuplicateIndex(threshold, shingle_size=5)
+    collapsed = list(contents)
+    duplicates = 0
+    for idx, (article, content) in enumerate(zip(articles, contents)):
+        if not content:
+            continue
+        representative = index.add(idx, content)
+        if representative is not None:
+            add_alternate(articles[representative], article)
+            collapsed[idx] = None
+            duplicates += 1
+            metrics.article(article.link, status="duplicate")
+            logging.debug(f"본문 유사 중복 기사 합침: {article.title}")
+    
+    if duplicates:
+        metrics.incr("body_duplicates", duplicates)
+        logging.info(f"본문 유사 중복 {duplicates}건 합침 (요약 {duplicates}회 절약)")
+    return collapsed
+
+def fetch_contents(articles, max_workers=None, rate_limiter=None, skip=()):
+    """
+    여러 기사의 본문을 동시에 수집하는 함수
+    
+    Args:
+        articles (list): 뉴스 기사 목록
+        max_workers (int, optional): 최대 동시 처리 스레드 수 (기본값: BRIEFY_MAX_WORKERS)
+        rate_limiter (HostRateLimiter, optional): 호스트별 요청 속도 제한기
+            (기본값: 호스트당 초당 BRIEFY_HOST_RATE회)
+        skip (Collection[int]): 수집하지 않을 기사 인덱스 (저장된 요약을 사용하는 기사)
+        
+    Returns:
+        list: 기사별 본문 (원래 기사 순서, 실패하거나 건너뛴 기사는 None)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from modules.rate_limiter import HostRateLimiter
+    
+    if max_workers is None:
+        max_workers = MAX_WORKERS
+    if rate_limiter is None:
+        rate_limiter = HostRateLimiter(rate=HOST_RATE)
+    
+    def fetch(idx_article):
+        idx, article = idx_article
+        return None if idx in skip else fetch_content(article, rate_limiter)
+    
+    with metrics.stage("fetch_articles"):
+        if max_workers <= 1:
+            return [fetch(item) for item in enumerate(articles)]
+        # executor.map은 입력 순서대로 결과를 반환
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, enumerate(articles)))
+
+def summarize_contents(articles, contents, summarizer=None, store=None, stored=None):
+    """
+    수집된 본문을 요약하여 요약된 기사 목록을 만드는 함수
+    
+    Args:
+        articles (list): 뉴스 기사 목록
+        contents (list): 기사별 본문 (수집 실패 시 None)
+        summarizer (str, optional): 요약 방식 ("extractive", "textrank", "abstractive",
+            기본값: BRIEFY_SUMMARIZER)
+        store (ArticleStore, optional): 처리 기록 저장소
+        stored (dict, optional): 기사 인덱스별 저장된 요약 기록 (요약하지 않고 그대로 사용)
+        
+    Returns:
+        list: 요약된 기사(Article) 목록 (원래 기사 순서 유지)
+        
+    Note:
+        - 유사 중복을 합친 뒤 요약 (textrank/abstractive 방식은 배치로 요약)
+        - 저장소에 같은 본문(다른 URL로 재배포된 기사)의 요약이 있으면 재사용하고,
+          새로 요약한 기사는 URL과 본문 해시로 저장
     """
+    from modules.summarize import summarize_article, summarize_articles
+    from modules.article_store import content_hash
+    
+    if summarizer is None:
+        summarizer = SUMMARIZER
+    stored = stored or {}
+    
+    # 본문 유사 중복 제거
+    with metrics.stage("dedup"):
+        contents = collapse_duplicates(articles, contents)
+    
+    # 같은 본문의 저장된 요약 조회
+    digests = [content_hash(content) if content and store else None for content in contents]
+    known = {}
+    if store:
+        for idx, digest in enumerate(digests):
+            summary = store.summary_for_hash(digest) if digest else None
+            if summary:
+                known[idx] = summary
+        if known:
+            metrics.incr("store_hash_hits", len(known))
+    pending = [None if idx in known else content for idx, content in enumerate(contents)]
+    
+    # 작업 시간 예산을 모두 사용했으면 요약하지 않고 다이제스트의 미포함 목록에 추가
+    if deadline.expired():
+        for idx, content in enumerate(pending):
+            if content:
+                skip_article(articles[idx])
+                pending[idx] = contents[idx] = None
+    
+    # 기사 요약 생성
+    with metrics.stage("summarize"):
+        if summarizer == "extractive":
+            summaries = []
+            for article, content in zip(articles, pending):
+                try:
+                    with metrics.timed(article.link, "summarize_seconds"):
+                        summaries.append(summarize_article(content) if content else None)
+                except Exception as e:
+                    logging.error(f"기사 처리 중 오류 발생: {e}")
+                    summaries.append(None)
+        else:
+            summaries = summarize_articles([content or "" for content in pending], engine=summarizer)
+    for idx, summary in known.items():
+        summaries[idx] = summary
+    
     summarized_articles = []
+    for idx, (article, content, summary) in enumerate(zip(articles, contents, summaries)):
+        if idx in stored:
+            summarized_articles.append(stored[idx])
+            continue
+        if not content:
+            continue
+        record = record_summary(article, summary, digests[idx], store)
+        if record:
+            summarized_articles.append(record)
+    metrics.incr("articles_summarized", len(summarized_articles))
+
+    return summarized_articles
+
+def record_summary(article, summary, digest=None, store=None):
+    """
+    요약 결과로 기사 기록을 만들고 저장소에 저장하는 함수
     
-    for article in articles:
+    Args:
+        article (Article): 뉴스 기사
+        summary (str): 기사 요약 (실패 시 None)
+        digest (str, optional): 본문 해시
+        store (ArticleStore, optional): 처리 기록 저장소
+        
+    Returns:
+        Article: 요약된 기사, 요약에 실패했으면 None
+    """
+    if not summary:
+        logging.warning(f"기사 요약 실패: {article.title}")
+        metrics.incr("summary_failures")
+        metrics.article(article.link, status="summary_failed")
+        return None
+    metrics.article(article.link, status="ok")
+    record = build_record(article, summary)
+    if store:
         try:
-            logging.info(f"처리 중인 기사: {article['title']}")
-            
-            # 기사 본문 수집
-            content = fetch_article(article['link'])
-            if not content:
-                logging.warning(f"기사 내용을 가져올 수 없음: {article['title']}")
-                continue
-
-            # 기사 요약 생성
-            summary = summarize_article(content)
-            if not summary:
-                logging.warning(f"기사 요약 실패: {article['title']}")
-                continue
-
-            # 요약된 기사 정보 저장
-            summarized_articles.append({
-                "title": article["title"],
-                "summary": summary,
-                "link": article["link"],
-                "press": article.get("press", "Unknown"),  # 언론사 정보가 없을 경우 "Unknown" 사용
-                "category": article.get("category", "세계"),  # 카테고리 정보가 없을 경우 "세계" 사용
-                "timestamp": article.get("timestamp", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            })
-            
-            time.sleep(1)  # API 요청 제한을 피하기 위한 지연
-            
+            store.record(record, digest)
         except Exception as e:
-            logging.error(f"기사 처리 중 오류 발생: {e}")
-            continue
+            logging.warning(f"처리 기록 저장 실패: {article.link} - {e}")
+    return record
 
-    return summarized_articles
+def process_articles(articles, max_workers=None, rate_limiter=None, summarizer=None, store=None):
+    """
+    수집된 뉴스 기사들을 동시에 처리하고 요약하는 함수
+    
+    Args:
+        articles (list): 처리할 뉴스 기사 목록
+        max_workers (int, optional): 최대 동시 처리 스레드 수 (기본값: BRIEFY_MAX_WORKERS)
+        rate_limiter (HostRateLimiter, optional): 호스트별 요청 속도 제한기
+            (기본값: 호스트당 초당 BRIEFY_HOST_RATE회)
+        summarizer (str, optional): 요약 방식 ("extractive", "textrank", "abstractive",
+            기본값: BRIEFY_SUMMARIZER)
+        store (ArticleStore, optional): 처리 기록 저장소
+            (지정하면 처리한 적 있는 기사는 다운로드와 요약 없이 저장된 요약을 사용)
+        
+    Returns:
+        list: 요약된 기사(Article) 목록 (원래 기사 순서 유지)
+        
+    Note:
+        - 기사별 실패는 해당 기사만 제외하고 나머지 처리를 계속함
+        - max_workers가 1이면 순차적으로 처리
+        - 본문을 모두 수집(fetch_contents)한 뒤 요약(summarize_contents)
+    """
+    # 이전 실행에서 처리한 기사는 저장된 요약 사용
+    stored = {}
+    if store:
+        seen = store.seen_urls(article.link for article in articles)
+        for idx, article in enumerate(articles):
+            if article.link in seen:
+                stored[idx] = store.get(article.link)
+                metrics.article(article.link, status="stored")
+        if stored:
+            metrics.incr("store_hits", len(stored))
+            logging.info(f"처리 기록 재사용: {len(stored)}개 기사 (다운로드 및 요약 생략)")
+    
+    contents = fetch_contents(articles, max_workers, rate_limiter, skip=stored)
+    return summarize_contents(articles, contents, summarizer, store, stored)
 
-def job():
+def stream_articles(articles, summarizer=None, store=None, rate_limiter=None, workers=None):
+    """
+    기사 이터레이터를 본문 수집, 중복 제거, 요약 단계를 겹쳐 실행하는 파이프라인으로 처리하는 제너레이터
+    
+    Args:
+        articles (Iterable[Article]): 뉴스 기사 이터레이터 (iter_news 등, 목록 해석과 동시에 수집 시작)
+        summarizer (str, optional): 요약 방식 (기본값: BRIEFY_SUMMARIZER)
+        store (ArticleStore, optional): 처리 기록 저장소 (같은 본문의 요약 재사용, 요약 결과 저장)
+        rate_limiter (HostRateLimiter, optional): 호스트별 요청 속도 제한기
+            (기본값: 호스트당 초당 BRIEFY_HOST_RATE회)
+        workers (dict, optional): 단계별 스레드 수 (기본값: BRIEFY_PIPELINE_WORKERS,
+            지정하지 않은 단계는 fetch=BRIEFY_MAX_WORKERS, summarize=1)
+        
+    Yields:
+        Article: 요약된 기사 (원래 기사 순서, 실패하거나 중복으로 합쳐진 기사는 제외)
+        
+    Note:
+        - 단계 사이는 BRIEFY_PIPELINE_QUEUE 크기의 큐로 연결되어, 요약이 밀리면 본문 수집도 기다림
+        - 중복 제거 단계는 한 스레드에서 실행하며, 본문 수집이 먼저 끝난 기사가 대표 기사가 됨
+          (대표 기사가 이미 렌더링된 뒤 합쳐진 중복 기사는 처리 기록에만 반영)
+        - textrank/abstractive 방식은 요약 단계에 도착해 있는 기사를 모아 배치로 요약
+          (배치 크기 최대 BRIEFY_PIPELINE_QUEUE)
+    """
+    from modules.pipeline import Pipeline, Stage, parse_workers, QUEUE_SIZE
+    from modules.rate_limiter import HostRateLimiter
+    from modules.dedup import NearDuplicateIndex, add_alternate, BODY_THRESHOLD
+    from modules.summarize import summarize_article, summarize_articles
+    from modules.article_store import content_hash
+    
+    if summarizer is None:
+        summarizer = SUMMARIZER
+    if rate_limiter is None:
+        rate_limiter = HostRateLimiter(rate=HOST_RATE)
+    workers = dict({"fetch": MAX_WORKERS, "summarize": 1}, **(workers or parse_workers(PIPELINE_WORKERS)))
+    
+    def fetch(article):
+        metrics.incr("articles_listed")
+        content = fetch_content(article, rate_limiter)
+        return (article, content) if content else None
+    
+    index = NearDuplicateIndex(BODY_THRESHOLD, shingle_size=5) if BODY_THRESHOLD else None
+    representatives = []
+    
+    def dedup(item):
+        article, content = item
+        if not index:
+            return item
+        representative = index.add(len(representatives), content)
+        representatives.append(article)
+        if representative is None:
+            # 요약 단계의 기록도 같은 Article이므로 나중에 합쳐진 중복 기사의 출처도 반영됨
+            return item
+        representative = representatives[representative]
+        add_alternate(representative, article)
+        if store:
+            store.update_alternates(representative.link, representative.alternates)
+        metrics.incr("body_duplicates")
+        metrics.article(article.link, status="duplicate")
+        logging.info(f"본문 유사 중복 기사 합침: {article.title}")
+        return None
+    
+    def summarize(items):
+        if deadline.expired():
+            return [skip_article(article) for article, _ in items]
+        digests = [content_hash(content) if store else None for _, content in items]
+        summaries = [store.summary_for_hash(digest) if digest else None for digest in digests]
+        if any(summaries):
+            metrics.incr("store_hash_hits", sum(1 for summary in summaries if summary))
+        pending = [idx for idx, summary in enumerate(summaries) if not summary]
+        if summarizer == "extractive":
+            for idx in pending:
+                article, content = items[idx]
+                try:
+                    with metrics.timed(article.link, "summarize_seconds"):
+                        summaries[idx] = summarize_article(content)
+                except Exception as e:
+                    logging.error(f"기사 처리 중 오류 발생: {e}")
+        elif pending:
+            for idx, summary in zip(pending, summarize_articles([items[idx][1] for idx in pending], engine=summarizer)):
+                summaries[idx] = summary
+        records = [record_summary(article, summary, digest, store)
+                   for (article, _), summary, digest in zip(items, summaries, digests)]
+        metrics.incr("articles_summarized", sum(1 for record in records if record))
+        return records
+    
+    stages = [
+        Stage("fetch", fetch, workers=workers["fetch"]),
+        Stage("dedup", dedup),
+        Stage("summarize", (lambda item: summarize([item])[0]) if summarizer == "extractive" else summarize,
+              workers=workers["summarize"], batch_size=1 if summarizer == "extractive" else QUEUE_SIZE)
+    ]
+    yield from Pipeline(articles, stages)
+
+def get_recipients():
+    """
+    이메일 수신자 목록을 반환하는 함수
+    
+    Returns:
+        list: EMAIL_RECIPIENTS(쉼표로 구분한 수신자 목록)의 주소, 없으면 EMAIL_USERNAME
+    """
+    return [
+        address.strip()
+        for address in os.getenv("EMAIL_RECIPIENTS", os.getenv("EMAIL_USERNAME", "")).split(",")
+        if address.strip()
+    ]
+
+def send_digest(recipients, subject, body, attachment, html=None):
+    """
+    다이제스트 이메일을 전송하는 함수
+    
+    Args:
+        recipients (list): 수신자 이메일 주소 목록
+        subject (str): 이메일 제목
+        body (str): 이메일 본문 (HTML 본문이 있으면 텍스트 대체 본문)
+        attachment (str): 첨부 파일 경로 (없으면 None)
+        html (str, optional): HTML 본문
+        
+    Returns:
+        list: 전송에 실패한 수신자 목록
+        
+    Note:
+        - 수신자가 여러 명이거나 HTML 본문이 있으면 연결 풀을 사용한 대량 발송
+          (HTML 본문은 multipart/alternative로 직접 구성)
+    """
+    from modules.send_email import send_email, send_bulk_email
+    
+    with metrics.stage("send_email"):
+        if len(recipients) == 1 and html is None:
+            failed = [] if send_email(recipients[0], subject, body, attachment) else list(recipients)
+        else:
+            results = send_bulk_email(recipients, subject, body, attachment, html)
+            failed = [address for address, result in results.items() if not result["ok"]]
+            metrics.incr("email_retries", sum(result["attempts"] - 1 for result in results.values()))
+    metrics.incr("emails_sent", len(recipients) - len(failed))
+    metrics.incr("email_failures", len(failed))
+    if failed:
+        logging.error(f"이메일 전송에 실패한 수신자: {', '.join(failed)}")
+    return failed
+
+def send_digests(batches):
+    """
+    수신자 묶음마다 다른 다이제스트 이메일을 하나의 연결 풀로 전송하는 함수
+    
+    Args:
+        batches (iterable): (수신자 목록, 제목, 본문, 첨부 파일 경로, HTML 본문) 목록 (발송하면서 하나씩 읽음)
+        
+    Returns:
+        list: 전송에 실패한 수신자 목록
+    """
+    from modules.send_email import send_bulk_emails
+    
+    with metrics.stage("send_email"):
+        results = send_bulk_emails(batches)
+    failed = [address for address, result in results.items() if not result["ok"]]
+    metrics.incr("email_retries", sum(result["attempts"] - 1 for result in results.values()))
+    metrics.incr("emails_sent", len(results) - len(failed))
+    metrics.incr("email_failures", len(failed))
+    if failed:
+        logging.error(f"이메일 전송에 실패한 수신자 {len(failed)}명: {', '.join(failed[:20])}")
+    return failed
+
+def digest_message(today, skipped=(), articles=None, title="뉴스 요약"):
+    """
+    다이제스트 이메일 제목과 본문을 만드는 함수
+    
+    Args:
+        today (str): 날짜 문자열 (YYYYMMDD)
+        skipped (list): 작업 시간 예산 초과로 포함하지 못한 기사 목록 (본문에 제목과 링크 표시)
+        articles (list, optional): PDF 없이 HTML 본문으로 보내는 기사 목록
+            (HTML을 표시하지 못하는 메일 클라이언트용 텍스트 본문에 제목과 링크 표시)
+        title (str): 다이제스트 제목 (digest_title 참고, 예: "세계 뉴스 요약")
+        
+    Returns:
+        tuple: (제목, 본문)
+    """
+    subject = f"{today} {title}"
+    if articles is None:
+        body = f"안녕하세요,\n\n오늘의 {title}을 보내드립니다.\n자세한 내용은 첨부된 PDF를 확인해 주세요."
+    else:
+        lines = [f"{idx}. {article.title} ({article.press})\n   {article.link}"
+                 for idx, article in enumerate(articles, 1)]
+        body = f"안녕하세요,\n\n오늘의 {title}을 보내드립니다."
+        if lines:
+            body += "\n\n" + "\n".join(lines)
+    if skipped:
+        lines = [f"- {entry['title']} ({entry['press']})\n  {entry['link']}" for entry in skipped]
+        body += f"\n\n처리 시간 제한으로 이번 요약에 포함되지 못한 기사 {len(skipped)}건:\n" + "\n".join(lines)
+    return subject, body
+
+def section_title():
+    """
+    수집 섹션(BRIEFY_SECTIONS)으로 다이제스트 제목을 만드는 함수 (구독자 구분 없는 다이제스트용)
+    
+    Returns:
+        str: 다이제스트 제목 (예: 기본값 104이면 "세계 뉴스 요약")
+    """
+    from modules.fetch_news import SECTIONS, SECTION_NAMES
+    from modules.renderers import digest_title
+    
+    return digest_title(SECTION_NAMES.get(sid, sid) for sid in SECTIONS)
+
+def render_digest(articles, today, names, skipped=(), title=None):
+    """
+    요약된 기사 목록을 다이제스트 형식의 렌더러마다 파일로 만드는 함수
+    
+    Args:
+        articles (list): 요약된 기사 목록
+        today (str): 날짜 문자열 (YYYYMMDD)
+        names (tuple): 렌더러 이름 (renderer_names 참고)
+        skipped (list): 작업 시간 예산 초과로 포함하지 못한 기사 목록 (HTML 본문에 표시)
+        title (str, optional): 다이제스트 제목 (기본값: 기사 카테고리로 만든 제목)
+        
+    Returns:
+        dict: {렌더러 이름: 파일 경로}, 하나라도 실패하면 None
+    """
+    from modules.renderers import get_renderer
+    
+    files = {}
+    for name in names:
+        renderer = get_renderer(name)
+        path = renderer.filename(today)
+        with metrics.stage(f"render_{name}"):
+            if renderer.render(articles, today, path, skipped, title) is None:
+                return None
+        files[name] = path
+    return files
+
+def digest_email(today, files, articles, skipped=(), title=None):
+    """
+    렌더링한 다이제스트 파일로 이메일을 구성하는 함수
+    
+    Args:
+        today (str): 날짜 문자열 (YYYYMMDD)
+        files (dict): {렌더러 이름: 파일 경로} (첨부 렌더러의 파일은 첨부, 나머지는 HTML 본문)
+        articles (list): 다이제스트에 포함된 기사 목록
+        skipped (list): 작업 시간 예산 초과로 포함하지 못한 기사 목록
+        title (str, optional): 다이제스트 제목 (기본값: 기사 카테고리로 만든 제목)
+        
+    Returns:
+        tuple: (제목, 텍스트 본문, 첨부 파일 경로 또는 None, HTML 본문 또는 None)
+    """
+    from modules.renderers import digest_title, get_renderer
+    
+    attachment = html = None
+    for name, path in files.items():
+        if get_renderer(name).attach:
+            attachment = path
+        else:
+            with open(path, encoding="utf-8") as f:
+                html = f.read()
+    title = title or digest_title(article.category for article in articles)
+    subject, body = digest_message(today, skipped, None if attachment else articles, title)
+    return subject, body, attachment, html
+
+def archive_digest(today, articles):
+    """
+    발송한 다이제스트의 기사와 요약을 보관소에 추가하는 함수
+    
+    Args:
+        today (str): 날짜 문자열 (YYYYMMDD)
+        articles (list): 발송한 기사 목록 (요약 포함)
+        
+    Note:
+        - BRIEFY_ARCHIVE=0이면 보관하지 않음
+        - 보관에 실패해도 발송 결과에는 영향을 주지 않음 (경고만 기록)
+    """
+    from modules.archive import get_archive
+    
+    archive = get_archive()
+    if archive is None or not articles:
+        return
+    try:
+        with metrics.stage("archive"):
+            count = archive.append(articles, today)
+        metrics.incr("archived_articles", count)
+    except Exception as e:
+        logging.warning(f"다이제스트 보관 실패: {e}")
+
+def stream_digest(today, store=None, limit=10, names=("pdf",), skipped=(), title=None):
+    """
+    기사 목록 수집부터 다이제스트 렌더링까지 스트리밍 파이프라인으로 실행하는 함수
+    
+    Args:
+        today (str): 날짜 문자열 (YYYYMMDD)
+        store (ArticleStore, optional): 처리 기록 저장소
+        limit (int): 다이제스트에 포함할 최대 기사 수
+        names (tuple): 렌더러 이름 (renderer_names 참고)
+        skipped (list): 작업 시간 예산 초과로 포함하지 못한 기사 목록 (HTML 본문에 표시)
+        title (str, optional): 다이제스트 제목 (기사가 도착하기 전에 렌더링을 시작하므로 미리 지정,
+            기본값: section_title())
+        
+    Returns:
+        tuple: (다이제스트에 포함된 기사 목록, {렌더러 이름: 파일 경로})
+            - 렌더링에 실패하면 (None, None), 포함할 기사가 없으면 ([], None)
+            
+    Note:
+        - 미리 수집했지만 아직 발송하지 않은 기사(최근 24시간)를 먼저 배치하고,
+          이번에 수집한 기사는 요약이 끝나는 대로 이어서 렌더링
+        - 첨부 렌더러(PDF)가 있으면 파이프라인에서 렌더링하고, 나머지(HTML)는 포함할 기사가 정해진 뒤 렌더링
+        - limit개를 채우면 남은 파이프라인 단계를 취소 (처리되지 않은 기사는 다음 실행에서 수집)
+    """
+    from modules.fetch_news import iter_news
+    from modules.renderers import get_renderer
+    
+    renderers = [get_renderer(name) for name in names]
+    streaming = next((renderer for renderer in renderers if renderer.attach), renderers[0])
+    pending = store.unsent(since=time.time() - 24 * 3600, limit=limit) if store else []
+    records = stream_articles(iter_news(limit=limit, store=store), store=store)
+    included = []
+    
+    def digest():
+        for record in itertools.islice(itertools.chain(pending, records), limit):
+            included.append(record)
+            yield record
+    
+    path = streaming.filename(today)
+    try:
+        with metrics.stage("pipeline"):
+            written = streaming.render(digest(), today, path, skipped, title or section_title())
+    finally:
+        records.close()
+    
+    if written is None:
+        return None, None
+    if not included:
+        os.remove(path)
+        return [], None
+    
+    others = render_digest(included, today, [name for name in names if name != streaming.name], skipped,
+                           title or section_title())
+    if others is None:
+        return None, None
+    others[streaming.name] = path
+    return included, {name: others[name] for name in names}
+
+def personalized_digest(today, subscribers, store=None, skipped=()):
+    """
+    구독자별 관심사에 맞춘 다이제스트를 만들어 전송하는 함수
+    
+    Args:
+        today (str): 날짜 문자열 (YYYYMMDD)
+        subscribers (list): 구독자 목록 (Subscriber)
+        store (ArticleStore, optional): 처리 기록 저장소
+        skipped (list): 작업 시간 예산 초과로 포함하지 못한 기사 목록
+        
+    Returns:
+        bool: 한 명 이상에게 전송했거나 보낼 새 기사가 없으면 True
+        
+    Note:
+        - 모든 구독자가 원하는 섹션을 합쳐 기사를 한 번만 수집/요약 (최대 BRIEFY_COLLECT_LIMIT개)
+        - 요약된 기사를 키워드/섹션/언론사 역색인으로 만들고 구독자별 기사는 집합 연산으로 선택
+        - 같은 기사를 받는 구독자는 형식(PDF, HTML)마다 파일 하나와 메시지 인코딩 한 번을 공유하고,
+          서로 다른 PDF는 프로세스 풀에서 렌더링 (구독자가 선택한 형식의 파일만 렌더링)
+        - 한 명 이상에게 전송된 기사만 발송 완료로 기록하고 보관소에 추가
+    """
+    from modules.fetch_news import fetch_news, iter_news
+    from modules.subscribers import ArticleIndex, collection_sections
+    from modules.renderers import get_renderer, renderer_names
+    
+    sections = collection_sections(subscribers)
+    pending = store.unsent(since=time.time() - 24 * 3600, limit=COLLECT_LIMIT) if store else []
+    if PIPELINE == "stream":
+        with metrics.stage("pipeline"):
+            collected = list(stream_articles(iter_news(limit=COLLECT_LIMIT, sections=sections, store=store),
+                                             store=store))
+    else:
+        with metrics.stage("fetch_news"):
+            articles = fetch_news(limit=COLLECT_LIMIT, sections=sections, store=store)
+        metrics.incr("articles_listed", len(articles))
+        collected = process_articles(articles, store=store) if articles else []
+    
+    # 미리 수집했지만 아직 발송하지 않은 기사를 먼저 배치
+    pending_links = {record.link for record in pending}
+    records = pending + [record for record in collected if record.link not in pending_links]
+    if not records:
+        if store:
+            logging.info("이전 발송 이후 새 기사가 없습니다")
+            return True
+        logging.error("뉴스 요약을 생성할 수 없습니다")
+        return False
+    
+    with metrics.stage("select_articles"):
+        keywords = set().union(*(subscriber.keywords for subscriber in subscribers))
+        groups = ArticleIndex(records, keywords).group(subscribers)
+    unmatched = groups.pop((), [])
+    metrics.incr("subscribers", len(subscribers))
+    metrics.incr("digest_variants", len(groups))
+    metrics.incr("subscribers_without_articles", len(unmatched))
+    logging.info(f"구독자 {len(subscribers)}명, 다이제스트 {len(groups)}종 (관심 기사 없음 {len(unmatched)}명)")
+    if not groups:
+        return True
+    
+    # 기사 묶음마다 구독자가 선택한 형식의 렌더러로만 렌더링 (렌더러 이름 -> {파일 경로: 기사 번호})
+    numbers = [None] if len(groups) == 1 else range(1, len(groups) + 1)
+    deliveries = []  # (기사 묶음, 수신자 목록, {렌더러 이름: 파일 경로})
+    selections = {}
+    for number, (selection, members) in zip(numbers, groups.items()):
+        formats = {}
+        for subscriber in members:
+            formats.setdefault(subscriber.format, []).append(subscriber.email)
+        for digest_format, emails in formats.items():
+            files = {}
+            for name in renderer_names(digest_format):
+                files[name] = get_renderer(name).filename(today, number)
+                selections.setdefault(name, {})[files[name]] = selection
+            deliveries.append((selection, emails, files))
+    
+    created = {}
+    for name, selected in selections.items():
+        with metrics.stage(f"render_{name}"):
+            results = get_renderer(name).render_many(records, selected, today, skipped)
+        created.update(results)
+        metrics.incr(f"{name}_bytes", sum(os.path.getsize(path) for path, ok in results.items() if ok))
+    
+    ready = []
+    for selection, emails, files in deliveries:
+        if all(created[path] for path in files.values()):
+            ready.append((selection, emails, files))
+        else:
+            logging.error(f"다이제스트를 생성할 수 없어 구독자 {len(emails)}명에게 전송하지 않습니다: "
+                          f"{', '.join(files.values())}")
+    if not ready:
+        return False
+    
+    def batches():
+        # HTML 본문은 발송 차례가 될 때 읽음 (다이제스트가 많아도 모든 본문을 한 번에 메모리에 두지 않음)
+        for selection, emails, files in ready:
+            yield (emails, *digest_email(today, files, [records[idx] for idx in selection], skipped))
+    
+    failed = set(send_digests(batches()))
+    delivered = set()
+    for selection, emails, _ in ready:
+        if any(email not in failed for email in emails):
+            delivered.update(selection)
+    archive_digest(today, [records[idx] for idx in sorted(delivered)])
+    if store and delivered:
+        store.mark_sent(records[idx].link for idx in sorted(delivered))
+    return bool(delivered)
+
+def prefetch():
+    """
+    발송 시각 전에 새 기사를 미리 수집하고 요약하는 함수
+    
+    Note:
+        - 요약 결과는 처리 기록 저장소에 발송 전 상태로 저장되고, 발송 시 job이 다이제스트에 포함
+        - 저장소를 사용하지 않으면 기사 캐시와 요약 캐시만 미리 채움
+          (발송 시 조건부 요청과 캐시된 요약으로 빠르게 처리)
+    """
+    from modules.fetch_news import fetch_news, iter_news
+    from modules.article_store import get_store
+    from modules.scheduler import ProcessLock
+    
+    # 다른 프로세스가 발송/미리 수집 중이면 건너뜀 (스케줄러가 잡은 잠금은 그대로 사용)
+    process_lock = ProcessLock()
+    if not process_lock.acquire():
+        logging.warning("다른 프로세스가 작업을 실행 중이어서 미리 수집을 건너뜁니다")
+        return
+    
+    with process_lock, metrics.run("prefetch") as run, deadline.budget():
+        try:
+            store = get_store()
+            if PIPELINE == "stream":
+                with metrics.stage("pipeline"):
+                    for _ in stream_articles(iter_news(limit=10, store=store), store=store):
+                        pass
+            else:
+                with metrics.stage("fetch_news"):
+                    articles = fetch_news(limit=10, store=store)
+                metrics.incr("articles_listed", len(articles))
+                if articles:
+                    process_articles(articles, store=store)
+            run.status = "ok"
+        except Exception as e:
+            run.status = "error"
+            logging.error(f"미리 수집 중 오류 발생: {e}")
+
+def job(scheduled_at=None):
     """
     일일 뉴스 요약 작업을 실행하는 메인 함수
     - 뉴스 수집
     - 기사 요약
-    - PDF 생성
+    - PDF/HTML 다이제스트 생성
     - 이메일 전송
     을 순차적으로 수행
+    
+    Args:
+        scheduled_at (float, optional): 예약된 발송 시각 (Unix 시간, 스케줄러에서 전달)
+    
+    Note:
+        - BRIEFY_PIPELINE=stream(기본값)이면 단계를 겹쳐 실행 (BRIEFY_DIGEST=top은 항상 단계별 실행)
+        - 단계별/기사별 시간과 카운터를 계측하여 로그로 남기고,
+          BRIEFY_METRICS_DIR이 설정되어 있으면 JSON과 Prometheus 텍스트 파일로 저장
+        - 미리 수집(prefetch)한 기사가 있으면 마지막 변경분만 수집하고 함께 발송
+        - 예약 실행이면 예정 시각부터 발송 완료까지의 지연을 기록
+        - BRIEFY_TIME_BUDGET 안에 끝나도록 요청 제한 시간을 남은 예산에 맞추고, 예산이 끝나면
+          완료된 기사만으로 발송 (처리하지 못한 기사는 이메일 본문에 목록으로 표시)
+        - BRIEFY_SUBSCRIBERS 파일에 관심사가 있는 구독자가 있으면 구독자별 다이제스트를 만들어 전송
+          (personalized_digest, 기사 수집/요약은 한 번만)
+        - BRIEFY_DIGEST_FORMAT(또는 구독자별 format)에 따라 PDF 첨부, HTML 본문 또는 둘 다로 전송
+        - 발송한 기사와 요약은 다이제스트 보관소에 추가 (search 명령으로 검색)
+        - run, serve, 스케줄러 어느 경로로 실행해도 프로세스 잠금(ProcessLock)을 잡고 실행하며,
+          다른 프로세스가 실행 중이면 발송하지 않고 반환 (run 명령의 종료 코드 1)
     """
-    try:
-        logging.info("일일 뉴스 요약 작업 시작")
-        
-        # 환경 변수에서 이메일 수신자 정보 가져오기
-        recipient = os.getenv("EMAIL_USERNAME")
-        if not recipient:
-            logging.error("이메일 수신자가 설정되지 않았습니다")
-            return
+    from modules.fetch_news import fetch_news
+    from modules.renderers import DIGEST_FORMAT, renderer_names
+    from modules.http_client import log_connection_stats
+    from modules.article_store import get_store
+    from modules.subscribers import load_subscribers
+    from modules.scheduler import ProcessLock
+    
+    # cron, CI의 run 명령과 serve/스케줄러 실행이 겹쳐 같은 다이제스트를 두 번 발송하지 않도록 함
+    process_lock = ProcessLock()
+    if not process_lock.acquire():
+        logging.warning("다른 프로세스가 작업을 실행 중이어서 건너뜁니다: 일일 작업")
+        return
+    
+    with process_lock, metrics.run("daily") as run, deadline.budget() as budget:
+        try:
+            logging.info("일일 뉴스 요약 작업 시작")
             
-        # 현재 날짜 문자열 생성 (YYYYMMDD 형식)
-        today = datetime.now().strftime("%Y%m%d")
-        
-        # 최대 10개의 뉴스 기사 수집
-        articles = fetch_news(limit=10)
-        if not articles:
-            logging.error("뉴스를 가져올 수 없습니다")
-            return
+            # 구독자 목록 (BRIEFY_SUBSCRIBERS 파일이 없으면 수신자 전원이 관심사 없는 구독자)
+            subscribers = load_subscribers(recipients=get_recipients())
+            if not subscribers:
+                logging.error("이메일 수신자가 설정되지 않았습니다")
+                return
+            recipients = [subscriber.email for subscriber in subscribers]
+                
+            # 현재 날짜 문자열 생성 (YYYYMMDD 형식)
+            today = datetime.now().strftime("%Y%m%d")
             
-        # 수집된 기사 처리 및 요약
-        summarized = process_articles(articles)
-        if not summarized:
-            logging.error("뉴스 요약을 생성할 수 없습니다")
-            return
+            # 처리 기록 저장소 (BRIEFY_INCREMENTAL=0이면 None, 매번 전체 처리)
+            store = get_store()
             
-        # PDF 파일명 생성
-        pdf_filename = f"news_summary_{today}.pdf"
-        
-        # 요약된 뉴스로 PDF 생성
-        if not create_news_pdf(summarized, today):
-            logging.error("PDF를 생성할 수 없습니다")
-            return
+            if any(subscriber.personalized for subscriber in subscribers):
+                # 구독자별 관심사에 맞춘 다이제스트 (기사는 한 번만 수집/요약)
+                delivered = personalized_digest(today, subscribers, store, budget.skipped)
+                log_connection_stats()
+                if not delivered:
+                    return
+            else:
+                # 다이제스트 형식 (BRIEFY_DIGEST_FORMAT: pdf, html, both)
+                names = renderer_names(DIGEST_FORMAT)
+                # 제목은 실제로 포함된 기사와 관계없이 수집 섹션으로 정함 (스트리밍과 배치 실행이 같은 제목)
+                title = section_title()
+                if PIPELINE == "stream" and DIGEST != "top":
+                    # 목록 해석, 본문 수집, 요약, 렌더링을 겹쳐 실행
+                    summarized, files = stream_digest(today, store, names=names, skipped=budget.skipped,
+                                                      title=title)
+                    log_connection_stats()
+                    if summarized is None:
+                        logging.error("다이제스트를 생성할 수 없습니다")
+                        return
+                    if not summarized:
+                        if store:
+                            logging.info("이전 발송 이후 새 기사가 없습니다")
+                            run.status = "ok"
+                        else:
+                            logging.error("뉴스 요약을 생성할 수 없습니다")
+                        return
+                else:
+                    # 최대 10개의 뉴스 기사 수집 (이전 실행에서 처리한 기사 제외)
+                    with metrics.stage("fetch_news"):
+                        articles = fetch_news(limit=10, store=store)
+                    metrics.incr("articles_listed", len(articles))
+                    if not articles and not store:
+                        logging.error("뉴스를 가져올 수 없습니다")
+                        return
+                
+                    # 수집된 기사 처리 및 요약
+                    summarized = process_articles(articles, store=store) if articles else []
+                    log_connection_stats()
             
-        # 이메일 전목과 본문 설정
-        subject = f"{today} 세계 뉴스 요약"
-        body = "안녕하세요,\n\n오늘의 세계 뉴스 요약을 보내드립니다.\n자세한 내용은 첨부된 PDF를 확인해 주세요."
-        
-        # 이메일 전송
-        if not send_email(recipient, subject, body, pdf_filename):
-            logging.error("이메일 전송에 실패했습니다")
-            return
+                    if store and DIGEST == "top":
+                        # 오늘 처리한 기사 중 주요 기사로 구성 (저장된 요약 재사용, 재수집/재요약 없음)
+                        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+                        summarized = store.top_stories(since=midnight, limit=10)
+                    elif store:
+                        # 미리 수집한 기사와 이번 변경분 중 아직 발송하지 않은 기사 (최근 24시간)
+                        summarized = store.unsent(since=time.time() - 24 * 3600, limit=10)
+                        if not summarized:
+                            logging.info("이전 발송 이후 새 기사가 없습니다")
+                            run.status = "ok"
+                            return
             
-        logging.info("일일 뉴스 요약 작업 완료")
-        
-    except Exception as e:
-        logging.error(f"작업 실행 중 오류 발생: {e}")
+                    if not summarized:
+                        logging.error("뉴스 요약을 생성할 수 없습니다")
+                        return
+                
+                    # 요약된 뉴스로 다이제스트 생성 (PDF, HTML)
+                    files = render_digest(summarized, today, names, budget.skipped, title)
+                    if not files:
+                        logging.error("다이제스트를 생성할 수 없습니다")
+                        return
+            
+                for name, path in files.items():
+                    metrics.incr(f"{name}_bytes", os.path.getsize(path))
+                
+                # 이메일 제목과 본문 설정 후 전송 (시간 예산 초과로 포함하지 못한 기사는 본문에 목록으로 표시)
+                subject, body, attachment, html = digest_email(today, files, summarized, budget.skipped, title)
+                failed = send_digest(recipients, subject, body, attachment, html)
+                if len(failed) == len(recipients):
+                    return
+                archive_digest(today, summarized)
+                if store:
+                    store.mark_sent(article.link for article in summarized)
+            
+            # 예정 시각부터 발송 완료까지의 지연
+            if scheduled_at is not None:
+                latency = time.time() - scheduled_at
+                metrics.incr("delivery_latency_seconds", round(latency, 3))
+                logging.info(f"예정 시각 대비 발송 지연: {latency:.1f}초")
+                
+            run.status = "ok"
+            logging.info("일일 뉴스 요약 작업 완료")
+            
+        except Exception as e:
+            run.status = "error"
+            logging.error(f"작업 실행 중 오류 발생: {e}")
 
 if __name__ == "__main__":
-    # 필수 환경 변수 존재 여부 확인
-    required_env_vars = ["EMAIL_USERNAME", "EMAIL_PASSWORD"]
-    missing_vars = [var for var in required_env_vars if not os.getenv(var)]
-    
-    if missing_vars:
-        logging.error(f"필수 환경 변수가 설정되지 않음: {', '.join(missing_vars)}")
-        exit(1)
-
-    # 프로그램 시작 시 즉시 작업 실행
-    job()
-    
-    # 매일 오전 8시에 실행되도록 스케줄 설정
-    schedule.every().day.at("08:00").do(job)
-    
-    # 스케줄러 무한 루프 실행
-    logging.info("스케줄러 실행 중...")
-    while True:
-        schedule.run_pending()  # 예약된 작업 실행
-        time.sleep(60)  # 1분마다 스케줄 확인
-
+    # 명령행 처리는 modules/cli.py (cli가 "main"으로 임포트할 때 이 모듈을 다시 실행하지 않도록 등록)
+    sys.modules.setdefault("main", sys.modules[__name__])
+    from modules.cli import main as cli_main
+    sys.exit(cli_main())
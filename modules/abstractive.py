@@ -0,0 +1,134 @@
+import os
+import sys
+import time
+import logging
+import resource
+import threading
+from typing import List, Optional
+
+# 생성형 요약 설정
+# BRIEFY_ABSTRACTIVE_MODEL: 로컬 seq2seq 모델 디렉토리 (오프라인 로딩)
+# BRIEFY_ABSTRACTIVE_THREADS: 추론에 사용할 최대 CPU 스레드 수
+# BRIEFY_ABSTRACTIVE_BATCH: 한 번에 생성할 기사 수
+# BRIEFY_ABSTRACTIVE_QUANTIZE: 동적 int8 양자화 사용 여부 (1: 사용)
+MODEL_DIR = os.getenv("BRIEFY_ABSTRACTIVE_MODEL", "models/summarizer")
+NUM_THREADS = int(os.getenv("BRIEFY_ABSTRACTIVE_THREADS", "2"))
+BATCH_SIZE = int(os.getenv("BRIEFY_ABSTRACTIVE_BATCH", "8"))
+QUANTIZE = os.getenv("BRIEFY_ABSTRACTIVE_QUANTIZE", "0") == "1"
+MAX_INPUT_TOKENS = 512
+MAX_OUTPUT_TOKENS = 128
+
+_model = None
+_tokenizer = None
+_model_lock = threading.Lock()
+
+def model_version() -> str:
+    """
+    요약 캐시 키에 사용할 모델 식별자를 반환하는 함수
+
+    Returns:
+        str: 모델 디렉토리 이름과 양자화 여부를 포함한 버전 문자열
+    """
+    name = os.path.basename(os.path.normpath(MODEL_DIR))
+    return f"abstractive-1:{name}:{'int8' if QUANTIZE else 'fp32'}"
+
+def _load_model():
+    """
+    로컬 디렉토리에서 토크나이저와 모델을 처음 사용할 때 한 번만 불러오는 함수
+
+    Note:
+        - torch/transformers는 이 함수에서 처음 임포트 (추출적 요약만 쓸 때 시작 비용 없음)
+        - 불러온 모델은 프로세스가 끝날 때까지 메모리에 유지 (스케줄러에서 재사용)
+        - 네트워크에 접근하지 않도록 오프라인 모드로 로딩
+    """
+    global _model, _tokenizer
+    if _model is not None:
+        return _model, _tokenizer
+
+    with _model_lock:
+        if _model is not None:
+            return _model, _tokenizer
+
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        if not os.path.isdir(MODEL_DIR):
+            raise FileNotFoundError(f"요약 모델 디렉토리가 없습니다: {MODEL_DIR}")
+
+        start = time.perf_counter()
+        torch.set_num_threads(NUM_THREADS)
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_DIR, local_files_only=True)
+        model = AutoModelForSeq2SeqLM.from_pretrained(MODEL_DIR, local_files_only=True)
+        model.eval()
+
+        if QUANTIZE:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+        _tokenizer = tokenizer
+        _model = model
+        logging.info(f"요약 모델 로딩 완료: {MODEL_DIR} ({time.perf_counter() - start:.1f}초)")
+        return _model, _tokenizer
+
+def peak_rss_mb() -> float:
+    """
+    현재 프로세스의 최대 RSS를 MB 단위로 반환하는 함수
+    """
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss 단위: Linux는 KB, macOS는 바이트
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+def summarize_batch(texts: List[str], batch_size: int = BATCH_SIZE) -> List[Optional[str]]:
+    """
+    seq2seq 모델로 여러 기사를 생성형 요약하는 함수
+
+    Args:
+        texts (List[str]): 요약할 기사 본문 목록
+        batch_size (int): 한 번에 생성할 기사 수
+
+    Returns:
+        List[Optional[str]]: 입력 순서대로의 요약 결과 (실패한 기사는 None)
+
+    Note:
+        - 토큰 길이순으로 정렬해 비슷한 길이끼리 배치를 구성 (패딩 낭비 최소화)
+        - torch와 BLAS 스레드 수를 BRIEFY_ABSTRACTIVE_THREADS로 제한
+        - 처리량(기사/초)과 최대 RSS를 로그로 기록
+    """
+    results: List[Optional[str]] = [None] * len(texts)
+    if not texts:
+        return results
+
+    import torch
+    from threadpoolctl import threadpool_limits
+
+    model, tokenizer = _load_model()
+    start = time.perf_counter()
+
+    encoded = tokenizer(texts, truncation=True, max_length=MAX_INPUT_TOKENS)
+    order = sorted(range(len(texts)), key=lambda idx: len(encoded["input_ids"][idx]))
+
+    with threadpool_limits(limits=NUM_THREADS), torch.inference_mode():
+        for begin in range(0, len(order), batch_size):
+            bucket = order[begin:begin + batch_size]
+            batch = tokenizer.pad(
+                {key: [encoded[key][idx] for idx in bucket] for key in encoded.keys()},
+                return_tensors="pt"
+            )
+            try:
+                outputs = model.generate(**batch, max_new_tokens=MAX_OUTPUT_TOKENS, num_beams=1)
+            except Exception as e:
+                logging.error(f"생성형 요약 실패 (배치 {begin // batch_size + 1}): {e}")
+                continue
+
+            for idx, summary in zip(bucket, tokenizer.batch_decode(outputs, skip_special_tokens=True)):
+                summary = summary.strip()
+                results[idx] = summary or None
+
+    elapsed = time.perf_counter() - start
+    logging.info(
+        f"생성형 요약 완료: {len(texts)}개, {len(texts) / elapsed:.2f}개/초, "
+        f"최대 RSS {peak_rss_mb():.0f}MB"
+    )
+    return results
@@ -0,0 +1,372 @@
+import os
+import json
+import mmap
+import zlib
+import struct
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from modules.article import Article
+from modules.article_cache import CACHE_DIR
+
+# 다이제스트 보관소 설정
+# BRIEFY_ARCHIVE: 실행마다 다이제스트에 넣은 기사와 요약을 보관소에 추가할지 (1: 사용, 0: 사용 안 함)
+# BRIEFY_ARCHIVE_DIR: 보관소 디렉토리 (기본값: BRIEFY_CACHE_DIR/archive, CI 실행 간 유지 가능)
+# BRIEFY_ARCHIVE_SEGMENT_BYTES: 세그먼트 파일 하나의 최대 크기 (바이트, 넘으면 다음 세그먼트에 추가)
+ARCHIVE = os.getenv("BRIEFY_ARCHIVE", "1") == "1"
+ARCHIVE_DIR = os.getenv("BRIEFY_ARCHIVE_DIR", os.path.join(CACHE_DIR, "archive"))
+SEGMENT_BYTES = int(os.getenv("BRIEFY_ARCHIVE_SEGMENT_BYTES", str(16 * 1024 * 1024)))
+
+# 블록 헤더: 매직, 압축된 본문 길이, 본문 CRC32
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"BFA1"
+_INDEX_FILE = "index.tsv"
+# 압축을 풀어 둘 최근 블록 수
+_FRAME_CACHE = 32
+# 검색 기간의 기사가 이 수 이하이면 역색인 없이 직접 확인 (최근 30일 검색에 전체 역색인을 만들지 않음)
+_SCAN_LIMIT = 2000
+
+# 색인 항목: (세그먼트 번호, 블록 위치, 블록 안 기사 순서, 날짜, URL)
+Entry = Tuple[int, int, int, str, str]
+
+def _segment_name(segment: int) -> str:
+    return f"segment-{segment:06d}.bin"
+
+def _search_text(article: Dict) -> str:
+    return f"{article.get('title', '')}\n{article.get('summary') or ''}".casefold()
+
+def _bigrams(text: str) -> Set[str]:
+    """검색 색인용 두 글자 조각 (공백으로 나눈 단어 안에서만)"""
+    grams = set()
+    for word in text.split():
+        grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+class DigestArchive:
+    """
+    다이제스트에 넣은 기사와 요약을 날짜별로 쌓아 두는 추가 전용 보관소
+
+    실행 한 번의 기사 목록을 zlib으로 압축한 블록 하나로 세그먼트 파일 끝에 덧붙이고,
+    기사마다 (날짜, 세그먼트, 블록 위치, 순서, URL) 한 줄을 색인 파일에 추가한다. 기존 데이터는
+    고치지 않으므로 쓰기는 파일 끝 추가와 fsync 한 번이며, 읽기는 세그먼트를 mmap으로 열어
+    필요한 블록만 압축을 푼다. URL과 날짜 조회는 메모리에 올린 색인으로, 요약 전문 검색은
+    처음 검색할 때 만드는 두 글자 역색인으로 처리한다.
+
+    Note:
+        - 쓰기 도중 중단되어 잘린 블록은 다음에 열 때 CRC로 찾아 잘라내고, 색인에 없는 블록은 다시 색인
+        - 색인 파일이 없거나 손상되면 세그먼트를 처음부터 읽어 다시 생성
+        - 같은 URL을 여러 번 보관하면 조회와 검색은 가장 최근 기록을 사용
+    """
+
+    def __init__(self, directory: str = ARCHIVE_DIR, segment_bytes: int = SEGMENT_BYTES):
+        """
+        Args:
+            directory (str): 보관소 디렉토리 (없으면 생성)
+            segment_bytes (int): 세그먼트 파일 하나의 최대 크기 (바이트)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.RLock()
+        self._entries: List[Entry] = []
+        self._urls: Dict[str, int] = {}
+        self._dates: Dict[str, List[int]] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._frames: "OrderedDict[Tuple[int, int], List[Dict]]" = OrderedDict()
+        self._postings: Optional[Dict[str, Set[int]]] = None
+        self._segment = 1
+
+        with self._lock:
+            self._open()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _open(self):
+        """색인 파일을 읽고, 색인에 없는 블록을 세그먼트에서 찾아 색인에 추가"""
+        segments = sorted(int(name[8:14]) for name in os.listdir(self.directory)
+                          if name.startswith("segment-") and name.endswith(".bin") and name[8:14].isdigit())
+        if segments:
+            self._segment = segments[-1]
+
+        index_path = self._path(_INDEX_FILE)
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        raise ValueError("마지막 줄이 잘림")
+                    date, segment, offset, position, url = line[:-1].split("\t", 4)
+                    self._add((int(segment), int(offset), int(position), date, url))
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            logging.warning(f"보관소 색인이 손상되어 다시 만듭니다: {e}")
+            self._entries, self._urls, self._dates = [], {}, {}
+            os.remove(index_path)
+
+        # 세그먼트마다 색인에 있는 마지막 블록부터 다시 읽음 (블록을 쓴 뒤 색인을 쓰기 전에 중단된 경우)
+        indexed: Dict[int, Tuple[int, Set[int]]] = {}
+        for segment, offset, position, _, _ in self._entries:
+            last = indexed.get(segment)
+            if last is None or last[0] < offset:
+                indexed[segment] = (offset, {position})
+            elif last[0] == offset:
+                last[1].add(position)
+        lines = []
+        for segment in segments:
+            path = self._path(_segment_name(segment))
+            offset, positions = indexed.get(segment, (0, set()))
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                while offset < size:
+                    f.seek(offset)
+                    frame = self._read_frame(f.read(_HEADER.size), f, size - offset)
+                    if frame is None:
+                        break
+                    length, date, articles = frame
+                    missing = [(position, article) for position, article in enumerate(articles)
+                               if position not in positions]
+                    if missing:
+                        lines.append(self._index(segment, offset, date, missing))
+                    positions = set()
+                    offset += _HEADER.size + length
+            if offset < size:
+                logging.warning(f"보관소 세그먼트의 손상된 끝부분을 잘라냅니다: {path} ({size - offset}바이트)")
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+        if lines:
+            with open(index_path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _read_frame(header: bytes, f, available: int) -> Optional[Tuple[int, str, List[Dict]]]:
+        """파일에서 블록 하나를 읽어 검증하는 함수 (잘리거나 손상된 블록이면 None)"""
+        if len(header) < _HEADER.size:
+            return None
+        magic, length, crc = _HEADER.unpack(header)
+        if magic != _MAGIC or _HEADER.size + length > available:
+            return None
+        payload = f.read(length)
+        if zlib.crc32(payload) != crc:
+            return None
+        data = json.loads(zlib.decompress(payload))
+        return length, data["date"], data["articles"]
+
+    def _add(self, entry: Entry) -> int:
+        number = len(self._entries)
+        self._entries.append(entry)
+        self._urls[entry[4]] = number
+        self._dates.setdefault(entry[3], []).append(number)
+        return number
+
+    def _index(self, segment: int, offset: int, date: str, articles: Iterable[Tuple[int, Dict]]) -> str:
+        """블록 하나의 (순서, 기사)를 메모리 색인(검색 색인 포함)에 추가하고 색인 파일에 쓸 줄을 반환"""
+        lines = []
+        for position, article in articles:
+            url = article["link"]
+            number = self._add((segment, offset, position, date, url))
+            if self._postings is not None:
+                for gram in _bigrams(_search_text(article)):
+                    self._postings.setdefault(gram, set()).add(number)
+            lines.append(f"{date}\t{segment}\t{offset}\t{position}\t{url}\n")
+        return "".join(lines)
+
+    def append(self, articles: Iterable[Article], date: str) -> int:
+        """
+        기사 목록을 보관소 끝에 추가하는 함수
+
+        Args:
+            articles (Iterable[Article]): 다이제스트에 넣은 기사 (요약 포함)
+            date (str): 다이제스트 날짜 (YYYYMMDD)
+
+        Returns:
+            int: 보관한 기사 수
+        """
+        records = [article.to_dict() for article in articles]
+        if not records:
+            return 0
+        payload = zlib.compress(json.dumps({"date": date, "articles": records}, ensure_ascii=False).encode("utf-8"))
+        frame = _HEADER.pack(_MAGIC, len(payload), zlib.crc32(payload)) + payload
+
+        with self._lock:
+            path = self._path(_segment_name(self._segment))
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            if size and size + len(frame) > self.segment_bytes:
+                self._segment += 1
+                path = self._path(_segment_name(self._segment))
+                size = 0
+            with open(path, "ab") as f:
+                f.write(frame)
+                f.flush()
+                os.fsync(f.fileno())
+            lines = self._index(self._segment, size, date, enumerate(records))
+            with open(self._path(_INDEX_FILE), "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        return len(records)
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        """세그먼트의 mmap을 반환하는 함수 (end까지 덮지 못하면 파일이 늘어난 것이므로 다시 매핑)"""
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with open(self._path(_segment_name(segment)), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def _frame(self, segment: int, offset: int) -> List[Dict]:
+        """블록의 기사 목록을 반환하는 함수 (최근 블록은 압축을 푼 채로 보관)"""
+        key = (segment, offset)
+        articles = self._frames.get(key)
+        if articles is not None:
+            self._frames.move_to_end(key)
+            return articles
+        start = offset + _HEADER.size
+        _, length, _ = _HEADER.unpack_from(self._map(segment, start), offset)
+        payload = self._map(segment, start + length)[start:start + length]
+        articles = json.loads(zlib.decompress(payload))["articles"]
+        self._frames[key] = articles
+        if len(self._frames) > _FRAME_CACHE:
+            self._frames.popitem(last=False)
+        return articles
+
+    def _load(self, number: int) -> Dict:
+        segment, offset, position, _, _ = self._entries[number]
+        return self._frame(segment, offset)[position]
+
+    def get(self, url: str) -> Optional[Article]:
+        """
+        URL로 가장 최근에 보관한 기사를 찾는 함수
+
+        Args:
+            url (str): 기사 URL
+
+        Returns:
+            Optional[Article]: 보관된 기사, 없으면 None
+        """
+        with self._lock:
+            number = self._urls.get(url)
+            return Article.from_dict(self._load(number)) if number is not None else None
+
+    def by_date(self, date: str) -> List[Article]:
+        """
+        날짜의 다이제스트에 넣은 기사를 반환하는 함수
+
+        Args:
+            date (str): 다이제스트 날짜 (YYYYMMDD)
+
+        Returns:
+            List[Article]: 보관한 순서의 기사 목록 (같은 날 여러 번 실행했으면 모두 포함)
+        """
+        with self._lock:
+            return [Article.from_dict(self._load(number)) for number in self._dates.get(date, [])]
+
+    def dates(self) -> List[str]:
+        """보관된 다이제스트 날짜 목록 (오름차순)"""
+        with self._lock:
+            return sorted(self._dates)
+
+    def search(self, query: str, since: Optional[str] = None, until: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Article]:
+        """
+        보관된 기사의 제목과 요약을 검색하는 함수
+
+        Args:
+            query (str): 검색어 (공백으로 나눈 단어를 모두 포함하는 기사, 빈 문자열이면 기간 안의 모든 기사)
+            since (Optional[str]): 이 날짜(YYYYMMDD) 이후의 다이제스트만 검색
+            until (Optional[str]): 이 날짜(YYYYMMDD) 이전의 다이제스트만 검색
+            limit (Optional[int]): 최대 결과 수
+
+        Returns:
+            List[Article]: 최근 다이제스트 순의 기사 목록 (URL마다 가장 최근 기록 하나)
+
+        Note:
+            - 대소문자를 구분하지 않고, 한국어는 띄어쓰기와 관계없이 포함 여부로 판단 (KeywordMatcher와 같은 기준)
+            - 기간 안의 기사가 많으면 두 글자 역색인(처음 필요할 때 생성)으로 후보를 줄인 뒤
+              후보 기사의 압축만 풀어 실제 포함 여부를 확인
+        """
+        terms = [term for term in query.casefold().split() if term]
+        with self._lock:
+            selected = []
+            for date, numbers in self._dates.items():
+                if (since and date < since) or (until and date > until):
+                    continue
+                selected.extend(number for number in numbers if self._urls[self._entries[number][4]] == number)
+
+            if terms and (self._postings is not None or len(selected) > _SCAN_LIMIT):
+                # 한 글자 검색어는 두 글자 조각으로 거를 수 없으므로 직접 확인만 함
+                for term in (term for term in terms if len(term) > 1):
+                    postings = self._term_postings(term)
+                    selected = [number for number in selected if number in postings]
+                    if not selected:
+                        return []
+            # 최근 다이제스트부터 (같은 날짜는 나중에 보관한 순)
+            selected.sort(key=lambda number: (self._entries[number][3], number), reverse=True)
+
+            results = []
+            for number in selected:
+                article = self._load(number)
+                if terms:
+                    text = _search_text(article)
+                    if not all(term in text for term in terms):
+                        continue
+                results.append(Article.from_dict(article))
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+    def _term_postings(self, term: str) -> Set[int]:
+        """두 글자 이상의 검색어 하나를 포함할 수 있는 기사 번호 (두 글자 조각이 모두 있는 기사)"""
+        if self._postings is None:
+            self._postings = {}
+            for number in range(len(self._entries)):
+                for gram in _bigrams(_search_text(self._load(number))):
+                    self._postings.setdefault(gram, set()).add(number)
+        sets = sorted((self._postings.get(gram, set()) for gram in _bigrams(term)), key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._urls
+
+    def close(self):
+        """열어 둔 mmap과 압축을 푼 블록을 정리하는 함수"""
+        with self._lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+            self._frames.clear()
+
+_archive: Optional[DigestArchive] = None
+_archive_lock = threading.Lock()
+
+def get_archive() -> Optional[DigestArchive]:
+    """
+    프로세스 전체에서 공유하는 다이제스트 보관소를 반환하는 함수
+
+    Returns:
+        Optional[DigestArchive]: 공유 보관소, 보관소를 사용하지 않거나 열 수 없는 경우 None
+    """
+    global _archive
+    if not ARCHIVE:
+        return None
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                try:
+                    _archive = DigestArchive()
+                except Exception as e:
+                    logging.warning(f"다이제스트 보관소를 열 수 없어 보관하지 않습니다: {e}")
+                    return None
+    return _archive
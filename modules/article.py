@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+class Article:
+    """
+    수집부터 요약, PDF 렌더링, 보관까지 모든 모듈이 공유하는 기사 기록
+
+    __slots__를 사용하여 기사마다 딕셔너리(키 문자열 해시 테이블)를 두지 않으므로 기사 하나의 크기가
+    같은 항목의 딕셔너리보다 작다. 요약 단계는 새 기록을 만들지 않고 summary만 채운다.
+
+    Note:
+        - 언론사, 카테고리, 시각이 없으면 기존 기본값("Unknown", "세계", 생성 시각) 사용
+        - JSON 입출력(main.py fetch/summarize/render 명령, 처리 기록 저장소, 보관소)은
+          to_dict/from_dict로 변환
+    """
+
+    __slots__ = ("title", "link", "press", "category", "timestamp", "summary", "alternates")
+
+    def __init__(self, title: str, link: str, press: Optional[str] = "Unknown", category: Optional[str] = "세계",
+                 timestamp: Optional[str] = None, summary: Optional[str] = None,
+                 alternates: Optional[List[Dict]] = None):
+        """
+        Args:
+            title (str): 기사 제목
+            link (str): 기사 URL
+            press (Optional[str]): 언론사
+            category (Optional[str]): 카테고리 (섹션 이름)
+            timestamp (Optional[str]): 수집 시각 (YYYY-MM-DD HH:MM:SS, 기본값: 현재 시각)
+            summary (Optional[str]): 기사 요약 (요약 전에는 None)
+            alternates (Optional[List[Dict]]): 같은 기사를 보도한 다른 출처 ({"press", "link"} 목록)
+        """
+        self.title = title
+        self.link = link
+        self.press = press or "Unknown"
+        self.category = category or "세계"
+        self.timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.summary = summary
+        self.alternates = alternates if alternates is not None else []
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Article":
+        """
+        딕셔너리(JSON)로 기사 기록을 만드는 함수
+
+        Args:
+            data (Dict): title, link와 나머지 항목 (content 등 다른 키는 무시)
+
+        Returns:
+            Article: 기사 기록
+        """
+        return cls(data["title"], data["link"], data.get("press"), data.get("category"), data.get("timestamp"),
+                   data.get("summary"), data.get("alternates"))
+
+    def to_dict(self) -> Dict:
+        """JSON으로 직렬화할 수 있는 딕셔너리로 반환하는 함수 (요약 전이면 summary 제외)"""
+        data = {"title": self.title}
+        if self.summary is not None:
+            data["summary"] = self.summary
+        data.update(link=self.link, press=self.press, category=self.category, timestamp=self.timestamp,
+                    alternates=self.alternates)
+        return data
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Article):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __hash__(self) -> int:
+        # 같은 기사는 링크가 같고 링크는 생성 후 바뀌지 않으므로 링크로 해시 (요약 등을 채워도 그대로)
+        return hash(self.link)
+
+    def __repr__(self) -> str:
+        return f"Article({self.title!r}, {self.link!r})"
@@ -0,0 +1,163 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import closing
+from typing import Dict, Optional
+
+# 기사 캐시 설정
+# BRIEFY_CACHE_DIR: 캐시 파일을 저장할 디렉토리 (CI 실행 간 유지 가능)
+# BRIEFY_CACHE_TTL: 캐시 항목 유효 기간 (초, 기본값: 7일)
+# BRIEFY_CACHE_MAX_BYTES: 캐시에 저장할 본문 텍스트의 최대 총 크기 (바이트)
+CACHE_DIR = os.getenv("BRIEFY_CACHE_DIR", ".cache")
+CACHE_TTL = int(os.getenv("BRIEFY_CACHE_TTL", str(7 * 24 * 3600)))
+CACHE_MAX_BYTES = int(os.getenv("BRIEFY_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_accessed_at ON articles(accessed_at);
+"""
+
+class ArticleCache:
+    """
+    URL을 키로 기사 본문과 검증자(ETag, Last-Modified)를 저장하는 디스크 캐시
+
+    SQLite(WAL 모드)를 사용하므로 여러 프로세스가 같은 캐시 파일을 안전하게 공유할 수 있다.
+    유효 기간(TTL)이 지난 항목은 삭제되고, 총 크기가 제한을 넘으면
+    가장 오래 사용되지 않은 항목부터 제거된다 (LRU).
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: int = CACHE_TTL, max_bytes: int = CACHE_MAX_BYTES):
+        """
+        Args:
+            path (Optional[str]): 캐시 파일 경로 (기본값: BRIEFY_CACHE_DIR/articles.sqlite3)
+            ttl (int): 캐시 항목 유효 기간 (초)
+            max_bytes (int): 저장할 본문 텍스트의 최대 총 크기 (바이트)
+        """
+        if path is None:
+            path = os.path.join(CACHE_DIR, "articles.sqlite3")
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 작업마다 새 연결을 사용하여 스레드/프로세스 간 공유 문제를 피함
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        캐시된 기사 정보를 조회하는 함수
+
+        Args:
+            url (str): 기사 URL
+
+        Returns:
+            Optional[Dict]: content, etag, last_modified 키를 포함하는 딕셔너리,
+            없거나 유효 기간이 지난 경우 None
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT content, etag, last_modified, stored_at FROM articles WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            content, etag, last_modified, stored_at = row
+            now = time.time()
+            if now - stored_at > self.ttl:
+                conn.execute("DELETE FROM articles WHERE url = ?", (url,))
+                return None
+            conn.execute("UPDATE articles SET accessed_at = ? WHERE url = ?", (now, url))
+
+        return {"content": content, "etag": etag, "last_modified": last_modified}
+
+    def touch(self, url: str):
+        """
+        재검증(304 응답)된 항목의 저장 시각과 사용 시각을 갱신하는 함수
+
+        Args:
+            url (str): 기사 URL
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE articles SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url)
+            )
+
+    def put(self, url: str, content: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        기사 본문과 검증자를 캐시에 저장하는 함수
+
+        Args:
+            url (str): 기사 URL
+            content (str): 추출된 기사 본문
+            etag (Optional[str]): 응답의 ETag 헤더 값
+            last_modified (Optional[str]): 응답의 Last-Modified 헤더 값
+        """
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO articles "
+                "(url, content, etag, last_modified, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, content, etag, last_modified, size, now, now)
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """유효 기간이 지난 항목과 크기 제한을 넘는 LRU 항목을 제거"""
+        conn.execute("DELETE FROM articles WHERE stored_at < ?", (now - self.ttl,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        removed = 0
+        for url, size in conn.execute("SELECT url, size FROM articles ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM articles WHERE url = ?", (url,))
+            total -= size
+            removed += 1
+        logging.debug(f"기사 캐시 정리: {removed}개 항목 제거")
+
+_cache: Optional[ArticleCache] = None
+_cache_lock = threading.Lock()
+
+def get_cache() -> Optional[ArticleCache]:
+    """
+    프로세스 전체에서 공유하는 기사 캐시를 반환하는 함수
+
+    Returns:
+        Optional[ArticleCache]: 공유 캐시, 캐시를 열 수 없는 경우 None
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = ArticleCache()
+                except Exception as e:
+                    logging.warning(f"기사 캐시를 열 수 없습니다: {e}")
+                    return None
+    return _cache
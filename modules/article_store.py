@@ -0,0 +1,254 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import closing
+from typing import Dict, Iterable, List, Optional, Set
+
+from modules.article import Article
+from modules.article_cache import CACHE_DIR
+
+# 처리 기록 저장소 설정
+# BRIEFY_INCREMENTAL: 이전 실행에서 처리한 기사를 건너뛰는 증분 실행 여부 (1: 사용, 0: 매번 전체 처리)
+# BRIEFY_STORE_RETENTION_DAYS: 처리 기록 보관 기간 (일)
+INCREMENTAL = os.getenv("BRIEFY_INCREMENTAL", "1") == "1"
+RETENTION_DAYS = float(os.getenv("BRIEFY_STORE_RETENTION_DAYS", "30"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    content_hash TEXT,
+    title TEXT NOT NULL,
+    press TEXT,
+    category TEXT,
+    timestamp TEXT,
+    summary TEXT,
+    alternates TEXT NOT NULL DEFAULT '[]',
+    processed_at REAL NOT NULL,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_content_hash ON articles(content_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_processed_at ON articles(processed_at);
+"""
+
+def content_hash(text: str) -> str:
+    """
+    기사 본문의 콘텐츠 해시를 생성하는 함수
+
+    Args:
+        text (str): 기사 본문
+
+    Returns:
+        str: 공백을 정규화한 본문의 SHA-256 해시 (URL이 달라도 같은 본문이면 같은 값)
+    """
+    return hashlib.sha256(re.sub(r'\s+', ' ', text).strip().encode("utf-8")).hexdigest()
+
+class ArticleStore:
+    """
+    처리한 기사와 요약을 기록하는 영구 저장소
+
+    URL과 본문 해시로 색인하여, 다음 실행에서 이미 처리한 기사는 다운로드와 요약을 건너뛰고
+    저장된 요약을 재사용한다. 기사 캐시(ArticleCache)와 달리 크기 기반으로 지우지 않으며,
+    보관 기간이 지난 기록만 삭제한다.
+    """
+
+    def __init__(self, path: Optional[str] = None, retention_days: float = RETENTION_DAYS):
+        """
+        Args:
+            path (Optional[str]): 저장소 파일 경로 (기본값: BRIEFY_CACHE_DIR/store.sqlite3)
+            retention_days (float): 처리 기록 보관 기간 (일)
+        """
+        if path is None:
+            path = os.path.join(CACHE_DIR, "store.sqlite3")
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.retention = retention_days * 24 * 3600
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            conn.execute("DELETE FROM articles WHERE processed_at < ?", (time.time() - self.retention,))
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def seen_urls(self, urls: Iterable[str]) -> Set[str]:
+        """
+        이미 처리한 기사 URL을 한 번의 조회로 찾는 함수
+
+        Args:
+            urls (Iterable[str]): 확인할 기사 URL 목록
+
+        Returns:
+            Set[str]: 요약까지 완료되어 저장된 URL 집합
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return set()
+        seen = set()
+        with closing(self._connect()) as conn:
+            # SQLite 변수 개수 제한을 넘지 않도록 나누어 조회
+            for begin in range(0, len(urls), 500):
+                chunk = urls[begin:begin + 500]
+                rows = conn.execute(
+                    f"SELECT url FROM articles WHERE summary IS NOT NULL AND url IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                seen.update(row[0] for row in rows)
+        return seen
+
+    def get(self, url: str) -> Optional[Article]:
+        """
+        URL로 저장된 기사 기록을 조회하는 함수
+
+        Returns:
+            Optional[Article]: 요약된 기사, 없으면 None
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT title, summary, url, press, category, timestamp, alternates "
+                "FROM articles WHERE url = ? AND summary IS NOT NULL",
+                (url,)
+            ).fetchone()
+        return _to_record(row) if row else None
+
+    def summary_for_hash(self, digest: str) -> Optional[str]:
+        """
+        같은 본문으로 이미 만든 요약을 찾는 함수 (다른 URL로 재배포된 기사)
+
+        Args:
+            digest (str): content_hash로 생성한 본문 해시
+
+        Returns:
+            Optional[str]: 저장된 요약, 없으면 None
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT summary FROM articles WHERE content_hash = ? AND summary IS NOT NULL LIMIT 1",
+                (digest,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, record: Article, digest: Optional[str]):
+        """
+        요약한 기사를 저장하는 함수
+
+        Args:
+            record (Article): 요약된 기사
+            digest (Optional[str]): 본문 해시
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO articles "
+                "(url, content_hash, title, press, category, timestamp, summary, alternates, processed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET content_hash = excluded.content_hash, "
+                "summary = excluded.summary, alternates = excluded.alternates",
+                (
+                    record.link, digest, record.title, record.press, record.category,
+                    record.timestamp, record.summary,
+                    json.dumps(record.alternates, ensure_ascii=False), time.time()
+                )
+            )
+
+    def update_alternates(self, url: str, alternates: List[Dict]):
+        """
+        저장된 기사의 다른 출처 목록을 갱신하는 함수
+        (스트리밍 처리에서 대표 기사를 저장한 뒤에 중복 기사가 발견된 경우)
+
+        Args:
+            url (str): 대표 기사 URL
+            alternates (List[Dict]): 다른 출처 목록 전체
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE articles SET alternates = ? WHERE url = ?",
+                         (json.dumps(alternates, ensure_ascii=False), url))
+
+    def mark_sent(self, urls: Iterable[str]):
+        """
+        발송된 다이제스트에 포함된 기사를 표시하는 함수
+
+        Args:
+            urls (Iterable[str]): 발송된 기사 URL 목록
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("UPDATE articles SET sent_at = ? WHERE url = ?", [(now, url) for url in urls])
+
+    def unsent(self, since: float, limit: int = 10) -> List[Article]:
+        """
+        기간 안에 처리했지만 아직 발송하지 않은 기사를 반환하는 함수
+        (발송 전에 미리 수집/요약한 기사, 발송에 실패한 기사)
+
+        Args:
+            since (float): 시작 시각 (Unix 시간)
+            limit (int): 최대 기사 수 (넘으면 최근 처리한 기사 우선)
+
+        Returns:
+            List[Article]: 요약된 기사 목록 (처리한 순서)
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT title, summary, url, press, category, timestamp, alternates FROM ("
+                "SELECT *, rowid AS seq FROM articles WHERE processed_at >= ? AND summary IS NOT NULL "
+                "AND sent_at IS NULL ORDER BY seq DESC LIMIT ?) ORDER BY seq",
+                (since, limit)
+            ).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def top_stories(self, since: float, limit: int = 10) -> List[Article]:
+        """
+        기간 안에 처리한 기사 중 주요 기사를 저장된 요약으로 반환하는 함수 ("오늘의 주요 뉴스" 등)
+
+        Args:
+            since (float): 시작 시각 (Unix 시간)
+            limit (int): 최대 기사 수
+
+        Returns:
+            List[Article]: 요약된 기사 목록 (다시 수집하거나 요약하지 않음)
+
+        Note:
+            - 같은 기사를 보도한 언론사가 많은 기사를 우선하고, 같으면 최근 처리한 기사 우선
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT title, summary, url, press, category, timestamp, alternates "
+                "FROM articles WHERE processed_at >= ? AND summary IS NOT NULL "
+                "ORDER BY json_array_length(alternates) DESC, processed_at DESC LIMIT ?",
+                (since, limit)
+            ).fetchall()
+        return [_to_record(row) for row in rows]
+
+def _to_record(row) -> Article:
+    title, summary, url, press, category, timestamp, alternates = row
+    return Article(title, url, press, category, timestamp, summary, json.loads(alternates))
+
+_store: Optional[ArticleStore] = None
+_store_lock = threading.Lock()
+
+def get_store() -> Optional[ArticleStore]:
+    """
+    프로세스 전체에서 공유하는 처리 기록 저장소를 반환하는 함수
+
+    Returns:
+        Optional[ArticleStore]: 공유 저장소, 증분 실행을 사용하지 않거나 열 수 없는 경우 None
+    """
+    global _store
+    if not INCREMENTAL:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = ArticleStore()
+                except Exception as e:
+                    logging.warning(f"처리 기록 저장소를 열 수 없어 전체 기사를 처리합니다: {e}")
+                    return None
+    return _store
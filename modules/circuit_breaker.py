@@ -0,0 +1,138 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict
+from urllib.parse import urlparse
+
+# 호스트별 차단기 설정
+# BRIEFY_BREAKER_FAILURES: 연속으로 몇 번 실패하면 해당 호스트로의 요청을 차단할지 (0: 사용 안 함)
+# BRIEFY_BREAKER_COOLDOWN: 차단 후 시험 요청 하나를 허용하기까지의 시간 (초)
+FAILURE_THRESHOLD = int(os.getenv("BRIEFY_BREAKER_FAILURES", "5"))
+COOLDOWN = float(os.getenv("BRIEFY_BREAKER_COOLDOWN", "30"))
+
+class CircuitOpenError(ConnectionError):
+    """차단된 호스트로 요청하려 할 때 발생하는 예외"""
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반의 차단기
+
+    closed: 모든 요청 허용, 연속 실패가 threshold에 도달하면 open
+    open: cooldown 동안 모든 요청 거부, 이후 half-open
+    half-open: 시험 요청 하나만 허용, 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN):
+        """
+        Args:
+            threshold (int): 차단할 연속 실패 횟수
+            cooldown (float): 차단 유지 시간 (초)
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        요청을 보내도 되는지 확인하는 함수
+
+        Returns:
+            bool: 허용하면 True (half-open 상태에서는 시험 요청 하나만 True)
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial = False
+            if self.state == self.HALF_OPEN:
+                if self._trial:
+                    return False
+                self._trial = True
+            return True
+
+    def record(self, ok: bool) -> bool:
+        """
+        요청 결과를 기록하는 함수
+
+        Args:
+            ok (bool): 요청 성공 여부
+
+        Returns:
+            bool: 이번 기록으로 차단 상태가 되었으면 True
+        """
+        with self._lock:
+            if ok:
+                self.state = self.CLOSED
+                self.failures = 0
+                return False
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                return opened
+            return False
+
+class HostCircuitBreaker:
+    """
+    호스트별로 독립된 차단기를 관리하는 차단기
+
+    실패하는 호스트에만 요청을 멈추므로 다른 호스트(다른 언론사 원문 등)의 수집은 계속된다.
+    """
+
+    def __init__(self, threshold: int = FAILURE_THRESHOLD, cooldown: float = COOLDOWN):
+        """
+        Args:
+            threshold (int): 차단할 연속 실패 횟수 (0이면 차단하지 않음)
+            cooldown (float): 차단 유지 시간 (초)
+        """
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.threshold, self.cooldown)
+                self._breakers[host] = breaker
+            return breaker
+
+    def allow(self, url: str) -> bool:
+        """
+        URL의 호스트로 요청을 보내도 되는지 확인하는 함수
+
+        Args:
+            url (str): 요청할 URL
+
+        Returns:
+            bool: 허용하면 True
+        """
+        if self.threshold <= 0:
+            return True
+        return self._breaker(urlparse(url).netloc.lower()).allow()
+
+    def record(self, url: str, ok: bool):
+        """
+        URL의 호스트에 요청 결과를 기록하는 함수
+
+        Args:
+            url (str): 요청한 URL
+            ok (bool): 요청 성공 여부 (연결 오류, 제한 시간 초과, 429/5xx 응답은 실패)
+        """
+        if self.threshold <= 0:
+            return
+        host = urlparse(url).netloc.lower()
+        if self._breaker(host).record(ok):
+            logging.warning(f"연속 {self.threshold}회 실패로 {self.cooldown:g}초 동안 요청을 차단합니다: {host}")
@@ -0,0 +1,300 @@
+import os
+import sys
+import json
+import logging
+import argparse
+from datetime import datetime
+
+import main as app                                  # 작업 실행(수집, 요약, 렌더링, 발송) 모듈
+from modules import metrics                         # 단계별 실행 계측 모듈 (표준 라이브러리만 사용)
+from modules import deadline                        # 작업 시간 예산 모듈 (표준 라이브러리만 사용)
+
+# 명령행 하위 명령 (fetch, summarize, render, search, send, run, serve)
+# 작업 실행 자체는 main.py에 두고, 이 모듈은 인자 해석과 명령별 입출력만 담당
+# 각 명령은 필요한 모듈만 함수 안에서 임포트하므로 run --dry-run 등은 무거운 의존성을 불러오지 않음
+
+def load_env():
+    """.env 파일의 환경 변수를 불러오는 함수 (이미 설정된 환경 변수는 유지)"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+def read_json(path):
+    """JSON 파일을 읽는 함수 ("-"이면 표준 입력)"""
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def write_json(data, path):
+    """JSON 파일로 저장하는 함수 ("-"이면 표준 출력)"""
+    if path == "-":
+        json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def cmd_fetch(args):
+    """기사 목록과 본문을 수집하여 JSON으로 저장"""
+    from modules.fetch_news import fetch_news
+    from modules.article_store import get_store
+    
+    articles = fetch_news(limit=args.limit, keyword_filter=args.keywords, store=get_store() if args.new_only else None,
+                          sections=args.sections, pages=args.pages)
+    contents = app.fetch_contents(articles)
+    collected = [dict(article.to_dict(), content=content) for article, content in zip(articles, contents) if content]
+    write_json(collected, args.output)
+    return 0 if collected else 1
+
+def cmd_summarize(args):
+    """수집된 기사 JSON(content 포함)을 요약하여 JSON으로 저장"""
+    from modules.article import Article
+    
+    entries = read_json(args.input)
+    articles = [Article.from_dict(entry) for entry in entries]
+    summarized = app.summarize_contents(articles, [entry.get("content") for entry in entries], args.summarizer)
+    write_json([article.to_dict() for article in summarized], args.output)
+    return 0 if summarized else 1
+
+def cmd_render(args):
+    """요약된 기사 JSON으로 PDF(또는 HTML 이메일 본문)를 생성하고 파일 경로를 출력"""
+    from modules.article import Article
+    
+    articles = [Article.from_dict(entry) for entry in read_json(args.input)]
+    date = args.date or datetime.now().strftime("%Y%m%d")
+    if args.format == "html":
+        from modules.renderers import get_renderer
+        
+        renderer = get_renderer("html")
+        path = renderer.filename(date)
+        with metrics.stage("render_html"):
+            written = renderer.render(articles, date, path)
+        if written is None:
+            logging.error("HTML을 생성할 수 없습니다")
+            return 1
+        print(path)
+        return 0
+    
+    from modules.create_pdf import create_news_pdf, stream_news_pdf
+    
+    with metrics.stage("render_pdf"):
+        if args.stream:
+            path = f"news_summary_{date}.pdf"
+            path = path if stream_news_pdf(articles, date, path) else None
+        else:
+            path = create_news_pdf(articles, date)
+    if not path:
+        logging.error("PDF를 생성할 수 없습니다")
+        return 1
+    print(path)
+    return 0
+
+def cmd_search(args):
+    """보관된 다이제스트에서 기사를 검색하여 JSON으로 저장 (render 명령의 입력으로 사용 가능)"""
+    from datetime import timedelta
+    from modules.archive import DigestArchive
+    
+    archive = DigestArchive()
+    try:
+        since = (datetime.now() - timedelta(days=args.days)).strftime("%Y%m%d") if args.days else None
+        found = archive.search(args.query, since=since, limit=args.limit)
+    finally:
+        archive.close()
+    logging.info(f"보관된 기사 {len(archive)}건 중 {len(found)}건 검색됨")
+    write_json([article.to_dict() for article in found], args.output)
+    return 0 if found else 1
+
+def cmd_send(args):
+    """PDF 파일(첨부) 또는 HTML 파일(본문)을 수신자에게 전송"""
+    recipients = [address.strip() for address in args.to.split(",") if address.strip()] if args.to else app.get_recipients()
+    if not recipients:
+        logging.error("이메일 수신자가 설정되지 않았습니다")
+        return 1
+    date = args.date or datetime.now().strftime("%Y%m%d")
+    if args.attachment.lower().endswith((".html", ".htm")):
+        with open(args.attachment, encoding="utf-8") as f:
+            html = f.read()
+        subject, body = app.digest_message(date, articles=[], title=app.section_title())
+        failed = app.send_digest(recipients, subject, body, None, html)
+    else:
+        subject, body = app.digest_message(date, title=app.section_title())
+        failed = app.send_digest(recipients, subject, body, args.attachment)
+    return 0 if len(failed) < len(recipients) else 1
+
+def dry_run():
+    """
+    수집이나 발송 없이 설정과 실행 계획을 확인하는 함수
+    
+    Returns:
+        int: 문제가 없으면 0, 실행할 수 없는 설정이면 1
+        
+    Note:
+        - 필요한 패키지는 임포트하지 않고 설치 여부만 확인 (시작 시간 측정 대상)
+    """
+    from importlib.util import find_spec
+    from modules.article_store import INCREMENTAL
+    from modules.article_cache import CACHE_DIR
+    from modules.scheduler import SCHEDULE, PREFETCH_LEAD, parse_schedule
+    
+    errors = []
+    
+    def report(ok, message):
+        print(f"[{'확인' if ok else '오류'}] {message}")
+        if not ok:
+            errors.append(message)
+    
+    from modules.subscribers import SUBSCRIBERS_FILE
+    from modules.renderers import DIGEST_FORMAT, FORMATS
+    formats = {DIGEST_FORMAT}
+    if os.path.exists(SUBSCRIBERS_FILE):
+        try:
+            entries = read_json(SUBSCRIBERS_FILE)
+            report(isinstance(entries, list) and bool(entries),
+                   f"구독자 파일 {SUBSCRIBERS_FILE}: {len(entries) if isinstance(entries, list) else 0}명")
+            if isinstance(entries, list):
+                formats.update(str(entry.get("format", DIGEST_FORMAT)).strip().lower()
+                               for entry in entries if isinstance(entry, dict))
+        except Exception as e:
+            report(False, f"구독자 파일 오류: {SUBSCRIBERS_FILE} - {e}")
+    else:
+        recipients = app.get_recipients()
+        report(bool(recipients), f"수신자 {len(recipients)}명")
+    report(bool(os.getenv("EMAIL_PASSWORD")), "EMAIL_PASSWORD 설정")
+    
+    packages = ["bs4", "requests", "lxml", "fpdf", "yagmail", "numpy"]
+    if app.SUMMARIZER == "textrank":
+        packages += ["sklearn", "scipy"]
+    elif app.SUMMARIZER == "abstractive":
+        from modules.abstractive import MODEL_DIR
+        packages += ["torch", "transformers", "threadpoolctl"]
+        report(os.path.isdir(MODEL_DIR), f"생성형 요약 모델 디렉토리: {MODEL_DIR}")
+    elif app.SUMMARIZER != "extractive":
+        report(False, f"지원하지 않는 요약 방식: {app.SUMMARIZER}")
+    unknown = sorted(formats - set(FORMATS))
+    report(not unknown, f"다이제스트 형식 {', '.join(sorted(formats))}" +
+           (f" (지원하지 않음: {', '.join(unknown)})" if unknown else ""))
+    renderers = {name for digest_format in formats for name in FORMATS.get(digest_format, ())}
+    if "html" in renderers:
+        packages += ["jinja2", "premailer"]
+    missing = [package for package in packages if find_spec(package) is None]
+    report(not missing, f"요약 방식 {app.SUMMARIZER}, 필요한 패키지 {len(packages)}개" +
+           (f" (없음: {', '.join(missing)})" if missing else ""))
+    
+    if "pdf" in renderers:
+        fonts = [os.path.join("fonts", name) for name in ("malgun.ttf", "malgunbd.ttf")]
+        report(all(os.path.exists(path) for path in fonts), f"PDF 폰트: {', '.join(fonts)}")
+    
+    try:
+        jobs = parse_schedule(SCHEDULE, app.job, app.prefetch)
+        report(bool(jobs), f"스케줄 {SCHEDULE} (미리 수집 {PREFETCH_LEAD:g}분 전)")
+    except Exception as e:
+        report(False, f"스케줄 설정 오류: {SCHEDULE} - {e}")
+    
+    print(f"[계획] 기사 10개 수집, 다이제스트 {app.DIGEST}, 실행 방식 {app.PIPELINE}, "
+          f"증분 실행 {'사용' if INCREMENTAL else '사용 안 함'}, "
+          f"시간 예산 {f'{deadline.TIME_BUDGET:g}초' if deadline.TIME_BUDGET else '제한 없음'}, "
+          f"캐시 디렉토리 {CACHE_DIR}")
+    return 1 if errors else 0
+
+def cmd_run(args):
+    """일일 작업을 한 번 실행"""
+    if args.dry_run:
+        return dry_run()
+    app.job()
+    last = metrics.last_run()
+    return 0 if last and last.status == "ok" else 1
+
+def cmd_serve(args):
+    """작업을 즉시 한 번 실행한 뒤 스케줄러로 계속 실행"""
+    import asyncio
+    from modules.scheduler import AsyncScheduler, parse_schedule, SCHEDULE
+    
+    # 필수 환경 변수 존재 여부 확인
+    required_env_vars = ["EMAIL_USERNAME", "EMAIL_PASSWORD"]
+    missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+    
+    if missing_vars:
+        logging.error(f"필수 환경 변수가 설정되지 않음: {', '.join(missing_vars)}")
+        return 1
+
+    # 프로그램 시작 시 즉시 작업 실행
+    app.job()
+    
+    # BRIEFY_SCHEDULE의 시각마다 실행 (기본값: 매일 오전 8시)
+    # 발송 BRIEFY_PREFETCH_LEAD분 전에 미리 수집/요약하여 발송 시각에는 변경분 수집, PDF 생성, 전송만 수행
+    scheduler = AsyncScheduler(parse_schedule(SCHEDULE, app.job, app.prefetch))
+    
+    # 스케줄러 실행 (중단될 때까지 반환하지 않음)
+    logging.info("스케줄러 실행 중...")
+    try:
+        asyncio.run(scheduler.run())
+    except KeyboardInterrupt:
+        logging.info("스케줄러 종료")
+    return 0
+
+def build_parser():
+    """명령행 인자 파서를 만드는 함수"""
+    parser = argparse.ArgumentParser(prog="main.py", description="Briefy 일일 뉴스 요약")
+    commands = parser.add_subparsers(dest="command", metavar="명령")
+    
+    fetch = commands.add_parser("fetch", help="기사 목록과 본문 수집 (JSON 출력)")
+    fetch.add_argument("-n", "--limit", type=int, default=10, help="수집할 최대 기사 수")
+    fetch.add_argument("-o", "--output", default="-", help="출력 JSON 경로 (기본값: 표준 출력)")
+    fetch.add_argument("--new-only", action="store_true", help="이전 실행에서 처리한 기사 제외")
+    fetch.add_argument("--sections", nargs="+", help="수집할 섹션 번호 (기본값: BRIEFY_SECTIONS)")
+    fetch.add_argument("--pages", type=int, help="섹션당 최대 목록 페이지 수 (기본값: BRIEFY_SECTION_PAGES)")
+    fetch.add_argument("--keywords", nargs="+", help="제목에 포함되어야 하는 키워드 (기본값: BRIEFY_KEYWORDS)")
+    fetch.set_defaults(func=cmd_fetch)
+    
+    summarize = commands.add_parser("summarize", help="수집된 기사 요약 (JSON 입출력)")
+    summarize.add_argument("-i", "--input", default="-", help="fetch 결과 JSON 경로 (기본값: 표준 입력)")
+    summarize.add_argument("-o", "--output", default="-", help="출력 JSON 경로 (기본값: 표준 출력)")
+    summarize.add_argument("--summarizer", choices=["extractive", "textrank", "abstractive"], default=None,
+                           help="요약 방식 (기본값: BRIEFY_SUMMARIZER)")
+    summarize.set_defaults(func=cmd_summarize)
+    
+    render = commands.add_parser("render", help="요약 JSON으로 PDF 또는 HTML 이메일 본문 생성")
+    render.add_argument("-i", "--input", default="-", help="summarize 결과 JSON 경로 (기본값: 표준 입력)")
+    render.add_argument("--date", help="날짜 (YYYYMMDD, 기본값: 오늘)")
+    render.add_argument("--format", choices=["pdf", "html"], default="pdf", help="출력 형식 (기본값: pdf)")
+    render.add_argument("--stream", action="store_true", help="구간 스트리밍 PDF 렌더링 (대량 기사용)")
+    render.set_defaults(func=cmd_render)
+    
+    search = commands.add_parser("search", help="보관된 다이제스트의 기사 요약 검색 (JSON 출력)")
+    search.add_argument("query", nargs="?", default="",
+                        help="검색어 (공백으로 구분한 단어를 모두 포함하는 기사, 생략하면 기간 안의 모든 기사)")
+    search.add_argument("--days", type=int, default=30, help="최근 며칠 동안의 다이제스트를 검색할지 (0: 전체)")
+    search.add_argument("-n", "--limit", type=int, default=10, help="최대 기사 수")
+    search.add_argument("-o", "--output", default="-", help="출력 JSON 경로 (기본값: 표준 출력)")
+    search.set_defaults(func=cmd_search)
+    
+    send = commands.add_parser("send", help="PDF(첨부) 또는 HTML(본문)을 이메일로 전송")
+    send.add_argument("attachment", help="첨부할 PDF 경로 또는 본문으로 보낼 HTML 경로 (.html)")
+    send.add_argument("--to", help="쉼표로 구분한 수신자 (기본값: EMAIL_RECIPIENTS 또는 EMAIL_USERNAME)")
+    send.add_argument("--date", help="제목에 사용할 날짜 (YYYYMMDD, 기본값: 오늘)")
+    send.set_defaults(func=cmd_send)
+    
+    run = commands.add_parser("run", help="일일 작업을 한 번 실행 (GitHub Actions용)")
+    run.add_argument("--dry-run", action="store_true", help="수집/발송 없이 설정과 실행 계획만 확인")
+    run.set_defaults(func=cmd_run)
+    
+    serve = commands.add_parser("serve", help="즉시 한 번 실행한 뒤 스케줄러 실행 (명령 생략 시 기본값)")
+    serve.set_defaults(func=cmd_serve)
+    return parser
+
+def main(argv=None):
+    """
+    명령행 진입점
+    
+    Note:
+        - 명령을 생략하면 기존처럼 즉시 실행 후 스케줄러 실행(serve)
+        - 각 명령은 필요한 모듈만 임포트하므로 run --dry-run 등은 무거운 의존성을 불러오지 않음
+    """
+    args = build_parser().parse_args(argv)
+    load_env()
+    if args.command is None:
+        return cmd_serve(args)
+    return args.func(args)
@@ -0,0 +1,89 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Sequence
+
+from jinja2 import Environment, Template, select_autoescape
+from premailer import Premailer
+
+from modules.article import Article
+from modules.renderers import DigestRenderer, digest_title
+
+# HTML 이메일 템플릿 디렉토리 (모듈 위치 기준)
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+TEMPLATE_NAME = "digest.html"
+
+# 프로세스 전체에서 재사용하는 컴파일된 템플릿 (CSS 인라인 완료)
+_template: Optional[Template] = None
+_template_lock = threading.Lock()
+
+def _load_template() -> Template:
+    """
+    다이제스트 HTML 템플릿을 프로세스당 한 번만 준비하는 함수
+
+    Returns:
+        Template: <style> 규칙을 각 요소의 style 속성으로 옮긴 뒤 컴파일한 Jinja2 템플릿
+
+    Note:
+        - 템플릿 원문에 premailer를 한 번 적용하므로 메시지마다 CSS 파싱/선택자 적용을 하지 않음
+          (렌더링 비용은 컴파일된 템플릿 실행뿐)
+        - <style>을 지우는 메일 클라이언트(Gmail 등)에서도 같은 모양으로 표시
+        - premailer(lxml)가 템플릿 태그를 텍스트로 보존하도록 템플릿 안에서는 비교 연산자(<, >)를 쓰지 않고,
+          href 속성의 식은 공백 없이 씀 (href="{{article.link}}")
+    """
+    global _template
+    if _template is None:
+        with _template_lock:
+            if _template is None:
+                with open(os.path.join(TEMPLATE_DIR, TEMPLATE_NAME), encoding="utf-8") as f:
+                    source = f.read()
+                inlined = Premailer(source, keep_style_tags=False, remove_classes=True, disable_validation=True,
+                                    allow_network=False, cssutils_logging_level=logging.CRITICAL).transform()
+                environment = Environment(autoescape=select_autoescape(default=True, default_for_string=True),
+                                          trim_blocks=True, lstrip_blocks=True, auto_reload=False)
+                _template = environment.from_string(inlined)
+    return _template
+
+def render_news_html(articles: Iterable[Article], date: str, skipped: Sequence[Dict] = (),
+                     title: Optional[str] = None) -> str:
+    """
+    뉴스 기사 목록을 HTML 이메일 본문으로 렌더링하는 함수
+
+    Args:
+        articles (Iterable[Article]): 요약된 기사 목록 (create_news_pdf와 같은 항목 사용)
+        date (str): 제목에 표시할 날짜 문자열
+        skipped (Sequence[Dict]): 작업 시간 예산 초과로 포함하지 못한 기사 (제목과 링크 표시)
+        title (Optional[str]): 다이제스트 제목 (기본값: 기사 카테고리로 만든 제목, digest_title)
+
+    Returns:
+        str: 스타일이 인라인으로 들어간 HTML 문서 (제목, 요약 등은 이스케이프)
+    """
+    articles = list(articles)
+    title = title or digest_title(article.category for article in articles)
+    return _load_template().render(date=date, title=title, articles=articles, skipped=skipped)
+
+class HTMLRenderer(DigestRenderer):
+    """
+    Jinja2 템플릿으로 다이제스트를 HTML 이메일 본문으로 렌더링하는 렌더러
+
+    폰트를 포함하지 않으므로 PDF보다 렌더링이 빠르고 메시지가 작다.
+    템플릿은 프로세스마다 한 번만 CSS를 인라인하고 컴파일한다.
+    """
+
+    name = "html"
+    extension = "html"
+    attach = False
+
+    def render(self, articles: Iterable[Article], date: str, path: str, skipped: Sequence[Dict] = (),
+               title: Optional[str] = None) -> Optional[int]:
+        try:
+            start = time.perf_counter()
+            data = render_news_html(articles, date, skipped, title).encode("utf-8")
+            with open(path, "wb") as f:
+                f.write(data)
+            logging.info(f"HTML 생성 완료: {path} ({time.perf_counter() - start:.3f}초, {len(data):,} bytes)")
+            return len(data)
+        except Exception as e:
+            logging.error(f"HTML 생성 실패: {e}")
+            return None
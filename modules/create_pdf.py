@@ -1,22 +1,138 @@
-from fpdf import FPDF
+from fpdf import FPDF, FPDF_VERSION
+from fpdf.fonts import TTFFont, SubsetMap
+from fontTools import ttLib
+import contextlib
+import copy
+import itertools
 import logging
+import multiprocessing
 import os
-from typing import List, Dict, Optional
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+from modules.article import Article
+from modules.renderers import DigestRenderer, digest_title
+
+# BRIEFY_PDF_SEGMENT_SIZE: 스트리밍 렌더링 시 한 번에 렌더링할 기사 수
+STREAM_SEGMENT_SIZE = int(os.getenv("BRIEFY_PDF_SEGMENT_SIZE", "200"))
+# BRIEFY_RENDER_WORKERS: 구독자별 PDF를 동시에 렌더링할 프로세스 수 (1이면 현재 프로세스에서 순서대로)
+RENDER_WORKERS = int(os.getenv("BRIEFY_RENDER_WORKERS", str(min(os.cpu_count() or 1, 4))))
+
+# 폰트 서브셋 과정의 상세 로그(글리프 목록 등) 억제
+logging.getLogger("fontTools.subset").setLevel(logging.WARNING)
+
+# 프로세스 전체에서 재사용하는 파싱된 폰트 (폰트 파일 경로, 스타일) -> TTFFont 원본
+_font_cache: Dict[Tuple[str, str], TTFFont] = {}
+_font_cache_lock = threading.Lock()
+
+# 파싱 결과 재사용은 TTFFont 내부 속성에 의존하므로 확인한 fpdf2 버전과 속성 구성에서만 사용
+# (다르면 fpdf2의 add_font로 폰트를 매번 파싱)
+_FONT_SLOTS = {"i", "type", "name", "desc", "glyph_ids", "hbfont", "up", "ut", "cw", "ttffile", "fontkey",
+               "emphasis", "scale", "subset", "cmap", "ttfont", "missing_glyphs"}
+FONT_CACHE_SUPPORTED = FPDF_VERSION.startswith("2.8.") and set(getattr(TTFFont, "__slots__", ())) == _FONT_SLOTS
+
+def _add_cached_font(pdf: FPDF, family: str, style: str, font_path: str):
+    """
+    파싱된 폰트 정보를 재사용하여 PDF에 폰트를 추가하는 함수
+    
+    Args:
+        pdf (FPDF): 폰트를 추가할 PDF 객체
+        family (str): 폰트 패밀리 이름
+        style (str): 폰트 스타일 ('' 또는 'B')
+        font_path (str): TTF 폰트 파일 경로
+        
+    Note:
+        - 문자 폭, 글리프 ID 등 cmap 전체를 순회하는 파싱 결과는 프로세스당 한 번만 계산
+        - 문서마다 달라지거나 fpdf2가 변경하는 상태(폰트 번호, 사용 글리프 목록, 문자 폭 사전,
+          폰트 설명 객체, fontTools 객체, HarfBuzz 객체)는 폰트마다 새로 생성하고
+          읽기만 하는 cmap과 글리프 ID만 원본과 공유
+          (fpdf2는 출력 시 fontTools 객체를 사용 글리프만 남기도록 서브셋한 뒤 닫음)
+        - fpdf2 버전이나 TTFFont 구성이 확인한 것과 다르면 pdf.add_font 사용 (FONT_CACHE_SUPPORTED)
+    """
+    fontkey = f"{family.lower()}{style}"
+    if fontkey in pdf.fonts:
+        return
+    if not FONT_CACHE_SUPPORTED:
+        pdf.add_font(family, style, font_path)
+        return
+    
+    cache_key = (os.path.abspath(font_path), style)
+    with _font_cache_lock:
+        template = _font_cache.get(cache_key)
+        if template is None:
+            template = TTFFont(pdf, font_path, fontkey, style)
+            template.close()
+            _font_cache[cache_key] = template
+    
+    font = copy.copy(template)
+    font.i = len(pdf.fonts) + 1
+    font.fontkey = fontkey
+    font.missing_glyphs = []
+    # 없는 문자의 폭을 조회하면 defaultdict에 항목이 추가되므로 문서마다 따로 둠
+    font.cw = defaultdict(template.cw.default_factory, template.cw)
+    # 출력 시 fpdf2가 객체 번호, 폰트 이름, 폰트 파일을 설정함
+    font.desc = copy.copy(template.desc)
+    font.ttfont = ttLib.TTFont(font_path, recalcTimestamp=False, fontNumber=0, lazy=True)
+    # 원본은 close()로 hbfont가 None이므로 속성을 지워 텍스트 셰이핑 시 새로 만들게 함
+    with contextlib.suppress(AttributeError):
+        del font.hbfont
+    
+    # TTFFont.__init__과 같은 방식으로 항상 포함할 문자 구성
+    reserved = "\x00 \r\n"
+    if pdf.str_alias_nb_pages:
+        reserved += "0123456789" + pdf.str_alias_nb_pages
+    font.subset = SubsetMap(font, [ord(char) for char in reserved])
+    pdf.fonts[fontkey] = font
+
+def _reuse_font(pdf: FPDF, font: TTFFont):
+    """
+    이전 구간 문서에서 출력한 폰트를 새 문서에 다시 추가하는 함수 (스트리밍 렌더링용)
+    
+    Args:
+        pdf (FPDF): 폰트를 추가할 PDF 객체
+        font (TTFFont): 이전 구간 문서의 폰트 (pdf.fonts의 값)
+        
+    Note:
+        - 글리프 코드 배정(SubsetMap)을 그대로 이어 쓰므로 앞 구간의 문자는 같은 코드를 유지하고
+          마지막 구간의 서브셋에 모든 구간의 글리프가 포함됨 (_StreamingPDFWriter의 share_fonts)
+        - 출력 시 서브셋되고 닫힌 fontTools 객체와 HarfBuzz 객체, 폰트 설명 객체는 새로 만듦
+    """
+    font.i = len(pdf.fonts) + 1
+    font.missing_glyphs = []
+    font.desc = copy.copy(font.desc)
+    font.ttfont = ttLib.TTFont(font.ttffile, recalcTimestamp=False, fontNumber=0, lazy=True)
+    with contextlib.suppress(AttributeError):
+        del font.hbfont
+    pdf.fonts[font.fontkey] = font
+
 class NewsPDF(FPDF):
     """
     뉴스 요약을 위한 사용자 정의 PDF 클래스
     FPDF를 상속받아 한글 폰트 지원과 헤더/푸터를 구현
     """
     
-    def __init__(self):
+    def __init__(self, fonts: Optional[Dict[str, TTFFont]] = None):
         """
         PDF 클래스 초기화
         부모 클래스 초기화 및 폰트 설정 수행
+        
+        Args:
+            fonts (Optional[Dict[str, TTFFont]]): 이어 쓸 이전 구간 문서의 폰트 (pdf.fonts)
         """
         super().__init__()
-        self._check_fonts()
+        self.page_offset = 0
+        # 페이지 머리글과 문서 제목에 표시할 다이제스트 제목 (_new_document에서 설정)
+        self.heading = digest_title(())
+        if fonts and FONT_CACHE_SUPPORTED:
+            for font in sorted(fonts.values(), key=lambda font: font.i):
+                _reuse_font(self, font)
+        else:
+            self._check_fonts()
         
     def _check_fonts(self):
         """
@@ -41,41 +157,123 @@ class NewsPDF(FPDF):
             if not os.path.exists(font_path):
                 raise FileNotFoundError(f"폰트 파일이 없습니다: {font_path}")
                 
-        # PDF에 폰트 추가 (유니코드 지원 활성화)
-        self.add_font('Malgun', '', os.path.join('fonts', 'malgun.ttf'), uni=True)
-        self.add_font('Malgun', 'B', os.path.join('fonts', 'malgunbd.ttf'), uni=True)
+        # PDF에 폰트 추가 (파싱 결과는 프로세스 내에서 재사용, 출력 시 사용 글리프만 포함)
+        _add_cached_font(self, 'Malgun', '', os.path.join('fonts', 'malgun.ttf'))
+        _add_cached_font(self, 'Malgun', 'B', os.path.join('fonts', 'malgunbd.ttf'))
         
     def header(self):
         """
         PDF 문서의 모든 페이지 상단에 표시될 헤더 정의
         """
         self.set_font('Malgun', '', 8)
-        self.cell(0, 10, '일일 세계 뉴스 요약', 0, 1, 'C')
+        self.cell(0, 10, f'일일 {self.heading}', 0, 1, 'C')
         self.ln(5)
         
     def footer(self):
         """
         PDF 문서의 모든 페이지 하단에 표시될 푸터 정의
-        페이지 번호를 포함
+        페이지 번호를 포함 (분할 렌더링 시 이전 구간의 페이지 수만큼 이어서 표시)
         """
         self.set_y(-15)  # 페이지 하단에서 15mm 위치
         self.set_font('Malgun', '', 8)
-        self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
+        self.cell(0, 10, f'Page {self.page_no() + self.page_offset}', 0, 0, 'C')
+
+def _new_document(date: Optional[str] = None, page_offset: int = 0,
+                  fonts: Optional[Dict[str, TTFFont]] = None, title: Optional[str] = None) -> NewsPDF:
+    """
+    기본 설정이 적용된 PDF 문서를 만들고 첫 페이지를 추가하는 함수
+    
+    Args:
+        date (Optional[str]): 문서 제목에 표시할 날짜 (None이면 제목 생략)
+        page_offset (int): 페이지 번호 시작 오프셋
+        fonts (Optional[Dict[str, TTFFont]]): 이어 쓸 이전 구간 문서의 폰트
+        title (Optional[str]): 다이제스트 제목 (기본값: "뉴스 요약")
+        
+    Returns:
+        NewsPDF: 첫 페이지가 추가된 PDF 객체
+    """
+    # PDF 객체 생성 및 기본 설정
+    pdf = NewsPDF(fonts)
+    pdf.page_offset = page_offset
+    if title:
+        pdf.heading = title
+    # A4 기본 여백 설정 (좌, 우 각각 10mm)
+    pdf.set_left_margin(10)
+    pdf.set_right_margin(10)
+    pdf.add_page()
+    
+    # 문서 제목 추가
+    if date is not None:
+        pdf.set_font('Malgun', 'B', 16)
+        pdf.cell(0, 10, f'{date} {pdf.heading}', 0, 1, 'C')
+        pdf.ln(10)
+    return pdf
 
-def create_news_pdf(articles: List[Dict], date: str) -> Optional[str]:
+def _add_article(pdf: NewsPDF, idx: int, article: Article, separator: bool):
+    """
+    PDF에 기사 하나를 추가하는 함수
+    
+    Args:
+        pdf (NewsPDF): 기사를 추가할 PDF 객체
+        idx (int): 기사 번호
+        article (Article): 요약된 기사 (create_news_pdf 참고)
+        separator (bool): 기사 앞에 구분선 추가 여부
+    """
+    # 구분선 추가 (문서의 첫 기사 제외)
+    if separator:
+        pdf.ln(5)
+        pdf.line(10, pdf.get_y(), pdf.w - 10, pdf.get_y())
+        pdf.ln(10)
+    
+    # 기사 제목 (굵은 글씨, 12pt)
+    pdf.set_font('Malgun', 'B', 12)
+    pdf.multi_cell(0, 10, f"{idx}. {article.title}")
+    
+    # 메타 정보 (회색, 9pt)
+    pdf.set_font('Malgun', '', 9)
+    pdf.set_text_color(100, 100, 100)  # 회색
+    meta = f"출처: {article.press} | 카테고리: {article.category} | 시간: {article.timestamp}"
+    # 같은 기사를 보도한 다른 언론사 (유사 중복으로 합쳐진 경우)
+    if article.alternates:
+        meta += f" | 다른 출처: {', '.join(alt['press'] for alt in article.alternates)}"
+    effective_width = pdf.w - 20  # 좌우 여백을 제외한 유효 너비
+    pdf.set_x(10)  # 시작 위치를 왼쪽 여백으로 설정
+    pdf.cell(effective_width, 5, meta, 0, 1, 'L')
+    pdf.ln(5)
+    
+    # 요약문 (검은색, 10pt)
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_font('Malgun', '', 10)
+    pdf.set_x(10)
+    pdf.multi_cell(0, 10, article.summary)
+    
+    # 링크 (파란색, 클릭 가능)
+    pdf.set_text_color(0, 0, 255)  # 파란색
+    pdf.set_x(10)
+    # 긴 URL 자동 축약 (80자 초과시)
+    if len(article.link) > 80:
+        shortened_link = article.link[:77] + "..."
+    else:
+        shortened_link = article.link
+    pdf.cell(effective_width, 5, shortened_link, 0, 1, 'L', link=article.link)
+    pdf.set_text_color(0, 0, 0)  # 색상 초기화
+
+def create_news_pdf(articles: List[Article], date: str, title: Optional[str] = None) -> Optional[str]:
     """
     뉴스 기사 목록을 PDF 문서로 생성하는 함수
     
     Args:
-        articles (List[Dict]): 뉴스 기사 정보를 담은 딕셔너리 리스트
-            각 딕셔너리는 다음 키를 포함:
+        articles (List[Article]): 요약된 기사 목록
+            각 기사의 다음 항목을 사용:
             - title: 기사 제목
             - press: 언론사
             - category: 카테고리
             - timestamp: 시간
             - summary: 요약문
             - link: 원문 링크
+            - alternates: 다른 출처 목록
         date (str): PDF 파일명에 포함될 날짜 문자열
+        title (Optional[str]): 다이제스트 제목 (기본값: 기사 카테고리로 만든 제목, digest_title)
         
     Returns:
         Optional[str]: 성공 시 생성된 PDF 파일명, 실패 시 None
@@ -85,64 +283,436 @@ def create_news_pdf(articles: List[Dict], date: str) -> Optional[str]:
         - 기사별로 제목, 메타 정보, 요약문, 링크를 포함
         - 기사 사이에 구분선 추가
         - 긴 URL은 자동으로 축약
+        - 폰트는 사용된 글리프만 서브셋으로 포함
+        - 렌더링 시간과 파일 크기를 로그로 기록
+        - 기사가 매우 많으면 stream_news_pdf 사용 권장
     """
     try:
-        # PDF 객체 생성 및 기본 설정
-        pdf = NewsPDF()
-        # A4 기본 여백 설정 (좌, 우 각각 10mm)
-        pdf.set_left_margin(10)
-        pdf.set_right_margin(10)
-        pdf.add_page()
-        
-        # 문서 제목 추가
-        pdf.set_font('Malgun', 'B', 16)
-        pdf.cell(0, 10, f'{date} 세계 뉴스 요약', 0, 1, 'C')
-        pdf.ln(10)
+        start = time.perf_counter()
+        
+        pdf = _new_document(date, title=title or digest_title(article.category for article in articles))
         
         # 각 기사 정보 추가
         for idx, article in enumerate(articles, 1):
-            # 기사 제목 (굵은 글씨, 12pt)
-            pdf.set_font('Malgun', 'B', 12)
-            pdf.multi_cell(0, 10, f"{idx}. {article['title']}")
-            
-            # 메타 정보 (회색, 9pt)
-            pdf.set_font('Malgun', '', 9)
-            pdf.set_text_color(100, 100, 100)  # 회색
-            meta = f"출처: {article['press']} | 카테고리: {article['category']} | 시간: {article['timestamp']}"
-            effective_width = pdf.w - 20  # 좌우 여백을 제외한 유효 너비
-            pdf.set_x(10)  # 시작 위치를 왼쪽 여백으로 설정
-            pdf.cell(effective_width, 5, meta, 0, 1, 'L')
-            pdf.ln(5)
-            
-            # 요약문 (검은색, 10pt)
-            pdf.set_text_color(0, 0, 0)
-            pdf.set_font('Malgun', '', 10)
-            pdf.set_x(10)
-            pdf.multi_cell(0, 10, article['summary'])
-            
-            # 링크 (파란색, 클릭 가능)
-            pdf.set_text_color(0, 0, 255)  # 파란색
-            pdf.set_x(10)
-            # 긴 URL 자동 축약 (80자 초과시)
-            if len(article['link']) > 80:
-                shortened_link = article['link'][:77] + "..."
-            else:
-                shortened_link = article['link']
-            pdf.cell(effective_width, 5, shortened_link, 0, 1, 'L', link=article['link'])
-            pdf.set_text_color(0, 0, 0)  # 색상 초기화
-            
-            # 구분선 추가 (마지막 기사 제외)
-            if idx < len(articles):
-                pdf.ln(5)
-                pdf.line(10, pdf.get_y(), pdf.w - 10, pdf.get_y())
-                pdf.ln(10)
+            _add_article(pdf, idx, article, separator=idx > 1)
         
         # PDF 파일 저장
         filename = f'news_summary_{date}.pdf'
         pdf.output(filename)
-        logging.info(f"PDF 생성 완료: {filename}")
+        elapsed = time.perf_counter() - start
+        logging.info(f"PDF 생성 완료: {filename} ({elapsed:.2f}초, {os.path.getsize(filename):,} bytes)")
         return filename
         
     except Exception as e:
         logging.error(f"PDF 생성 실패: {e}")
         return None
+
+# PDF 사전의 토큰 (문자열은 _split_strings가 따로 분리)
+_TOKEN = re.compile(rb"<<|>>|\[|\]|/[^\s/\[\]()<>{}%]*|\d+ \d+ R\b|[^\s/\[\]()<>{}%]+")
+_REFERENCE = re.compile(rb"(?<![\w.+-])(\d+) (\d+) R\b")
+_STRING_START = re.compile(rb"[(<%]")
+
+def _split_strings(data: bytes) -> List[Tuple[bool, bytes]]:
+    """
+    PDF 객체의 사전 부분을 문자열 토큰과 나머지로 나누는 함수
+
+    Returns:
+        List[Tuple[bool, bytes]]: (문자열 여부, 바이트) 목록 (이어 붙이면 원래 바이트)
+
+    Note:
+        - 리터럴 문자열((...), 중첩 괄호와 역슬래시 이스케이프 포함), 16진 문자열(<...>),
+          주석(%)을 문자열로 취급하여 그 안의 "N 0 R" 같은 글자(링크 URI 등)를 참조로 보지 않음
+    """
+    parts = []
+    start = position = 0
+    while True:
+        match = _STRING_START.search(data, position)
+        if match is None:
+            break
+        i = match.start()
+        if data[i:i + 2] == b"<<":
+            position = i + 2
+            continue
+        if data[i:i + 1] == b"(":
+            depth, j = 1, i + 1
+            while j < len(data) and depth:
+                char = data[j]
+                if char == 0x5C:  # 역슬래시 다음 문자는 건너뜀
+                    j += 1
+                elif char == 0x28:
+                    depth += 1
+                elif char == 0x29:
+                    depth -= 1
+                j += 1
+        elif data[i:i + 1] == b"<":
+            j = data.find(b">", i) + 1 or len(data)
+        else:
+            j = data.find(b"\n", i) + 1 or len(data)
+        if i > start:
+            parts.append((False, data[start:i]))
+        parts.append((True, data[i:j]))
+        start = position = j
+    if start < len(data):
+        parts.append((False, data[start:]))
+    return parts
+
+def _renumber(data: bytes, mapping: Dict[int, int]) -> bytes:
+    """문자열 토큰 밖의 간접 참조(N G R) 번호만 mapping에 따라 바꾸는 함수"""
+    def replace(match):
+        return b"%d %s R" % (mapping[int(match.group(1))], match.group(2))
+    return b"".join(part if is_string else _REFERENCE.sub(replace, part)
+                    for is_string, part in _split_strings(data))
+
+def _references(data: bytes) -> List[int]:
+    """문자열 토큰 밖의 간접 참조 객체 번호 목록"""
+    return [int(number) for is_string, part in _split_strings(data) if not is_string
+            for number, _ in _REFERENCE.findall(part)]
+
+def _tokens(data: bytes) -> List[bytes]:
+    """사전 부분의 토큰 목록 (문자열 토큰은 b"()"로 대체)"""
+    tokens = []
+    for is_string, part in _split_strings(data):
+        if is_string:
+            tokens.append(b"()")
+        else:
+            tokens.extend(_TOKEN.findall(part))
+    return tokens
+
+def _dict_value(tokens: List[bytes], key: bytes) -> Optional[List[bytes]]:
+    """
+    최상위 사전에서 key의 값을 토큰 목록으로 반환하는 함수 (없으면 None)
+
+    Note:
+        - 값이 사전이나 배열이면 여는 토큰부터 닫는 토큰까지 반환
+    """
+    depth = 0
+    for i, token in enumerate(tokens):
+        if token in (b"<<", b"["):
+            depth += 1
+        elif token in (b">>", b"]"):
+            depth -= 1
+        elif depth == 1 and token == key and i + 1 < len(tokens):
+            if tokens[i + 1] not in (b"<<", b"["):
+                return tokens[i + 1:i + 2]
+            nested = 0
+            for j in range(i + 1, len(tokens)):
+                nested += tokens[j] in (b"<<", b"[")
+                nested -= tokens[j] in (b">>", b"]")
+                if not nested:
+                    return tokens[i + 1:j + 1]
+    return None
+
+def _reference_number(token: bytes) -> Optional[int]:
+    match = _REFERENCE.fullmatch(token)
+    return int(match.group(1)) if match else None
+
+class _StreamingPDFWriter:
+    """
+    여러 개의 fpdf2 문서를 객체 단위로 이어 붙여 하나의 PDF로 기록하는 작성기
+    
+    구간 문서의 객체 번호를 전체 문서 기준으로 바꾸어 곧바로 출력 대상에 쓰고,
+    페이지 트리(/Pages)와 카탈로그, 상호 참조 테이블만 마지막에 기록한다.
+    메모리에는 페이지 참조와 객체 위치만 남으므로 기사 수와 무관하게 사용량이 일정하다.
+    
+    Note:
+        - 구간 문서를 PDF 구조(트레일러의 /Root, 카탈로그의 /Pages, 페이지의 /Resources /Font)로 읽으며,
+          참조 번호는 문자열 토큰 밖에서만 바꿈 (링크 URI 등은 그대로)
+        - share_fonts이면 구간들이 같은 폰트 객체(같은 글리프 코드)를 사용한다고 보고, 중간 구간의
+          폰트 객체는 버리고 리소스 이름(/F1 등)별로 예약한 번호를 참조하게 한 뒤 마지막 구간의 폰트
+          (모든 구간의 글리프를 포함한 서브셋)만 그 번호로 한 번 기록
+        - 상호 참조는 클래식 xref 테이블(fpdf2 출력 형식)을 읽음
+    """
+    
+    _PAGES = 1
+    _CATALOG = 2
+    
+    def __init__(self, sink: BinaryIO, share_fonts: bool = False):
+        self.sink = sink
+        self.share_fonts = share_fonts
+        self.position = 0
+        self.offsets: Dict[int, int] = {}
+        self.next_number = 3
+        self.kids: List[int] = []
+        self.media_box: Optional[bytes] = None
+        self.header_written = False
+        # 리소스 이름(/F1 등) -> 공유 폰트 객체 번호
+        self.font_numbers: Dict[bytes, int] = {}
+    
+    def _write(self, data: bytes):
+        self.sink.write(data)
+        self.position += len(data)
+    
+    def _allocate(self) -> int:
+        number = self.next_number
+        self.next_number += 1
+        return number
+    
+    def append(self, data: bytes, final: bool = True):
+        """
+        fpdf2가 출력한 구간 문서의 객체를 번호를 바꾸어 기록하는 함수
+        
+        Args:
+            data (bytes): 구간 문서 PDF 바이트
+            final (bool): 마지막 구간 여부 (share_fonts이면 마지막 구간의 폰트만 기록)
+        """
+        if not self.header_written:
+            self._write(data[:data.index(b"\n") + 1])
+            self.header_written = True
+        
+        startxref = int(re.search(rb"startxref\s+(\d+)", data[data.rindex(b"startxref"):]).group(1))
+        trailer = _tokens(data[data.rindex(b"trailer"):startxref if startxref > data.rindex(b"trailer") else None])
+        root = _reference_number(_dict_value(trailer, b"/Root")[0])
+        info = _dict_value(trailer, b"/Info")
+        info = _reference_number(info[0]) if info else None
+        
+        # xref 테이블에서 객체 위치 읽기
+        lines = data[startxref:].split(b"\n")
+        count = int(lines[1].split()[1])
+        offsets = [int(line[:10]) for line in lines[2:2 + count]]
+        order = sorted(range(1, count), key=lambda number: offsets[number])
+        bounds = {number: end for number, end in zip(order, [offsets[number] for number in order[1:]] + [startxref])}
+        
+        # 객체마다 사전 부분(head)과 스트림 부분(tail) 분리 (스트림 데이터는 그대로 복사)
+        heads, tails = {}, {}
+        for number in range(1, count):
+            body = data[offsets[number]:bounds[number]]
+            body = body[body.index(b"obj") + 3:]
+            split = body.find(b"stream\n")
+            heads[number], tails[number] = (body, b"") if split < 0 else (body[:split], body[split:])
+        
+        pages_root = _reference_number(_dict_value(_tokens(heads[root]), b"/Pages")[0])
+        root_dict = _tokens(heads[pages_root])
+        kids = [_reference_number(token) for token in _dict_value(root_dict, b"/Kids")[1:-1]]
+        if self.media_box is None:
+            media_box = _dict_value(root_dict, b"/MediaBox")
+            self.media_box = b"/MediaBox " + b" ".join(media_box) if media_box else None
+        
+        # 페이지 리소스의 폰트 (리소스 이름 -> 폰트 객체 번호)와 폰트가 참조하는 객체
+        fonts: Dict[bytes, int] = {}
+        font_objects = set()
+        if self.share_fonts:
+            for kid in kids:
+                resources = _dict_value(_tokens(heads[kid]), b"/Resources")
+                if resources and _reference_number(resources[0]) is not None:
+                    resources = _tokens(heads[_reference_number(resources[0])])
+                else:
+                    resources = [b"<<"] + (resources or [b"<<", b">>"])[1:] + [b">>"]
+                font_dict = _dict_value(resources, b"/Font") or []
+                if font_dict and _reference_number(font_dict[0]) is not None:
+                    font_dict = _tokens(heads[_reference_number(font_dict[0])])
+                for name, reference in zip(font_dict[1:-1:2], font_dict[2:-1:2]):
+                    fonts[name] = _reference_number(reference)
+            pending = list(fonts.values())
+            while pending:
+                number = pending.pop()
+                if number in font_objects:
+                    continue
+                font_objects.add(number)
+                pending.extend(reference for reference in _references(heads[number]) if reference < count)
+        
+        # 객체 번호 재배정 (구간의 /Pages 루트는 전체 루트로, 폰트는 예약한 번호로, 카탈로그와 정보 사전은 제외)
+        mapping = {pages_root: self._PAGES}
+        for name, number in fonts.items():
+            if name not in self.font_numbers:
+                self.font_numbers[name] = self._allocate()
+            mapping[number] = self.font_numbers[name]
+        written = []
+        for number in range(1, count):
+            if number in (pages_root, root, info) or (number in font_objects and not final):
+                continue
+            if number not in mapping:
+                mapping[number] = self._allocate()
+            written.append(number)
+        
+        self.kids.extend(mapping[kid] for kid in kids)
+        for number in written:
+            self.offsets[mapping[number]] = self.position
+            self._write(b"%d 0 obj" % mapping[number] + _renumber(heads[number], mapping) + tails[number])
+    
+    def close(self):
+        """페이지 트리, 카탈로그, 상호 참조 테이블과 트레일러를 기록하는 함수"""
+        missing = set(self.font_numbers.values()) - set(self.offsets)
+        if missing:
+            raise ValueError(f"마지막 구간에 없는 폰트가 있습니다: {sorted(missing)}")
+        
+        self.offsets[self._PAGES] = self.position
+        kids = b"\n".join(b"%d 0 R" % number for number in self.kids)
+        self._write(
+            b"%d 0 obj\n<<\n/Count %d\n/Kids [" % (self._PAGES, len(self.kids)) + kids + b"]\n"
+            + (self.media_box + b"\n" if self.media_box else b"")
+            + b"/Type /Pages\n>>\nendobj\n"
+        )
+        self.offsets[self._CATALOG] = self.position
+        self._write(
+            b"%d 0 obj\n<<\n/PageLayout /OneColumn\n/Pages %d 0 R\n/Type /Catalog\n>>\nendobj\n"
+            % (self._CATALOG, self._PAGES)
+        )
+        
+        size = self.next_number
+        xref = self.position
+        entries = [b"0000000000 65535 f \n"]
+        entries.extend(b"%010d 00000 n \n" % self.offsets[number] for number in range(1, size))
+        self._write(b"xref\n0 %d\n" % size + b"".join(entries))
+        self._write(
+            b"trailer\n<<\n/Size %d\n/Root %d 0 R\n>>\nstartxref\n%d\n%%%%EOF\n"
+            % (size, self._CATALOG, xref)
+        )
+
+_END = object()
+
+def stream_news_pdf(articles: Iterable[Article], date: str,
+                    sink: Union[str, BinaryIO, None] = None,
+                    segment_size: int = STREAM_SEGMENT_SIZE, title: Optional[str] = None) -> Optional[int]:
+    """
+    기사 이터레이터를 일정 메모리로 PDF에 기록하는 함수 (대용량 다이제스트용)
+    
+    Args:
+        articles (Iterable[Article]): 요약된 기사 이터레이터 (create_news_pdf와 같은 형식)
+        date (str): 문서 제목과 기본 파일명에 사용할 날짜 문자열
+        sink (Union[str, BinaryIO, None]): 출력 파일 경로 또는 바이너리 파일 객체
+            (기본값: news_summary_{date}.pdf)
+        segment_size (int): 한 번에 렌더링할 기사 수 (기본값: BRIEFY_PDF_SEGMENT_SIZE)
+        title (Optional[str]): 다이제스트 제목 (기사가 도착하기 전에 첫 페이지를 그리므로
+            기사 카테고리로 만들 수 없음, 기본값: "뉴스 요약")
+        
+    Returns:
+        Optional[int]: 성공 시 기록한 바이트 수, 실패 시 None
+        
+    Note:
+        - 기사를 이터레이터에서 받는 즉시 렌더링하고, segment_size개마다 완성된 페이지를 출력 대상에 기록
+        - 기사 번호와 페이지 번호는 구간을 넘어 이어짐
+        - 구간이 바뀔 때는 새 페이지에서 시작
+        - 구간 문서들이 폰트(글리프 코드 배정)를 이어 쓰고, 폰트는 모든 구간의 글리프를 포함한
+          마지막 구간의 서브셋 하나만 기록 (fpdf2 버전이 달라 폰트 캐시를 쓸 수 없으면 구간마다 포함)
+    """
+    try:
+        start = time.perf_counter()
+        if sink is None:
+            sink = f'news_summary_{date}.pdf'
+        
+        with contextlib.ExitStack() as stack:
+            stream = stack.enter_context(open(sink, 'wb')) if isinstance(sink, str) else sink
+            writer = _StreamingPDFWriter(stream, share_fonts=FONT_CACHE_SUPPORTED)
+            
+            iterator = iter(articles)
+            idx = 0
+            fonts = None
+            # 구간의 첫 기사가 도착한 뒤에 문서를 만들고, 이후 기사는 도착하는 대로 추가
+            # (스트리밍 파이프라인에서 요약이 끝난 기사부터 렌더링)
+            first = next(iterator, _END)
+            while True:
+                pdf = _new_document(date if idx == 0 else None, page_offset=len(writer.kids), fonts=fonts,
+                                    title=title)
+                # 모든 페이지가 하나의 리소스 사전(모든 폰트 포함)을 쓰도록 하여 마지막 구간에서
+                # 사용하지 않은 폰트도 작성기가 찾을 수 있게 함
+                pdf.single_resources_object = True
+                if first is not _END:
+                    segment = itertools.chain([first], itertools.islice(iterator, segment_size - 1))
+                    for position, article in enumerate(segment):
+                        idx += 1
+                        _add_article(pdf, idx, article, separator=position > 0)
+                
+                # 다음 기사가 없으면 마지막 구간 (폰트를 이 구간에서 한 번만 기록)
+                first = next(iterator, _END)
+                writer.append(bytes(pdf.output()), final=first is _END)
+                fonts = pdf.fonts
+                del pdf
+                
+                if first is _END:
+                    break
+            
+            writer.close()
+        
+        elapsed = time.perf_counter() - start
+        logging.info(
+            f"PDF 스트리밍 생성 완료: 기사 {idx}개, {len(writer.kids)}페이지 "
+            f"({elapsed:.2f}초, {writer.position:,} bytes)"
+        )
+        return writer.position
+        
+    except Exception as e:
+        logging.error(f"PDF 생성 실패: {e}")
+        return None
+
+# 렌더링 작업 프로세스가 공유하는 기사 목록 (프로세스마다 한 번만 전달)
+_shared_articles: Sequence[Article] = ()
+
+def _init_render_worker(articles: Sequence[Article]):
+    global _shared_articles
+    _shared_articles = articles
+
+def _render_selection(filename: str, indices: Sequence[int], date: str) -> Optional[int]:
+    title = digest_title(_shared_articles[idx].category for idx in indices)
+    return stream_news_pdf((_shared_articles[idx] for idx in indices), date, filename, title=title)
+
+def create_news_pdfs(articles: Sequence[Article], selections: Dict[str, Sequence[int]], date: str,
+                     workers: int = RENDER_WORKERS) -> Dict[str, bool]:
+    """
+    같은 기사 목록에서 고른 기사로 PDF 여러 개를 만드는 함수 (구독자별 다이제스트용)
+    
+    Args:
+        articles (Sequence[Article]): 요약된 기사 목록 (create_news_pdf와 같은 형식)
+        selections (Dict[str, Sequence[int]]): {PDF 파일명: 포함할 기사 번호 목록}
+        date (str): 문서 제목에 사용할 날짜 문자열
+        workers (int): 렌더링 프로세스 수 (기본값: BRIEFY_RENDER_WORKERS)
+        
+    Returns:
+        Dict[str, bool]: PDF 파일명별 생성 성공 여부
+        
+    Note:
+        - 기사 목록(요약 포함)은 작업 프로세스마다 한 번만 전달하고, PDF마다 파일명과 기사 번호만 전달
+        - 파싱된 폰트는 작업 프로세스마다 캐시되어 여러 PDF에 재사용
+        - 제목은 PDF마다 고른 기사의 카테고리로 만듦 (digest_title)
+        - PDF가 하나이거나 workers가 1이면 프로세스를 만들지 않고 현재 프로세스에서 렌더링
+        - 호출하는 프로세스에는 수집/요약 스레드와 그 잠금이 남아 있으므로 fork 대신 forkserver
+          (지원하지 않는 플랫폼에서는 spawn)로 작업 프로세스를 만듦
+    """
+    start = time.perf_counter()
+    if len(selections) <= 1 or workers <= 1:
+        _init_render_worker(articles)
+        try:
+            results = {filename: _render_selection(filename, indices, date) is not None
+                       for filename, indices in selections.items()}
+        finally:
+            _init_render_worker(())
+    else:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        with ProcessPoolExecutor(max_workers=min(workers, len(selections)),
+                                 mp_context=multiprocessing.get_context(method),
+                                 initializer=_init_render_worker, initargs=(list(articles),)) as executor:
+            futures = {filename: executor.submit(_render_selection, filename, list(indices), date)
+                       for filename, indices in selections.items()}
+            results = {}
+            for filename, future in futures.items():
+                try:
+                    results[filename] = future.result() is not None
+                except Exception as e:
+                    logging.error(f"PDF 생성 실패: {filename} - {e}")
+                    results[filename] = False
+    
+    created = sum(results.values())
+    logging.info(f"PDF {created}/{len(selections)}개 생성 ({time.perf_counter() - start:.2f}초)")
+    return results
+
+class PDFRenderer(DigestRenderer):
+    """
+    NewsPDF로 다이제스트를 PDF 첨부 파일로 렌더링하는 렌더러
+
+    한 문서는 stream_news_pdf로 기사가 도착하는 대로 렌더링하고,
+    구독자별 다이제스트 여러 개는 create_news_pdfs로 프로세스 풀에서 렌더링한다.
+    """
+
+    name = "pdf"
+    extension = "pdf"
+    attach = True
+
+    def render(self, articles: Iterable[Article], date: str, path: str, skipped: Sequence[Dict] = (),
+               title: Optional[str] = None) -> Optional[int]:
+        # 건너뛴 기사는 이메일 본문에 표시하므로 PDF에는 넣지 않음
+        if title is None and isinstance(articles, Sequence):
+            title = digest_title(article.category for article in articles)
+        return stream_news_pdf(articles, date, path, title=title)
+
+    def render_many(self, articles: Sequence[Article], selections: Dict[str, Sequence[int]], date: str,
+                    skipped: Sequence[Dict] = ()) -> Dict[str, bool]:
+        return create_news_pdfs(articles, selections, date)
@@ -0,0 +1,128 @@
+import os
+import math
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from modules.article import Article
+
+# 작업 시간 예산 설정
+# BRIEFY_TIME_BUDGET: 작업 한 번(수집부터 발송까지)의 전체 시간 예산 (초, 0: 제한 없음)
+# BRIEFY_TIME_RESERVE: 예산 중 PDF 생성과 발송을 위해 남겨 둘 시간 (초, 수집/요약은 이 시간 전에 멈춤)
+TIME_BUDGET = float(os.getenv("BRIEFY_TIME_BUDGET", "180"))
+TIME_RESERVE = float(os.getenv("BRIEFY_TIME_RESERVE", "20"))
+
+# 남은 예산이 아무리 적어도 요청 제한 시간은 이 값 이상으로 설정 (너무 짧은 제한 시간으로 인한 실패 방지)
+MIN_TIMEOUT = 0.5
+
+class DeadlineExceeded(TimeoutError):
+    """작업 시간 예산을 모두 사용하여 새 요청을 보내지 않을 때 발생하는 예외"""
+
+class Budget:
+    """
+    작업 한 번의 시간 예산
+
+    수집/요약 단계는 (예산 - 예약 시간)까지만 진행하고, 남은 시간에 완료된 기사로 PDF를 만들어 발송한다.
+    예산 때문에 처리하지 못한 기사는 skipped에 모아 다이제스트에 목록으로 표시한다.
+    """
+
+    def __init__(self, seconds: float = TIME_BUDGET, reserve: float = TIME_RESERVE):
+        """
+        Args:
+            seconds (float): 전체 시간 예산 (초, 0이면 제한 없음)
+            reserve (float): PDF 생성과 발송을 위해 남겨 둘 시간 (초)
+        """
+        self.seconds = seconds
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + max(seconds - reserve, 0) if seconds > 0 else None
+        self.skipped: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """수집/요약에 남은 시간 (초, 제한이 없으면 무한대)"""
+        if self.deadline is None:
+            return math.inf
+        return self.deadline - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, default: float) -> float:
+        """
+        요청 제한 시간을 남은 예산에 맞추어 반환하는 함수
+
+        Args:
+            default (float): 예산 제한이 없을 때의 제한 시간 (초)
+
+        Returns:
+            float: min(default, 남은 예산), 최소 MIN_TIMEOUT
+
+        Raises:
+            DeadlineExceeded: 예산을 모두 사용한 경우
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("작업 시간 예산을 모두 사용했습니다")
+        return max(min(default, remaining), MIN_TIMEOUT)
+
+    def skip(self, article: Article, reason: str):
+        """예산 때문에 처리하지 못한 기사를 기록하는 함수"""
+        with self._lock:
+            if any(skipped["link"] == article.link for skipped in self.skipped):
+                return
+            self.skipped.append({"title": article.title, "link": article.link,
+                                 "press": article.press, "reason": reason})
+
+_UNLIMITED = Budget(0)
+_current: Budget = _UNLIMITED
+
+def current() -> Budget:
+    """
+    현재 실행 중인 작업의 시간 예산을 반환하는 함수
+
+    Returns:
+        Budget: 실행 중이 아니면 제한 없는 예산
+    """
+    return _current
+
+def expired() -> bool:
+    """현재 작업의 수집/요약 시간 예산을 모두 사용했는지 확인하는 함수"""
+    return _current.expired()
+
+def timeout(default: float) -> float:
+    """현재 작업의 남은 예산에 맞춘 요청 제한 시간을 반환하는 함수 (예산을 모두 사용했으면 DeadlineExceeded)"""
+    return _current.timeout(default)
+
+def skip(article: Article, reason: str = "시간 예산 초과"):
+    """현재 작업에서 예산 때문에 처리하지 못한 기사를 기록하는 함수"""
+    _current.skip(article, reason)
+
+@contextmanager
+def budget(seconds: Optional[float] = None, reserve: Optional[float] = None) -> Iterator[Budget]:
+    """
+    작업 한 번의 시간 예산을 설정하는 컨텍스트 매니저
+
+    Args:
+        seconds (Optional[float]): 전체 시간 예산 (기본값: BRIEFY_TIME_BUDGET)
+        reserve (Optional[float]): PDF 생성과 발송을 위해 남겨 둘 시간 (기본값: BRIEFY_TIME_RESERVE)
+
+    Yields:
+        Budget: 이번 작업의 시간 예산
+
+    Note:
+        - 기사 수집 스레드에서도 같은 예산을 사용하도록 프로세스 전체에 설정
+          (스케줄러가 작업을 겹쳐 실행하지 않으므로 한 번에 하나의 예산만 사용)
+    """
+    global _current
+    current_budget = Budget(TIME_BUDGET if seconds is None else seconds,
+                            TIME_RESERVE if reserve is None else reserve)
+    previous = _current
+    _current = current_budget
+    try:
+        yield current_budget
+    finally:
+        _current = previous
+        if current_budget.skipped:
+            logging.warning(f"시간 예산 초과로 처리하지 못한 기사 {len(current_budget.skipped)}건")
@@ -0,0 +1,148 @@
+import os
+import re
+import zlib
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+
+from modules.article import Article
+
+# 유사 중복 판정 기준 (추정 자카드 유사도)
+# BRIEFY_DEDUP_TITLE_THRESHOLD: 목록 단계에서 제목(단어 단위) 비교 기준 (후보만 찾고, 합칠지는 본문 비교로 확인)
+# BRIEFY_DEDUP_BODY_THRESHOLD: 본문 추출 후 본문 비교 기준
+TITLE_THRESHOLD = float(os.getenv("BRIEFY_DEDUP_TITLE_THRESHOLD", "0.8"))
+BODY_THRESHOLD = float(os.getenv("BRIEFY_DEDUP_BODY_THRESHOLD", "0.7"))
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+def shingles(text: str, size: int, words: bool = False) -> np.ndarray:
+    """
+    텍스트를 문자 또는 단어 n-gram(shingle) 해시 배열로 변환하는 함수
+
+    Args:
+        text (str): 비교할 텍스트
+        size (int): shingle 길이 (문자 수, words=True이면 단어 수)
+        words (bool): 단어 단위 shingle 사용 여부 (짧은 제목용)
+
+    Returns:
+        np.ndarray: 중복을 제거한 32비트 shingle 해시 배열
+
+    Note:
+        - 문자 단위는 공백과 문장 부호를 제거한 뒤 비교하므로 띄어쓰기 차이는 무시
+        - 짧은 제목을 문자 단위로 비교하면 한 단어만 다른 제목("영업이익 증가"/"영업이익 감소")도
+          대부분의 shingle을 공유하므로 제목은 단어 단위로 비교
+        - 실행 간 결과가 같도록 Python hash 대신 crc32 사용
+    """
+    if words:
+        tokens = re.findall(r'[^\W_]+', text.lower())
+        grams = {" ".join(tokens[i:i + size]) for i in range(max(len(tokens) - size + 1, 1))} if tokens else set()
+    else:
+        normalized = re.sub(r'[\s\W_]+', '', text.lower())
+        if len(normalized) <= size:
+            grams = {normalized} if normalized else set()
+        else:
+            grams = {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+    return np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams))
+
+def _lsh_params(threshold: float, num_perm: int):
+    """임계값 부근에서 후보 판정이 급격히 바뀌도록 밴드 수와 밴드당 행 수를 선택"""
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+class NearDuplicateIndex:
+    """
+    MinHash와 LSH(밴딩)를 사용하는 유사 중복 탐지 인덱스
+
+    문서를 하나씩 추가하면서 이미 추가된 문서 중 유사한 대표 문서를 찾는다.
+    LSH 버킷이 겹치는 후보끼리만 비교하므로 전체 쌍 비교(O(n²))를 피한다.
+    """
+
+    def __init__(self, threshold: float, num_perm: int = 64, shingle_size: int = 3, seed: int = 1,
+                 words: bool = False):
+        """
+        Args:
+            threshold (float): 중복으로 판정할 추정 자카드 유사도 (0~1)
+            num_perm (int): MinHash 순열 수
+            shingle_size (int): shingle 길이 (문자 수, words=True이면 단어 수)
+            seed (int): 순열 생성 seed
+            words (bool): 단어 단위 shingle 사용 여부
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.words = words
+        self.bands, self.rows = _lsh_params(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(self.bands)]
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        텍스트의 MinHash 서명을 계산하는 함수
+
+        Args:
+            text (str): 비교할 텍스트
+
+        Returns:
+            np.ndarray: 길이 num_perm의 MinHash 서명
+        """
+        hashes = shingles(text, self.shingle_size, self.words)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # (num_perm, shingle 수) 행렬로 모든 순열을 한 번에 계산
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """
+        문서를 인덱스에 추가하고, 유사한 기존 문서가 있으면 그 키를 반환하는 함수
+
+        Args:
+            key (Hashable): 문서 식별자
+            text (str): 비교할 텍스트
+
+        Returns:
+            Optional[Hashable]: 유사한 대표 문서의 키 (중복인 문서는 인덱스에 추가하지 않음),
+            중복이 아니면 None
+        """
+        signature = self.signature(text)
+        band_keys = [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+        candidates = []
+        for band, band_key in zip(self._buckets, band_keys):
+            for candidate in band.get(band_key, ()):
+                if candidate not in candidates:
+                    candidates.append(candidate)
+
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity >= self.threshold:
+                return candidate
+
+        self._signatures[key] = signature
+        for band, band_key in zip(self._buckets, band_keys):
+            band.setdefault(band_key, []).append(key)
+        return None
+
+def add_alternate(representative: Article, duplicate: Article):
+    """
+    중복 기사의 언론사와 링크를 대표 기사의 대체 출처로 추가하는 함수
+
+    Args:
+        representative (Article): 대표 기사
+        duplicate (Article): 중복으로 판정된 기사
+    """
+    representative.alternates.append({"press": duplicate.press, "link": duplicate.link})
+    representative.alternates.extend(duplicate.alternates)
@@ -1,71 +1,435 @@
-import requests
 from bs4 import BeautifulSoup
+import os
 import logging
-from typing import Optional
+from typing import Optional, Union
 import re
 
-def fetch_article(url: str) -> Optional[str]:
+# lxml이 설치된 경우 빠른 추출 경로 사용
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+from modules import deadline, http_client, metrics
+from modules.article_cache import get_cache
+
+# 네이버 뉴스 본문 컨테이너 ID (우선순위 순)
+CONTENT_IDS = [
+    "dic_area",                 # 일반 기사
+    "articeBody",               # 스포츠 기사
+    "newsEndContents",          # 연예 기사
+    "article_body",             # 일부 기사
+    "newsct_article"            # 새로운 형식
+]
+
+# 후보 컨테이너를 문서 한 번 순회로 모두 찾기 위한 XPath
+_CONTENT_XPATH = "//*[" + " or ".join(f"@id='{content_id}'" for content_id in CONTENT_IDS) + "]"
+
+# 본문에서 제외할 요소
+EXCLUDED_TAGS = {"script", "style"}
+EXCLUDED_CLASSES = {"reporter_area", "copyright", "link_news"}
+
+# 스트리밍 다운로드 설정 (lxml이 있을 때만 사용)
+# BRIEFY_FETCH_STREAM: 기사 페이지를 조각으로 받으며 본문 컨테이너가 닫히면 바로 읽기를 멈출지 (1: 사용, 0: 전체 다운로드)
+# BRIEFY_FETCH_MAX_BYTES: 기사 페이지 하나에서 읽을 최대 바이트 수 (압축 해제 기준, 넘으면 실패 처리)
+# BRIEFY_FETCH_DRAIN_BYTES: 읽기를 멈춘 뒤 남은 본문이 이 값 이하이면 마저 읽어 keep-alive 연결을 재사용하고,
+#                           크면 연결을 닫아 나머지를 받지 않음 (0: 항상 닫음, 기본값: 조각 하나 크기)
+STREAM = os.getenv("BRIEFY_FETCH_STREAM", "1") == "1"
+MAX_BYTES = int(os.getenv("BRIEFY_FETCH_MAX_BYTES", str(2 * 1024 * 1024)))
+CHUNK_SIZE = 16 * 1024
+DRAIN_BYTES = int(os.getenv("BRIEFY_FETCH_DRAIN_BYTES", str(CHUNK_SIZE)))
+
+def _container_text(container) -> str:
+    """
+    본문 컨테이너에서 제외 요소를 건너뛰며 텍스트를 모으는 함수
+
+    Args:
+        container (lxml.etree._Element): 본문 컨테이너 요소
+
+    Returns:
+        str: 공백 정리 전 본문 텍스트
+    """
+    parts = []
+
+    def append(text):
+        if text:
+            text = text.strip()
+            if text:
+                parts.append(text)
+
+    def walk(element):
+        append(element.text)
+        for child in element:
+            # 주석, 처리 지시문 등은 텍스트를 제외하고 꼬리 텍스트만 유지
+            if not isinstance(child.tag, str):
+                append(child.tail)
+                continue
+            classes = child.get("class")
+            if child.tag in EXCLUDED_TAGS or (classes and EXCLUDED_CLASSES.intersection(classes.split())):
+                append(child.tail)
+                continue
+            walk(child)
+            append(child.tail)
+
+    walk(container)
+    return "".join(parts)
+
+def _extract_text_lxml(html: Union[str, bytes], encoding: Optional[str] = None) -> Optional[str]:
+    """
+    lxml로 응답 바이트를 직접 파싱하여 본문 텍스트를 추출하는 함수
+
+    Args:
+        html (Union[str, bytes]): 기사 페이지 HTML (디코딩 전 바이트 권장)
+        encoding (Optional[str]): Content-Type 헤더에 선언된 문자셋
+            (없으면 문서의 meta charset 사용)
+
+    Returns:
+        Optional[str]: 공백 정리 전 본문 텍스트, 본문 컨테이너가 없으면 None
+
+    Note:
+        - 트리 구축은 C 구현(libxml2)에서 한 번에 수행하고,
+          컨테이너는 ID 조회로 바로 찾음
+        - 제외 요소 제거와 텍스트 수집을 한 번의 순회로 처리
+          (BeautifulSoup의 decompose + get_text(strip=True)와 같은 결과)
+    """
+    parser = lxml.html.HTMLParser(encoding=encoding) if encoding and isinstance(html, bytes) else None
+    root = lxml.html.document_fromstring(html, parser=parser)
+
+    # 우선순위가 가장 높은 컨테이너 선택 (같은 ID는 문서 순서상 첫 번째)
+    candidates = {}
+    for element in root.xpath(_CONTENT_XPATH):
+        candidates.setdefault(element.get("id"), element)
+    container = next((candidates[content_id] for content_id in CONTENT_IDS if content_id in candidates), None)
+    if container is None:
+        return None
+
+    return _container_text(container)
+
+def _extract_text_soup(html: Union[str, bytes]) -> Optional[str]:
+    """
+    BeautifulSoup(html.parser)으로 본문 텍스트를 추출하는 함수 (기존 경로)
+
+    Args:
+        html (Union[str, bytes]): 기사 페이지 HTML
+
+    Returns:
+        Optional[str]: 공백 정리 전 본문 텍스트, 본문 컨테이너가 없으면 None
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    content = None
+    for selector in (f"#{content_id}" for content_id in CONTENT_IDS):
+        content_tag = soup.select_one(selector)
+        if content_tag:
+            # 불필요한 요소 제거
+            for tag in content_tag.select(".reporter_area, .copyright, .link_news, script, style"):
+                tag.decompose()
+
+            content = content_tag.get_text(strip=True)
+            break
+
+    return content
+
+def extract_content(html: Union[str, bytes], url: str, fast: bool = True,
+                    encoding: Optional[str] = None) -> Optional[str]:
+    """
+    네이버 뉴스 기사 HTML에서 본문 텍스트를 추출하는 함수
+
+    Args:
+        html (Union[str, bytes]): 기사 페이지 HTML (빠른 경로는 응답 바이트를 그대로 사용)
+        url (str): 기사 URL (로그 기록용)
+        fast (bool): lxml 빠른 추출 경로 사용 여부 (기본값: True)
+        encoding (Optional[str]): Content-Type 헤더에 선언된 문자셋
+
+    Returns:
+        Optional[str]: 성공 시 기사 본문 텍스트, 실패 시 None
+
+    Note:
+        - lxml이 없거나 빠른 경로에서 본문을 찾지 못하면 BeautifulSoup 경로로 재시도
+    """
+    content = None
+    if fast and lxml is not None:
+        try:
+            content = _extract_text_lxml(html, encoding)
+        except (etree.LxmlError, ValueError) as e:
+            logging.debug(f"lxml 추출 실패, 기존 경로로 재시도: {url} - {e}")
+
+    if not content:
+        if encoding and isinstance(html, bytes):
+            html = html.decode(encoding, errors="replace")
+        content = _extract_text_soup(html)
+
+    return _clean_text(content, url)
+
+def _clean_text(content: Optional[str], url: str) -> Optional[str]:
+    """추출한 본문의 공백을 정리하고 비었거나 너무 짧은 본문은 None으로 바꾸는 함수"""
+    if not content:
+        logging.error(f"기사 본문을 찾을 수 없습니다: {url}")
+        return None
+
+    # 텍스트 정리
+    content = re.sub(r'\s+', ' ', content)
+    content = content.strip()
+
+    if len(content) < 100:
+        logging.warning(f"기사 본문이 너무 짧습니다: {url}")
+        return None
+
+    return content
+
+def declared_charset(response) -> Optional[str]:
+    """
+    응답의 Content-Type 헤더에 명시된 문자셋을 반환하는 함수 (추측하지 않음)
+
+    Args:
+        response (requests.Response): HTTP 응답
+
+    Returns:
+        Optional[str]: 선언된 문자셋, 없으면 None
+    """
+    match = re.search(r'charset=["\']?([\w.:-]+)', response.headers.get("Content-Type", ""), re.I)
+    return match.group(1) if match else None
+
+class _StreamExtractor:
+    """
+    응답 조각을 받는 대로 파싱하며 닫힌 본문 컨테이너 후보의 텍스트를 모으는 점진 파서
+
+    본문 컨테이너 안쪽이 아닌 요소는 닫히는 즉시 비워 파싱한 트리가 문서 크기만큼 커지지 않게 한다.
+    전체 파싱 경로와 같은 컨테이너(CONTENT_IDS 우선순위가 가장 높은 ID의 문서 순서상 첫 요소)를 고르기 위해
+    ID마다 처음 열린 요소의 텍스트를 보관하고, 우선순위가 가장 높은 ID(dic_area)가 닫혔을 때만 읽기를 멈춘다.
+    """
+
+    def __init__(self, encoding: str):
+        """
+        Args:
+            encoding (str): 응답 바이트를 디코딩할 문자셋
+        """
+        self._parser = etree.HTMLPullParser(events=("start", "end"), encoding=encoding)
+        self._open = 0
+        # ID -> 처음 열린 요소, ID -> (텍스트, 컨테이너 바이트 수)
+        self._first = {}
+        self._closed = {}
+        self.fed = 0
+        self.used = 0
+        self.text: Optional[str] = None
+
+    @property
+    def found(self) -> bool:
+        """본문 컨테이너 후보가 하나라도 닫혔는지 여부"""
+        return bool(self._closed)
+
+    def feed(self, chunk: bytes) -> bool:
+        """응답 조각을 파싱하고, 우선순위가 가장 높은 본문 컨테이너가 닫혔으면 True"""
+        self.fed += len(chunk)
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self) -> bool:
+        """응답을 끝까지 읽은 뒤 남은 태그를 닫고, 본문 컨테이너를 찾았으면 True"""
+        self._parser.close()
+        self._read_events()
+        return self.select()
+
+    def select(self) -> bool:
+        """
+        닫힌 후보 중 우선순위가 가장 높은 컨테이너를 본문으로 고르는 함수 (응답 끝 또는 최대 크기 도달 시)
+
+        Returns:
+            bool: 본문 컨테이너를 찾았으면 True (text, used 설정)
+        """
+        content_id = next((content_id for content_id in CONTENT_IDS if content_id in self._closed), None)
+        if content_id is None:
+            return False
+        self.text, self.used = self._closed[content_id]
+        return True
+
+    def _read_events(self) -> bool:
+        for event, element in self._parser.read_events():
+            content_id = element.get("id")
+            candidate = content_id in CONTENT_IDS
+            if event == "start":
+                if candidate:
+                    self._open += 1
+                    self._first.setdefault(content_id, element)
+                continue
+            if candidate:
+                self._open -= 1
+                if self._first[content_id] is element:
+                    self._closed[content_id] = (_container_text(element),
+                                                len(etree.tostring(element, encoding="utf-8", with_tail=False)))
+                    if content_id == CONTENT_IDS[0]:
+                        return self.select()
+            if not self._open:
+                element.clear()
+        return False
+
+def _finish_stream(response, stopped: bool) -> int:
+    """
+    읽기를 멈춘 응답을 정리하고 추가로 읽은 바이트 수를 반환하는 함수
+
+    남은 본문이 DRAIN_BYTES 이하이면 마저 읽어 연결을 풀에 돌려주고, 더 크거나 길이를 모르면 연결을 닫는다.
+    작업 시간 예산을 모두 사용했으면 남은 본문을 읽지 않고 연결을 닫는다.
+    """
+    drained = 0
+    if stopped and not deadline.expired():
+        length = response.headers.get("Content-Length")
+        remaining = int(length) - response.raw.tell() if length and length.isdigit() else None
+        if remaining is not None and remaining <= DRAIN_BYTES:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                drained += len(chunk)
+        metrics.incr("article_stream_drained" if drained else "article_stream_closed")
+    response.close()
+    return drained
+
+def stream_content(response, url: str, max_bytes: int = MAX_BYTES) -> Optional[str]:
+    """
+    응답 본문을 조각으로 읽으며 본문 컨테이너가 닫히는 즉시 읽기를 멈추고 본문을 추출하는 함수
+
+    Args:
+        response (requests.Response): stream=True로 받은 응답
+        url (str): 기사 URL (로그 기록용)
+        max_bytes (int): 읽을 최대 바이트 수 (압축 해제 기준)
+
+    Returns:
+        Optional[str]: 성공 시 기사 본문 텍스트, 실패 시 None
+
+    Note:
+        - 문자셋은 Content-Type 헤더에 선언된 값을 그대로 사용 (없으면 UTF-8, 본문으로 추측하지 않음)
+        - 우선순위가 가장 높은 컨테이너(dic_area)가 닫히면 바로 멈추고, 아니면 끝까지 읽은 뒤
+          닫힌 후보 중 우선순위로 골라 전체 파싱 경로(extract_content)와 같은 본문을 사용
+        - max_bytes를 넘으면 읽기를 멈추고 그때까지 닫힌 후보 중에서 고름 (없으면 실패 처리,
+          비정상적으로 큰 응답으로부터 메모리 보호)
+        - 후보가 닫히기 전까지만 읽은 조각을 보관하고, 끝까지 읽어도 컨테이너를 찾지 못하면
+          보관한 바이트로 BeautifulSoup 경로(extract_content)를 재시도
+        - 작업 시간 예산을 모두 사용하면 조각 사이에서 읽기를 멈추고 실패 처리 (느린 응답이 예산을 넘기지 않도록,
+          조각 하나를 기다리는 시간은 요청 제한 시간으로 제한됨)
+        - 읽은 바이트(bytes), 전송 바이트(wire_bytes), 본문 컨테이너 크기(bytes_used)를 기사별 계측에 기록
+    """
+    encoding = declared_charset(response) or "utf-8"
+    extractor = _StreamExtractor(encoding)
+    # 컨테이너를 찾지 못한 경우 BeautifulSoup 경로로 재시도할 원문 (후보가 닫히면 버림)
+    buffered = []
+    found = early = capped = expired = False
+    try:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if deadline.expired():
+                expired = True
+                break
+            if extractor.feed(chunk):
+                found = early = True
+                break
+            if extractor.found:
+                buffered = None
+            elif buffered is not None:
+                buffered.append(chunk)
+            if extractor.fed >= max_bytes:
+                found = extractor.select()
+                capped = not found
+                break
+        else:
+            found = extractor.close()
+    finally:
+        drained = _finish_stream(response, early or extractor.fed >= max_bytes)
+
+    downloaded = extractor.fed + drained
+    metrics.incr("http_bytes", downloaded)
+    metrics.incr("article_bytes_downloaded", downloaded)
+    metrics.incr("article_bytes_used", extractor.used)
+    metrics.article(url, bytes=downloaded, wire_bytes=response.raw.tell(), bytes_used=extractor.used)
+
+    if expired:
+        metrics.incr("article_stream_deadline_stops")
+        logging.warning(f"작업 시간 예산을 모두 사용하여 기사 페이지 읽기를 멈춥니다: {url}")
+        return None
+    if capped:
+        metrics.incr("article_size_capped")
+        logging.warning(f"기사 페이지가 최대 크기({max_bytes:,} bytes)를 넘어 읽기를 멈춥니다: {url}")
+        return None
+    if early:
+        metrics.incr("article_stream_early_stops")
+    if not found and buffered:
+        metrics.incr("article_stream_fallbacks")
+        logging.debug(f"스트리밍 경로에서 본문 컨테이너를 찾지 못해 기존 경로로 재시도: {url}")
+        return extract_content(b"".join(buffered), url, fast=False, encoding=declared_charset(response))
+    return _clean_text(extractor.text, url)
+
+def fetch_article(url: str, use_cache: bool = True) -> Optional[str]:
     """
     네이버 뉴스 기사의 본문 내용을 추출하는 함수
-    
+
     Args:
         url (str): 네이버 뉴스 기사의 URL
-        
+        use_cache (bool): 디스크 캐시 및 조건부 요청 사용 여부 (기본값: True)
+
     Returns:
         Optional[str]: 성공 시 기사 본문 텍스트, 실패 시 None
-        
+
     Note:
         - 다양한 네이버 뉴스 페이지 레이아웃에 대응
         - 불필요한 요소(기자 정보, 저작권 등)를 제거
         - 텍스트 정리(공백 정리, 앞뒤 공백 제거)
         - 너무 짧은 본문은 오류로 처리
+        - 캐시된 기사는 If-None-Match/If-Modified-Since로 재검증하며,
+          304 응답 시 다운로드와 파싱을 모두 생략
+        - BRIEFY_FETCH_STREAM=1(기본값)이고 lxml이 있으면 본문 컨테이너까지만 받음 (stream_content)
     """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
-        }
-        
-        response = requests.get(url, headers=headers, timeout=20)
+        cache = get_cache() if use_cache else None
+        cached = cache.get(url) if cache else None
+
+        # 캐시된 검증자로 조건부 요청 헤더 구성
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        # 공유 세션 사용 (keep-alive 연결 재사용 및 재시도, 응답이 늦으면 중복 요청)
+        # 제한 시간은 작업 시간 예산의 남은 시간 이하로 줄어듦
+        stream = STREAM and lxml is not None
+        response = http_client.hedged_get(url, timeout=20, headers=headers, stream=stream)
+
+        metrics.article(url, retries=http_client.retry_count(response))
+        if not stream:
+            metrics.article(url, bytes=len(response.content))
+        elif response.status_code != 200:
+            # 304, 오류 응답은 본문을 읽지 않음
+            response.close()
+
+        if response.status_code == 304 and cached:
+            cache.touch(url)
+            metrics.incr("article_cache_hits")
+            metrics.article(url, cache="revalidated")
+            logging.debug(f"기사 캐시 재사용 (304): {url}")
+            return cached["content"]
+
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # 네이버 뉴스 본문 선택자 업데이트
-        content_selectors = [
-            "#dic_area",                # 일반 기사
-            "#articeBody",              # 스포츠 기사
-            "#newsEndContents",         # 연예 기사
-            "#article_body",            # 일부 기사
-            "#newsct_article"           # 새로운 형식
-        ]
-        
-        content = None
-        for selector in content_selectors:
-            content_tag = soup.select_one(selector)
-            if content_tag:
-                # 불필요한 요소 제거
-                for tag in content_tag.select(".reporter_area, .copyright, .link_news, script, style"):
-                    tag.decompose()
-                    
-                content = content_tag.get_text(strip=True)
-                break
-                
+        metrics.incr("article_cache_misses")
+        metrics.article(url, cache="miss")
+
+        if stream:
+            # 다운로드와 파싱이 겹치므로 둘을 합친 시간을 기록
+            with metrics.timed(url, "stream_seconds"):
+                content = stream_content(response, url)
+        else:
+            with metrics.timed(url, "parse_seconds"):
+                content = extract_content(response.content, url, encoding=declared_charset(response))
         if not content:
-            logging.error(f"기사 본문을 찾을 수 없습니다: {url}")
-            return None
-            
-        # 텍스트 정리
-        content = re.sub(r'\s+', ' ', content)
-        content = content.strip()
-        
-        if len(content) < 100:
-            logging.warning(f"기사 본문이 너무 짧습니다: {url}")
             return None
-            
+
+        if cache:
+            cache.put(
+                url,
+                content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+
         logging.debug(f"기사 본문 추출 성공 (길이: {len(content)}자)")
         return content
-        
+
     except Exception as e:
         logging.error(f"기사 가져오기 실패: {url} - {e}")
         return None
@@ -1,105 +1,288 @@
-import requests
 from bs4 import BeautifulSoup
-import time
-from typing import List, Dict, Optional
+import os
+import math
 import logging
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from modules import http_client, metrics
+from modules.article import Article
+from modules.dedup import NearDuplicateIndex, TITLE_THRESHOLD
+from modules.article_store import ArticleStore
+from modules.keywords import KeywordMatcher, parse_keywords
 
-def fetch_news(limit: int = 10, keyword_filter: Optional[List[str]] = None) -> List[Dict]:
+# 네이버 뉴스 주소
+BASE_URL = "https://news.naver.com"
+# 섹션 첫 페이지와 "기사 더보기"로 불러오는 다음 페이지 (다음 페이지는 목록 HTML을 담은 JSON 응답)
+SECTION_PATH = "/section/{sid}"
+PAGE_PATH = "/section/template/SECTION_ARTICLE_LIST?sid={sid}&pageNo={page}"
+
+# 섹션 번호별 카테고리 이름
+SECTION_NAMES = {
+    "100": "정치",
+    "101": "경제",
+    "102": "사회",
+    "103": "생활/문화",
+    "104": "세계",
+    "105": "IT/과학",
+}
+
+# 수집 대상 설정
+# BRIEFY_SECTIONS: 수집할 섹션 번호 (쉼표 구분, 예: 104,101,105 - 기본값: 세계)
+# BRIEFY_SECTION_PAGES: 섹션마다 볼 최대 목록 페이지 수 (앞 페이지에서 limit를 채우면 뒤 페이지는 받지 않음)
+# BRIEFY_LISTING_WORKERS: 목록 페이지를 동시에 받을 스레드 수
+# BRIEFY_KEYWORDS: 제목에 하나 이상 포함되어야 하는 키워드 (쉼표 구분, 비우면 거르지 않음)
+SECTIONS = [sid.strip() for sid in os.getenv("BRIEFY_SECTIONS", "104").split(",") if sid.strip()]
+SECTION_PAGES = int(os.getenv("BRIEFY_SECTION_PAGES", "1"))
+LISTING_WORKERS = int(os.getenv("BRIEFY_LISTING_WORKERS", "4"))
+KEYWORDS = parse_keywords(os.getenv("BRIEFY_KEYWORDS", ""))
+
+# 목록 항목 선택자 (HTML 구조에 맞게 수정된 선택자)
+SELECTORS = [
+    "ul.sa_list li.sa_item",                 # 메인 리스트
+    "ul._SECTION_HEADLINE_LIST_CONTENT li",  # 헤드라인
+    "ul._SECTION_CONTENT li"                 # 일반 기사
+]
+
+def listing_url(sid: str, page: int = 1, base_url: str = BASE_URL) -> str:
     """
-    네이버 뉴스의 세계 섹션에서 최신 뉴스를 수집하는 함수
-    
+    섹션 목록 페이지 URL을 만드는 함수
+
     Args:
-        limit (int): 수집할 최대 기사 수 (기본값: 10)
-        keyword_filter (Optional[List[str]]): 필터링할 키워드 리스트 (미구현)
-        
+        sid (str): 섹션 번호
+        page (int): 페이지 번호 (1부터 시작)
+        base_url (str): 네이버 뉴스 주소 (벤치마크에서는 로컬 서버)
+
     Returns:
-        List[Dict]: 수집된 기사 정보를 담은 딕셔너리 리스트
+        str: 목록 페이지 URL
+    """
+    path = SECTION_PATH if page <= 1 else PAGE_PATH
+    return base_url + path.format(sid=sid, page=page)
+
+def _listing_html(response) -> str:
+    """목록 응답에서 HTML을 꺼내는 함수 (다음 페이지 JSON 응답은 renderedComponent의 HTML을 합침)"""
+    if "json" not in response.headers.get("Content-Type", ""):
+        return response.text
+    components = response.json().get("renderedComponent", {})
+    return "\n".join(value for value in components.values() if isinstance(value, str))
+
+def parse_listing(page_html: str) -> List[Dict]:
+    """
+    목록 페이지 HTML에서 기사 제목, 링크, 언론사를 페이지 순서대로 추출하는 함수
+
+    Args:
+        page_html (str): 목록 페이지 HTML
+
+    Returns:
+        List[Dict]: title, link, press를 담은 딕셔너리 리스트 (같은 링크는 한 번만)
+    """
+    soup = BeautifulSoup(page_html, "html.parser")
+    items = []
+    links = set()
+
+    for selector in SELECTORS:
+        tags = soup.select(selector)
+        logging.debug(f"선택자 '{selector}' 결과: {len(tags)}개")
+
+        for tag in tags:
+            try:
+                # 제목과 링크 찾기
+                title_tag = tag.select_one("a.sa_text_title strong.sa_text_strong")
+                link_tag = tag.select_one("a.sa_text_title")
+                if not title_tag or not link_tag:
+                    continue
+
+                title = title_tag.get_text(strip=True)
+                link = link_tag.get('href', '')
+                if not link.startswith('http'):
+                    link = f"{BASE_URL}{link}"
+                if not title or len(title) < 5 or link in links:
+                    continue
+
+                # 언론사 찾기
+                press_tag = tag.select_one("div.sa_text_press")
+                press = press_tag.get_text(strip=True) if press_tag else "Unknown"
+
+                links.add(link)
+                items.append({"title": title, "link": link, "press": press})
+            except Exception as e:
+                logging.error(f"기사 항목 처리 중 오류: {e}")
+                continue
+    return items
+
+def _fetch_listing(url: str) -> List[Dict]:
+    """
+    목록 페이지 하나를 받아 기사 항목을 추출하는 함수 (수집 스레드에서 실행)
+
+    Note:
+        - 한 섹션의 실패가 다른 섹션 수집을 막지 않도록 오류는 로그만 남기고 빈 목록 반환
+    """
+    try:
+        # 공유 세션 사용 (keep-alive 연결 재사용 및 재시도)
+        response = http_client.get(url, timeout=30)
+        response.raise_for_status()
+        metrics.incr("listing_pages")
+        return parse_listing(_listing_html(response))
+    except Exception as e:
+        logging.error(f"목록 페이지 수집 실패: {url} - {e}")
+        return []
+
+def _interleave(sections: List[str], listings: List[List[Dict]]) -> Iterator[Tuple[str, Dict]]:
+    """
+    섹션별 목록을 같은 순위끼리 번갈아 내보내는 함수 (섹션마다 1위, 2위, ... 순서)
+
+    Yields:
+        Tuple[str, Dict]: (섹션 번호, 목록 항목)
+    """
+    for rank in range(max((len(listing) for listing in listings), default=0)):
+        for sid, listing in zip(sections, listings):
+            if rank < len(listing):
+                yield sid, listing[rank]
+
+def fetch_news(limit: int = 10, keyword_filter: Optional[Union[List[str], KeywordMatcher]] = None,
+               dedup_threshold: Optional[float] = TITLE_THRESHOLD, store: Optional[ArticleStore] = None,
+               sections: Optional[List[str]] = None, pages: Optional[int] = None,
+               base_url: str = BASE_URL) -> List[Article]:
+    """
+    네이버 뉴스의 여러 섹션에서 최신 뉴스를 수집하는 함수
+
+    Args:
+        limit (int): 수집할 최대 기사 수 (모든 섹션을 합친 상위 limit개, 기본값: 10)
+        keyword_filter (Optional[Union[List[str], KeywordMatcher]]): 제목에 하나 이상 포함되어야 하는 키워드
+            (기본값: BRIEFY_KEYWORDS, 빈 목록이면 거르지 않음, 여러 번 호출할 때는 미리 만든 KeywordMatcher 전달)
+        dedup_threshold (Optional[float]): 제목 유사 중복 후보 판정 기준 (단어 단위)
+            (기본값: BRIEFY_DEDUP_TITLE_THRESHOLD, None이면 제목을 비교하지 않음)
+        store (Optional[ArticleStore]): 처리 기록 저장소 (지정하면 이전 실행에서 처리한 기사는 제외하고
+            새 기사로 limit를 채움)
+        sections (Optional[List[str]]): 수집할 섹션 번호 목록 (기본값: BRIEFY_SECTIONS)
+        pages (Optional[int]): 섹션마다 볼 최대 목록 페이지 수 (기본값: BRIEFY_SECTION_PAGES)
+        base_url (str): 네이버 뉴스 주소 (벤치마크에서는 로컬 서버)
+
+    Returns:
+        List[Article]: 수집된 기사 목록 (요약 전)
         각 딕셔너리는 다음 키를 포함:
         - title: 기사 제목
         - link: 기사 URL
         - press: 언론사명
-        - category: 뉴스 카테고리
+        - category: 뉴스 카테고리 (섹션 이름)
         - timestamp: 수집 시간
+        - alternates: 같은 기사를 보도한 다른 언론사 목록 (본문 비교 후 채워짐)
+
+    Note:
+        - 제목이 유사한 기사도 목록 단계에서는 합치지 않고 수집하며, 본문 유사 중복 판정
+          (main.collapse_duplicates, 스트리밍 파이프라인의 dedup 단계)에서 본문이 같을 때만 합침
+          ("영업이익 증가"/"영업이익 감소"처럼 한 단어만 다른 제목은 다른 기사)
+    """
+    return list(iter_news(limit, keyword_filter, dedup_threshold, store, sections, pages, base_url))
+
+def iter_news(limit: int = 10, keyword_filter: Optional[Union[List[str], KeywordMatcher]] = None,
+              dedup_threshold: Optional[float] = TITLE_THRESHOLD, store: Optional[ArticleStore] = None,
+              sections: Optional[List[str]] = None, pages: Optional[int] = None,
+              base_url: str = BASE_URL) -> Iterator[Article]:
     """
+    fetch_news와 같은 기사를 목록 항목을 해석하는 즉시 하나씩 내보내는 제너레이터
+    (스트리밍 파이프라인에서 목록 해석이 끝나기 전에 본문 수집을 시작하기 위해 사용)
+
+    Args:
+        fetch_news와 동일
+
+    Yields:
+        Article: 기사 (fetch_news 결과 항목과 같은 형식)
+
+    Note:
+        - 순위는 (페이지, 페이지 안의 순서) 기준이며 같은 순위는 섹션을 번갈아 배치
+        - 모든 섹션의 첫 페이지를 동시에 받고, 첫 페이지에서 채운 기사 수로 limit를 채우는 데 필요한
+          다음 페이지 수를 추정하여 그만큼만 한꺼번에 요청 (limit를 채우면 남은 요청은 취소)
+        - 제목이 유사한 기사는 중복 후보로 집계만 하고 그대로 내보냄 (합칠지는 본문 비교로 확인)
+    """
+    executor = None
+    waves: Dict[int, List[Future]] = {}
     try:
         logging.info("뉴스 수집 시작")
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0",
-            "Accept-Language": "ko-KR,ko;q=0.9"
-        }
-        
-        response = requests.get("https://news.naver.com/section/104", headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
+        sections = list(sections or SECTIONS)
+        pages = max(pages or SECTION_PAGES, 1)
+        if isinstance(keyword_filter, KeywordMatcher):
+            matcher = keyword_filter
+        else:
+            matcher = KeywordMatcher(KEYWORDS if keyword_filter is None else keyword_filter)
+
         articles = []
         seen_links = set()
-        
-        # 디스 아이템 찾기 (HTML 구조에 맞게 수정된 선택자)
-        selectors = [
-            "ul.sa_list li.sa_item",                 # 메인 리스트
-            "ul._SECTION_HEADLINE_LIST_CONTENT li",  # 헤드라인
-            "ul._SECTION_CONTENT li"                 # 일반 기사
-        ]
-        
-        for selector in selectors:
-            items = soup.select(selector)
-            logging.debug(f"선택자 '{selector}' 결과: {len(items)}개")
-            
-            for item in items:
-                try:
-                    # 제목과 링크 찾기
-                    title_tag = item.select_one("a.sa_text_title strong.sa_text_strong")
-                    if not title_tag:
-                        continue
-                        
-                    title = title_tag.get_text(strip=True)
-                    
-                    # 링크 찾기
-                    link_tag = item.select_one("a.sa_text_title")
-                    if not link_tag:
-                        continue
-                        
-                    link = link_tag.get('href', '')
-                    if not link.startswith('http'):
-                        link = f"https://news.naver.com{link}"
-                        
-                    if not title or len(title) < 5 or link in seen_links:
-                        continue
-                        
-                    # 언론사 찾기
-                    press_tag = item.select_one("div.sa_text_press")
-                    press = press_tag.get_text(strip=True) if press_tag else "Unknown"
-                    
-                    seen_links.add(link)
-                    articles.append({
-                        "title": title,
-                        "link": link,
-                        "press": press,
-                        "category": "세계",
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
-                    
-                    logging.debug(f"기사 추가됨: {title}")
-                    
-                    if len(articles) >= limit:
-                        break
-                        
-                except Exception as e:
-                    logging.error(f"기사 항목 처리 중 오류: {e}")
+        title_index = NearDuplicateIndex(dedup_threshold, shingle_size=1, words=True) if dedup_threshold else None
+        similar_titles = 0
+        skipped = 0
+        filtered = 0
+
+        executor = ThreadPoolExecutor(max_workers=max(LISTING_WORKERS, 1), thread_name_prefix="listing")
+
+        def submit(page: int):
+            if page <= pages and page not in waves:
+                waves[page] = [executor.submit(_fetch_listing, listing_url(sid, page, base_url))
+                               for sid in sections]
+
+        submit(1)
+        for page in range(1, pages + 1):
+            submit(page)
+            listings = [future.result() for future in waves[page]]
+            candidates = list(_interleave(sections, listings))
+
+            # 이전 실행에서 처리한 기사 URL을 페이지마다 한 번에 조회
+            seen_before = store.seen_urls(item["link"] for _, item in candidates) if store else set()
+            before = len(articles)
+
+            for sid, item in candidates:
+                title, link = item["title"], item["link"]
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                if matcher and not matcher.matches(title):
+                    filtered += 1
                     continue
-                    
-            if len(articles) >= limit:
+                if link in seen_before:
+                    skipped += 1
+                    continue
+
+                article = Article(title, link, item["press"], SECTION_NAMES.get(sid, sid))
+
+                # 제목이 유사한 기사도 수집하고, 같은 기사인지는 본문 비교로 확인 (제목만으로 합치지 않음)
+                if title_index and title_index.add(len(articles), title) is not None:
+                    similar_titles += 1
+                    logging.debug(f"제목 유사 기사 (본문 비교로 중복 확인): {title}")
+
+                articles.append(article)
+                logging.debug(f"기사 추가됨: {title}")
+                yield article
+
+                if len(articles) >= limit:
+                    break
+
+            if len(articles) >= limit or not candidates:
                 break
-                
+            # 이번 페이지에서 채운 비율로 남은 기사 수에 필요한 페이지를 추정하여 한꺼번에 요청
+            # (하나도 채우지 못했으면 추정할 수 없으므로 남은 페이지를 모두 요청)
+            gained = len(articles) - before
+            ahead = math.ceil((limit - len(articles)) / gained) if gained else pages
+            for following in range(page + 1, page + 1 + ahead):
+                submit(following)
+
+        if filtered:
+            logging.info(f"키워드와 맞지 않는 기사 {filtered}건 제외")
+        if skipped:
+            logging.info(f"이전 실행에서 처리한 기사 {skipped}건 제외")
+        if similar_titles:
+            metrics.incr("title_duplicate_candidates", similar_titles)
+            logging.info(f"제목 유사 기사 {similar_titles}건 (본문 비교로 중복 여부 확인)")
+
         if not articles:
             logging.warning("기사를 찾을 수 없습니다.")
         else:
-            logging.info(f"총 {len(articles)}개의 기사 수집 완료")
-            
-        return articles[:limit]
-        
+            logging.info(f"총 {len(articles)}개의 기사 수집 완료 (섹션 {len(sections)}개, 페이지 {len(waves)}개까지 요청)")
+
     except Exception as e:
         logging.error(f"뉴스 수집 실패: {e}")
-        return []
+    finally:
+        # limit를 채웠거나 소비자가 중단하면 아직 시작하지 않은 목록 요청은 취소
+        for futures in waves.values():
+            for future in futures:
+                future.cancel()
+        if executor:
+            executor.shutdown(wait=False)
@@ -0,0 +1,318 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Deque, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from modules import metrics, deadline
+from modules.circuit_breaker import CircuitOpenError, HostCircuitBreaker
+
+# brotli 패키지가 설치된 경우에만 br 압축을 요청 (urllib3가 해제 가능해야 함)
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# 모든 요청에 공통으로 사용하는 헤더
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "Connection": "keep-alive"
+}
+
+# 연결 풀 및 재시도 설정
+# BRIEFY_HTTP_POOL_SIZE: 호스트당 유지할 keep-alive 연결 수
+# BRIEFY_HTTP_RETRIES: 429/5xx 응답 및 연결 오류 시 최대 재시도 횟수
+# BRIEFY_HTTP_BACKOFF: 지수 백오프 기본 간격 (초)
+POOL_SIZE = int(os.getenv("BRIEFY_HTTP_POOL_SIZE", "10"))
+MAX_RETRIES = int(os.getenv("BRIEFY_HTTP_RETRIES", "3"))
+BACKOFF_FACTOR = float(os.getenv("BRIEFY_HTTP_BACKOFF", "0.5"))
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 지연 요청 중복 전송(hedging) 설정
+# BRIEFY_HEDGE: 응답이 늦은 요청에 같은 요청을 한 번 더 보내 먼저 온 응답을 사용할지 (1: 사용, 0: 사용 안 함)
+# BRIEFY_HEDGE_QUANTILE: 호스트별 응답 시간의 이 분위수를 넘으면 중복 요청 (기본값: p95)
+# BRIEFY_HEDGE_DELAY: 응답 시간 표본이 부족할 때 중복 요청까지 기다릴 시간 (초)
+HEDGE = os.getenv("BRIEFY_HEDGE", "1") == "1"
+HEDGE_QUANTILE = float(os.getenv("BRIEFY_HEDGE_QUANTILE", "0.95"))
+HEDGE_DELAY = float(os.getenv("BRIEFY_HEDGE_DELAY", "2.0"))
+HEDGE_MIN_SAMPLES = 10
+LATENCY_WINDOW = 200
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_breaker = HostCircuitBreaker()
+_latencies: Dict[str, Deque[float]] = {}
+_latency_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+class _DeadlineRetry(Retry):
+    """
+    작업 시간 예산을 넘기지 않는 재시도 정책
+
+    예산을 모두 사용했으면 더 이상 재시도하지 않고, 백오프와 Retry-After 대기 시간을 남은 예산 이하로 줄인다.
+    (재시도마다 같은 제한 시간을 다시 쓰므로 예산 없이 재시도하면 제한 시간의 몇 배까지 걸릴 수 있음)
+    """
+
+    def increment(self, *args, **kwargs):
+        if deadline.expired():
+            # 남은 재시도 횟수를 0으로 만들어 urllib3의 재시도 소진 처리(MaxRetryError 또는 응답 반환)를 따름
+            exhausted = self.new(total=0, connect=0, read=0, status=0, other=0)
+            return super(_DeadlineRetry, exhausted).increment(*args, **kwargs)
+        return super().increment(*args, **kwargs)
+
+    def get_backoff_time(self) -> float:
+        return max(min(super().get_backoff_time(), deadline.current().remaining()), 0)
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return max(min(retry_after, deadline.current().remaining()), 0)
+
+def create_session(pool_size: int = POOL_SIZE, retries: int = MAX_RETRIES,
+                   backoff_factor: float = BACKOFF_FACTOR) -> requests.Session:
+    """
+    연결 풀과 재시도 정책이 적용된 HTTP 세션을 생성하는 함수
+
+    Args:
+        pool_size (int): 호스트당 keep-alive 연결 풀 크기
+        retries (int): 최대 재시도 횟수
+        backoff_factor (float): 지수 백오프 기본 간격 (초)
+
+    Returns:
+        requests.Session: 설정이 적용된 세션
+
+    Note:
+        - 429/5xx 응답 시 지터가 포함된 지수 백오프로 재시도
+        - Retry-After 헤더가 있으면 해당 시간을 우선 적용
+        - 마지막 재시도까지 실패하면 응답을 그대로 반환 (호출 측에서 raise_for_status 처리)
+        - 작업 시간 예산을 모두 사용했으면 재시도하지 않음
+    """
+    retry = _DeadlineRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        status_forcelist=RETRY_STATUS,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_factor,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_session() -> requests.Session:
+    """
+    프로세스 전체에서 공유하는 HTTP 세션을 반환하는 함수
+
+    Returns:
+        requests.Session: 공유 세션 (최초 호출 시 생성)
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+def get(url: str, timeout: float = 20, **kwargs) -> requests.Response:
+    """
+    공유 세션으로 GET 요청을 보내는 함수
+
+    Args:
+        url (str): 요청할 URL
+        timeout (float): 요청 제한 시간 (초)
+        **kwargs: requests.Session.get에 전달할 추가 인자
+
+    Returns:
+        requests.Response: 응답 객체
+
+    Note:
+        - 요청 수, 다운로드 바이트, 재시도 횟수, 실패 수를 실행 계측에 기록
+        - 작업 시간 예산이 설정되어 있으면 제한 시간을 남은 예산 이하로 줄이고,
+          예산을 모두 사용했으면 요청하지 않고 DeadlineExceeded 발생
+        - 연속으로 실패한 호스트는 차단기가 열려 있는 동안 요청하지 않고 CircuitOpenError 발생
+    """
+    timeout = deadline.timeout(timeout)
+    if not _breaker.allow(url):
+        metrics.incr("http_circuit_open")
+        raise CircuitOpenError(f"요청이 차단된 호스트입니다: {urlparse(url).netloc}")
+
+    start = time.monotonic()
+    try:
+        response = get_session().get(url, timeout=timeout, **kwargs)
+    except requests.RequestException:
+        _breaker.record(url, False)
+        metrics.incr("http_errors")
+        raise
+
+    ok = response.status_code not in RETRY_STATUS
+    _breaker.record(url, ok)
+    if ok:
+        _observe(url, time.monotonic() - start)
+    metrics.incr("http_requests")
+    retries = retry_count(response)
+    if retries:
+        metrics.incr("http_retries", retries)
+    if not kwargs.get("stream"):
+        metrics.incr("http_bytes", len(response.content))
+    return response
+
+def _observe(url: str, seconds: float):
+    """호스트별 최근 응답 시간을 기록하는 함수"""
+    host = urlparse(url).netloc.lower()
+    with _latency_lock:
+        samples = _latencies.get(host)
+        if samples is None:
+            samples = _latencies[host] = deque(maxlen=LATENCY_WINDOW)
+        samples.append(seconds)
+
+def hedge_delay(url: str) -> float:
+    """
+    중복 요청을 보내기 전에 기다릴 시간을 반환하는 함수
+
+    Args:
+        url (str): 요청할 URL
+
+    Returns:
+        float: 호스트의 최근 응답 시간 BRIEFY_HEDGE_QUANTILE 분위수,
+        표본이 HEDGE_MIN_SAMPLES개 미만이면 BRIEFY_HEDGE_DELAY
+    """
+    with _latency_lock:
+        samples = sorted(_latencies.get(urlparse(url).netloc.lower(), ()))
+    if len(samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DELAY
+    return samples[min(int(HEDGE_QUANTILE * len(samples)), len(samples) - 1)]
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _session_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(max_workers=POOL_SIZE * 2, thread_name_prefix="hedge")
+    return _hedge_executor
+
+def _close_response(future):
+    """사용하지 않는 쪽 응답의 연결을 풀에 반환"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+def hedged_get(url: str, timeout: float = 20, **kwargs) -> requests.Response:
+    """
+    응답이 늦으면 같은 요청을 한 번 더 보내 먼저 도착한 응답을 사용하는 GET 요청 함수
+
+    Args:
+        url (str): 요청할 URL (같은 요청을 두 번 보내도 안전한 조회 요청만 사용)
+        timeout (float): 요청 제한 시간 (초)
+        **kwargs: requests.Session.get에 전달할 추가 인자
+
+    Returns:
+        requests.Response: 먼저 성공한 응답
+
+    Note:
+        - 첫 요청이 hedge_delay(호스트 응답 시간 p95) 안에 끝나지 않으면 두 번째 요청을 보냄
+          (꼬리 지연이 긴 일부 요청이 전체 작업 시간을 늘리는 것을 방지)
+        - 두 요청이 모두 실패하면 마지막 예외 발생
+        - stream=True이면 응답 헤더가 먼저 도착한 쪽을 사용 (본문은 호출한 쪽에서 읽음)
+        - 중복 요청 수(http_hedges)와 두 번째 요청이 먼저 끝난 횟수(http_hedge_wins)를 계측에 기록
+    """
+    if not HEDGE:
+        return get(url, timeout=timeout, **kwargs)
+
+    executor = _get_hedge_executor()
+    delay = hedge_delay(url)
+    primary = executor.submit(get, url, timeout, **kwargs)
+    done, _ = wait([primary], timeout=delay)
+    if done or deadline.current().remaining() <= delay:
+        return primary.result()
+
+    metrics.incr("http_hedges")
+    backup = executor.submit(get, url, timeout, **kwargs)
+    pending = {primary, backup}
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is not None:
+                error = future.exception()
+                continue
+            # 먼저 성공한 응답을 사용하고, 나머지 요청의 응답은 도착하면 닫음
+            for other in pending:
+                other.add_done_callback(_close_response)
+            for other in done - {future}:
+                _close_response(other)
+            if future is backup:
+                metrics.incr("http_hedge_wins")
+            return future.result()
+    raise error
+
+def retry_count(response: requests.Response) -> int:
+    """
+    응답을 받기까지 재시도한 횟수를 반환하는 함수
+
+    Args:
+        response (requests.Response): 응답 객체
+
+    Returns:
+        int: urllib3 Retry 기록 기준 재시도 횟수
+    """
+    retries = getattr(response.raw, "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+def get_connection_stats() -> Dict[str, int]:
+    """
+    공유 세션의 연결 재사용 통계를 반환하는 함수
+
+    Returns:
+        Dict[str, int]: 다음 키를 포함하는 통계
+        - requests: 전송된 요청 수
+        - opened: 새로 연 연결 수 (TCP+TLS 핸드셰이크 발생)
+        - reused: 기존 연결을 재사용한 요청 수
+
+    Note:
+        - 현재 풀에 남아 있는 호스트만 집계 (풀에서 제거된 호스트는 제외)
+    """
+    stats = {"requests": 0, "opened": 0, "reused": 0}
+    if _session is None:
+        return stats
+
+    seen = set()
+    for adapter in _session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats["requests"] += pool.num_requests
+            stats["opened"] += pool.num_connections
+
+    stats["reused"] = max(stats["requests"] - stats["opened"], 0)
+    return stats
+
+def log_connection_stats():
+    """공유 세션의 연결 재사용 통계를 로그로 기록하는 함수"""
+    stats = get_connection_stats()
+    logging.info(
+        f"HTTP 연결 통계: 요청 {stats['requests']}회, "
+        f"새 연결 {stats['opened']}개, 재사용 {stats['reused']}회"
+    )
@@ -0,0 +1,136 @@
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+class KeywordMatcher:
+    """
+    여러 키워드를 한 번에 찾는 매처
+
+    키워드를 접두사 트리로 모은 뒤, 포함 여부 확인(matches)은 트리 모양의 정규식 하나로,
+    포함된 키워드 찾기(find)는 같은 트리에 실패 링크를 더한 Aho-Corasick 오토마톤으로 처리한다.
+    두 방식 모두 키워드 수와 관계없이 텍스트를 한 번만 훑으므로, 구독자 키워드 수백 개로 기사 제목을 거를 때
+    키워드마다 `keyword in title`을 반복하는 것보다 빠르다. 한국어는 띄어쓰기와 관계없이 포함 여부로
+    판단하므로 단어 경계는 보지 않고, 영문은 대소문자를 구분하지 않는다.
+
+    Note:
+        - 한 번 만든 매처는 읽기 전용이므로 여러 스레드에서 함께 사용해도 안전
+        - 서로 겹치는 키워드("미국", "미국 대선")도 모두 찾음
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords (Iterable[str]): 찾을 키워드 목록 (앞뒤 공백 제거, 빈 문자열은 무시)
+        """
+        self.keywords: List[str] = []
+        # 상태별 전이표, 실패 링크, 출력(끝나는 키워드 번호) - 상태 0이 루트
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[int]] = [set()]
+
+        seen = set()
+        for keyword in keywords:
+            keyword = keyword.strip()
+            key = keyword.casefold()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            self._insert(key, len(self.keywords))
+            self.keywords.append(keyword)
+        # 실패 링크가 출력을 합치기 전에 트리에서 정규식을 만듦
+        self._pattern = re.compile(self._trie_pattern(0), re.IGNORECASE) if self.keywords else None
+        self._link()
+
+    def _insert(self, key: str, index: int):
+        state = 0
+        for char in key:
+            following = self._goto[state].get(char)
+            if following is None:
+                following = len(self._goto)
+                self._goto[state][char] = following
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = following
+        self._output[state].add(index)
+
+    def _trie_pattern(self, state: int) -> str:
+        """state 아래의 트리를 공통 접두사를 한 번만 비교하는 정규식으로 바꾸는 함수"""
+        branches = [re.escape(char) + self._trie_pattern(following)
+                    for char, following in sorted(self._goto[state].items())]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # 키워드가 이 상태에서 끝나면 뒤쪽은 없어도 일치 (짧은 키워드가 긴 키워드의 접두사인 경우)
+        if state and self._output[state]:
+            pattern = "(?:" + pattern + ")?"
+        return pattern
+
+    def _link(self):
+        """너비 우선으로 실패 링크를 만들고 실패 상태의 출력을 합침"""
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, following in self._goto[state].items():
+                pending.append(following)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[following] = target if target != following else 0
+                self._output[following] |= self._output[self._fail[following]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def _scan(self, text: str) -> Iterable[Set[int]]:
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text.casefold():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                yield output[state]
+
+    def matches(self, text: str) -> bool:
+        """
+        텍스트에 키워드가 하나라도 포함되어 있는지 확인하는 함수 (처음 찾으면 바로 반환)
+
+        Args:
+            text (str): 검사할 텍스트 (기사 제목 등)
+
+        Returns:
+            bool: 키워드가 포함되어 있으면 True
+        """
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def find(self, text: str) -> Set[str]:
+        """
+        텍스트에 포함된 키워드를 모두 찾는 함수
+
+        Args:
+            text (str): 검사할 텍스트
+
+        Returns:
+            Set[str]: 포함된 키워드 (생성 시 입력한 표기 그대로)
+        """
+        found = set()
+        for indices in self._scan(text):
+            found |= indices
+        return {self.keywords[index] for index in found}
+
+def parse_keywords(spec: str) -> List[str]:
+    """
+    쉼표로 구분한 키워드 설정 문자열을 목록으로 바꾸는 함수
+
+    Args:
+        spec (str): 키워드 목록 (예: "반도체,금리,미국 대선")
+
+    Returns:
+        List[str]: 공백을 제거한 키워드 목록 (빈 항목 제외)
+    """
+    return [keyword.strip() for keyword in spec.split(",") if keyword.strip()]
@@ -0,0 +1,285 @@
+import os
+import re
+import json
+import time
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+# 실행 계측 설정
+# BRIEFY_METRICS_DIR: 실행별 JSON과 Prometheus 텍스트 파일을 저장할 디렉토리 (비어 있으면 로그만 기록)
+# BRIEFY_PROFILE: 프로파일링 방식 (cprofile, tracemalloc, 쉼표로 둘 다 지정 가능)
+METRICS_DIR = os.getenv("BRIEFY_METRICS_DIR", "")
+PROFILE = {mode.strip() for mode in os.getenv("BRIEFY_PROFILE", "").lower().split(",") if mode.strip()}
+# 작업별 Prometheus 텍스트 파일 (미리 수집 실행이 일일 발송 실행의 값을 덮어쓰지 않도록 작업마다 따로 기록)
+PROM_FILENAME = "briefy_{name}.prom"
+TRACEMALLOC_TOP = 15
+
+class RunMetrics:
+    """
+    작업 한 번 실행 동안의 단계별 시간, 기사별 기록, 카운터를 모으는 객체
+
+    여러 스레드(기사 수집 스레드 풀 등)에서 동시에 기록할 수 있도록 잠금을 사용한다.
+    """
+
+    def __init__(self, name: str = "daily"):
+        """
+        Args:
+            name (str): 작업 이름 (JSON 파일명과 Prometheus 레이블에 사용)
+        """
+        self.name = name
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.status = "incomplete"
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, float] = {}
+        self.articles: Dict[str, Dict] = {}
+        self.profile: Dict = {}
+        self._lock = threading.Lock()
+
+    def add_stage(self, stage: str, seconds: float):
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def incr(self, counter: str, value: float = 1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def article(self, key: str, **fields):
+        with self._lock:
+            record = self.articles.setdefault(key, {})
+            for field, value in fields.items():
+                # 시간/바이트/재시도 등 숫자 항목은 누적 (재요청, 여러 단계 기록)
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and field in record:
+                    record[field] += value
+                else:
+                    record[field] = value
+
+    def to_dict(self) -> Dict:
+        """실행 결과를 JSON으로 직렬화할 수 있는 딕셔너리로 반환하는 함수"""
+        finished_at = self.finished_at or time.time()
+        with self._lock:
+            return {
+                "name": self.name,
+                "status": self.status,
+                "started_at": datetime.fromtimestamp(self.started_at).isoformat(timespec="seconds"),
+                "duration_seconds": round(finished_at - self.started_at, 4),
+                "stages": {stage: round(seconds, 4) for stage, seconds in self.stages.items()},
+                "counters": dict(self.counters),
+                "articles": [dict(record, key=key) for key, record in self.articles.items()],
+                "profile": dict(self.profile)
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        실행 결과를 Prometheus 텍스트 형식(node_exporter textfile collector용)으로 반환하는 함수
+
+        Note:
+            - 파일은 작업마다 따로 두고 실행마다 덮어쓰므로 모든 값은 작업별 마지막 실행 기준 gauge로 기록
+              (textfile collector가 작업별 파일을 job 레이블로 구분하여 함께 수집)
+        """
+        data = self.to_dict()
+        job = _escape_label(self.name)
+        lines = [
+            "# HELP briefy_run_duration_seconds Wall time of the last run.",
+            "# TYPE briefy_run_duration_seconds gauge",
+            f'briefy_run_duration_seconds{{job="{job}"}} {data["duration_seconds"]}',
+            "# HELP briefy_run_timestamp_seconds Unix time the last run started.",
+            "# TYPE briefy_run_timestamp_seconds gauge",
+            f'briefy_run_timestamp_seconds{{job="{job}"}} {self.started_at:.0f}',
+            "# HELP briefy_run_success Whether the last run finished successfully.",
+            "# TYPE briefy_run_success gauge",
+            f'briefy_run_success{{job="{job}"}} {int(self.status == "ok")}',
+            "# HELP briefy_stage_seconds Wall time per pipeline stage in the last run.",
+            "# TYPE briefy_stage_seconds gauge"
+        ]
+        for stage, seconds in data["stages"].items():
+            lines.append(f'briefy_stage_seconds{{job="{job}",stage="{_escape_label(stage)}"}} {seconds}')
+
+        for counter, value in sorted(data["counters"].items()):
+            metric = "briefy_" + re.sub(r"[^a-zA-Z0-9_]", "_", counter)
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f'{metric}{{job="{job}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+class _NullMetrics(RunMetrics):
+    """실행 중이 아닐 때 사용하는 기록하지 않는 객체 (모듈을 단독으로 호출하는 경우)"""
+
+    def add_stage(self, stage: str, seconds: float):
+        pass
+
+    def incr(self, counter: str, value: float = 1):
+        pass
+
+    def article(self, key: str, **fields):
+        pass
+
+_NULL = _NullMetrics()
+_current: RunMetrics = _NULL
+_last: Optional[RunMetrics] = None
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def current() -> RunMetrics:
+    """
+    현재 실행 중인 작업의 계측 객체를 반환하는 함수
+
+    Returns:
+        RunMetrics: 실행 중이 아니면 아무것도 기록하지 않는 객체
+    """
+    return _current
+
+def last_run() -> Optional[RunMetrics]:
+    """
+    마지막으로 끝난 실행의 계측 객체를 반환하는 함수 (실행 결과 status 확인용)
+
+    Returns:
+        Optional[RunMetrics]: 끝난 실행이 없으면 None
+    """
+    return _last
+
+def incr(counter: str, value: float = 1):
+    """현재 실행의 카운터를 증가시키는 함수 (예: http_bytes, article_cache_hits)"""
+    _current.incr(counter, value)
+
+def article(key: str, **fields):
+    """현재 실행의 기사별 기록(시간, 바이트, 캐시 여부, 실패 등)을 추가하는 함수"""
+    _current.article(key, **fields)
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    코드 블록의 실행 시간을 단계 시간으로 기록하는 컨텍스트 매니저
+
+    Args:
+        name (str): 단계 이름 (같은 이름으로 여러 번 기록하면 합산)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current.add_stage(name, time.perf_counter() - start)
+
+@contextmanager
+def timed(key: str, field: str) -> Iterator[None]:
+    """
+    코드 블록의 실행 시간을 기사별 기록의 항목으로 추가하는 컨텍스트 매니저
+
+    Args:
+        key (str): 기사 식별자 (기사 URL)
+        field (str): 기록할 항목 이름 (예: fetch_seconds)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current.article(key, **{field: round(time.perf_counter() - start, 4)})
+
+@contextmanager
+def run(name: str = "daily", output_dir: Optional[str] = None) -> Iterator[RunMetrics]:
+    """
+    작업 한 번의 실행을 계측하는 컨텍스트 매니저
+
+    Args:
+        name (str): 작업 이름
+        output_dir (Optional[str]): 결과 저장 디렉토리 (기본값: BRIEFY_METRICS_DIR)
+
+    Yields:
+        RunMetrics: 이번 실행의 계측 객체 (status는 호출 측에서 "ok"로 설정)
+
+    Note:
+        - 종료 시 단계별 시간을 로그로 남기고, 디렉토리가 설정되어 있으면
+          {name}_{시작 시각}.json과 briefy_{name}.prom 파일을 기록 (.prom은 같은 작업의 이전 실행만 교체)
+        - BRIEFY_PROFILE=cprofile이면 실행 스레드의 cProfile 결과(.prof)를 저장하고
+          누적 시간 상위 함수를 JSON에 포함 (스레드 풀 작업자는 포함되지 않음)
+        - BRIEFY_PROFILE=tracemalloc이면 최대 메모리와 할당 위치 상위 항목을 JSON에 포함
+    """
+    global _current, _last
+    if output_dir is None:
+        output_dir = METRICS_DIR
+
+    metrics = RunMetrics(name)
+    previous = _current
+    _current = metrics
+
+    profiler = None
+    if "cprofile" in PROFILE:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    trace_memory = "tracemalloc" in PROFILE and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        yield metrics
+    except BaseException:
+        metrics.status = "error"
+        raise
+    finally:
+        metrics.finished_at = time.time()
+        _current = previous
+        _last = metrics
+        if profiler:
+            profiler.disable()
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            metrics.profile["tracemalloc_peak_bytes"] = peak
+            metrics.profile["tracemalloc_top"] = [
+                {"location": str(stat.traceback), "bytes": stat.size, "count": stat.count}
+                for stat in snapshot.statistics("lineno")[:TRACEMALLOC_TOP]
+            ]
+        _finish(metrics, output_dir, profiler)
+
+def _finish(metrics: RunMetrics, output_dir: str, profiler):
+    """실행 결과를 로그로 기록하고 설정된 디렉토리에 저장하는 함수"""
+    data = metrics.to_dict()
+    stages = ", ".join(f"{stage} {seconds:.2f}초" for stage, seconds in data["stages"].items())
+    logging.info(f"실행 계측 ({data['status']}): 전체 {data['duration_seconds']:.2f}초 - {stages or '단계 없음'}")
+
+    if not output_dir:
+        if profiler:
+            _log_profile(profiler)
+        return
+
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        stamp = datetime.fromtimestamp(metrics.started_at).strftime("%Y%m%d_%H%M%S")
+
+        if profiler:
+            profile_path = os.path.join(output_dir, f"{metrics.name}_{stamp}.prof")
+            profiler.dump_stats(profile_path)
+            data["profile"]["cprofile_path"] = profile_path
+            data["profile"]["cprofile_top"] = _profile_top(profiler)
+
+        with open(os.path.join(output_dir, f"{metrics.name}_{stamp}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        # textfile collector가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        prom_path = os.path.join(output_dir, PROM_FILENAME.format(name=metrics.name))
+        with open(prom_path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(metrics.to_prometheus())
+        os.replace(prom_path + ".tmp", prom_path)
+    except OSError as e:
+        logging.error(f"실행 계측 결과 저장 실패: {e}")
+
+def _profile_top(profiler, limit: int = 20):
+    """cProfile 결과에서 누적 시간 상위 함수를 추출하는 함수"""
+    import pstats
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {"function": f"{path}:{line}({func})", "calls": calls, "cumulative_seconds": round(cumulative, 4)}
+        for (path, line, func), (_, calls, _, cumulative, _) in rows
+    ]
+
+def _log_profile(profiler, limit: int = 20):
+    """저장 디렉토리가 없을 때 cProfile 상위 함수를 로그로 기록하는 함수"""
+    for row in _profile_top(profiler, limit):
+        logging.info(f"프로파일: {row['cumulative_seconds']:.3f}초 {row['calls']}회 {row['function']}")
@@ -0,0 +1,223 @@
+import os
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from modules import metrics
+
+# 스트리밍 파이프라인 설정
+# BRIEFY_PIPELINE_QUEUE: 단계 사이 큐의 최대 항목 수 (가득 차면 앞 단계가 기다림)
+QUEUE_SIZE = int(os.getenv("BRIEFY_PIPELINE_QUEUE", "8"))
+
+# 큐 대기 중에도 취소 여부를 확인하는 간격 (초)
+_POLL = 0.1
+
+class _Done:
+    """단계 입력이 끝났음을 알리는 표시"""
+
+_DONE = _Done()
+
+def parse_workers(spec: str) -> Dict[str, int]:
+    """
+    단계별 스레드 수 설정 문자열을 해석하는 함수
+
+    Args:
+        spec (str): 쉼표로 구분한 "단계=스레드 수" 목록 (예: "fetch=4,summarize=2")
+
+    Returns:
+        Dict[str, int]: {단계 이름: 스레드 수}
+    """
+    workers = {}
+    for entry in (part.strip() for part in spec.split(",")):
+        if not entry:
+            continue
+        name, _, count = entry.partition("=")
+        try:
+            workers[name.strip()] = max(int(count), 1)
+        except ValueError:
+            logging.warning(f"잘못된 단계별 스레드 수 설정을 무시합니다: {entry}")
+    return workers
+
+class Stage:
+    """
+    파이프라인의 한 단계
+
+    func는 항목 하나를 받아 다음 단계로 넘길 값을 반환하고, None을 반환하면 그 항목은 버려진다.
+    batch_size가 1보다 크면 입력 큐에 쌓인 항목을 최대 batch_size개까지 모아 목록으로 전달하고,
+    func는 같은 길이의 결과 목록을 반환한다 (배치 요약 엔진용).
+    """
+
+    def __init__(self, name: str, func: Callable, workers: int = 1, batch_size: int = 1):
+        """
+        Args:
+            name (str): 단계 이름 (로그와 계측에 사용)
+            func (Callable): 항목(또는 항목 목록)을 처리하는 함수
+            workers (int): 이 단계를 동시에 실행할 스레드 수
+            batch_size (int): 한 번에 처리할 최대 항목 수
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+
+class Pipeline:
+    """
+    단계를 크기가 제한된 큐로 연결하여 동시에 실행하는 스트리밍 파이프라인
+
+    원본 이터레이터의 항목이 나오는 즉시 첫 단계가 처리를 시작하고, 각 단계는 앞 단계가 끝나기를
+    기다리지 않고 도착한 항목부터 처리한다. 큐가 가득 차면 앞 단계가 기다리므로(역압)
+    느린 단계 앞에 항목이 무한히 쌓이지 않는다. 전체 소요 시간은 단계별 시간의 합이 아니라
+    가장 느린 단계의 시간에 가까워진다.
+
+    Note:
+        - 항목별 예외는 로그로 남기고 그 항목만 버림 (나머지 처리는 계속)
+        - 원본 이터레이터에서 발생한 예외는 결과를 모두 내보낸 뒤 다시 발생
+        - 결과를 끝까지 읽지 않고 중단하면(close, break) 남은 단계를 취소
+    """
+
+    def __init__(self, source: Iterable, stages: List[Stage], queue_size: int = QUEUE_SIZE,
+                 ordered: bool = True):
+        """
+        Args:
+            source (Iterable): 첫 단계에 넣을 항목 이터레이터
+            stages (List[Stage]): 실행할 단계 목록 (순서대로 연결)
+            queue_size (int): 단계 사이 큐의 최대 항목 수
+            ordered (bool): 결과를 원본 순서대로 내보낼지 여부 (False면 끝난 순서)
+        """
+        self.source = source
+        self.stages = stages
+        self.queue_size = max(queue_size, 1)
+        self.ordered = ordered
+        self._cancelled = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        while not self._cancelled.is_set():
+            try:
+                target.put(item, timeout=_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        while not self._cancelled.is_set():
+            try:
+                return source.get(timeout=_POLL)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _feed(self, output: queue.Queue, downstream: int):
+        """원본 이터레이터의 항목에 순번을 붙여 첫 단계 큐에 넣는 스레드"""
+        try:
+            for seq, item in enumerate(self.source):
+                if not self._put(output, (seq, item)):
+                    return
+        except Exception as e:
+            logging.error(f"파이프라인 입력 처리 중 오류 발생: {e}")
+            self._error = e
+        finally:
+            for _ in range(downstream):
+                self._put(output, _DONE)
+
+    def _work(self, stage: Stage, source: queue.Queue, output: queue.Queue, finished: Callable[[], None]):
+        """단계 작업 스레드 (입력이 끝나면 finished 호출)"""
+        done = False
+        while not done:
+            item = self._get(source)
+            if item is _DONE:
+                break
+            batch = [item]
+            # 이미 도착한 항목만 모아서 처리 (배치를 채우려고 기다리지 않음)
+            while len(batch) < stage.batch_size:
+                try:
+                    item = source.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+
+            # 앞 단계에서 버려진 항목은 순서 유지를 위해 빈 값으로 그대로 전달
+            live = [(seq, value) for seq, value in batch if value is not None]
+            results = {}
+            if live:
+                start = time.perf_counter()
+                try:
+                    if stage.batch_size > 1:
+                        outputs = stage.func([value for _, value in live])
+                    else:
+                        outputs = [stage.func(live[0][1])]
+                    results = {seq: result for (seq, _), result in zip(live, outputs)}
+                except Exception as e:
+                    logging.error(f"파이프라인 단계 {stage.name} 처리 중 오류 발생: {e}")
+                    metrics.incr("pipeline_errors", len(live))
+                metrics.incr(f"pipeline_{stage.name}_busy_seconds", round(time.perf_counter() - start, 4))
+                metrics.incr(f"pipeline_{stage.name}_items", len(live))
+
+            for seq, _ in batch:
+                if not self._put(output, (seq, results.get(seq))):
+                    return
+        finished()
+
+    def __iter__(self) -> Iterator[Any]:
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, name="pipeline-source", daemon=True,
+                                    args=(queues[0], self.stages[0].workers if self.stages else 1))]
+
+        for position, stage in enumerate(self.stages):
+            downstream = self.stages[position + 1].workers if position + 1 < len(self.stages) else 1
+            remaining = [stage.workers]
+            lock = threading.Lock()
+
+            # 단계의 마지막 스레드가 끝나면 다음 단계 스레드 수만큼 종료 표시 전달
+            def finished(output=queues[position + 1], remaining=remaining, lock=lock, downstream=downstream):
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    for _ in range(downstream):
+                        self._put(output, _DONE)
+
+            for number in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work, name=f"pipeline-{stage.name}-{number}", daemon=True,
+                    args=(stage, queues[position], queues[position + 1], finished)
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        pending: Dict[int, Any] = {}
+        next_seq = 0
+        try:
+            while True:
+                item = self._get(queues[-1])
+                if item is _DONE:
+                    break
+                seq, value = item
+                if not self.ordered:
+                    if value is not None:
+                        yield value
+                    continue
+                # 앞 순번이 끝날 때까지 뒤 순번 결과를 보관
+                pending[seq] = value
+                while next_seq in pending:
+                    value = pending.pop(next_seq)
+                    next_seq += 1
+                    if value is not None:
+                        yield value
+            for seq in sorted(pending):
+                if pending[seq] is not None:
+                    yield pending[seq]
+        finally:
+            if not self._cancelled.is_set():
+                self._cancelled.set()
+        for thread in threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
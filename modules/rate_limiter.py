@@ -0,0 +1,93 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 요청 속도 제한기
+
+    초당 rate개의 토큰이 채워지며, 최대 capacity개까지 누적된다.
+    요청마다 토큰 하나를 소비하고, 토큰이 없으면 채워질 때까지 대기한다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate (float): 초당 허용 요청 수
+            capacity (Optional[float]): 순간 최대 허용 요청 수 (기본값: rate)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """경과 시간만큼 토큰을 채움 (lock을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 소비하고, 부족한 경우 채워질 때까지 대기하는 함수
+
+        Args:
+            tokens (float): 소비할 토큰 수 (기본값: 1)
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class HostRateLimiter:
+    """
+    호스트별로 독립된 토큰 버킷을 관리하는 속도 제한기
+
+    같은 호스트로 가는 요청만 서로 제한하므로,
+    여러 스레드가 네트워크 대기 시간을 겹쳐 쓰면서도 서버에 부담을 주지 않는다.
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: Optional[float] = None):
+        """
+        Args:
+            rate (float): 호스트당 초당 허용 요청 수 (기본값: 1)
+            capacity (Optional[float]): 호스트당 순간 최대 허용 요청 수
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """
+        URL의 호스트에 해당하는 버킷에서 토큰을 소비하는 함수
+
+        Args:
+            url (str): 요청할 URL
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        host = urlparse(url).netloc.lower()
+        return self._bucket(host).acquire()
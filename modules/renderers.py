@@ -0,0 +1,157 @@
+import os
+import importlib
+import threading
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from modules.article import Article
+
+# 다이제스트 형식 설정
+# BRIEFY_DIGEST_FORMAT: 기본 다이제스트 형식 (pdf: PDF 첨부, html: HTML 이메일 본문, both: HTML 본문과 PDF 첨부)
+#                       (구독자 파일의 format 항목으로 구독자마다 바꿀 수 있음)
+DIGEST_FORMAT = os.getenv("BRIEFY_DIGEST_FORMAT", "pdf")
+
+# 다이제스트 제목에 이름을 나열할 최대 섹션 수 (더 많으면 섹션 이름 없이 "뉴스 요약")
+TITLE_SECTIONS = 3
+
+# 형식별로 사용할 렌더러 (본문 렌더러를 먼저, 첨부 렌더러를 나중에)
+FORMATS: Dict[str, Tuple[str, ...]] = {
+    "pdf": ("pdf",),
+    "html": ("html",),
+    "both": ("html", "pdf"),
+}
+
+# 렌더러 이름 -> (모듈, 클래스) (fpdf, Jinja2 등은 해당 렌더러를 처음 사용할 때 임포트)
+_RENDERERS: Dict[str, Tuple[str, str]] = {
+    "pdf": ("modules.create_pdf", "PDFRenderer"),
+    "html": ("modules.create_html", "HTMLRenderer"),
+}
+
+class DigestRenderer:
+    """
+    다이제스트 렌더러 인터페이스
+
+    요약된 기사 목록을 파일 하나로 렌더링한다. attach가 True인 렌더러(PDF)의 결과는 이메일에 첨부하고,
+    False인 렌더러(HTML)의 결과는 이메일 본문으로 사용한다. 새 형식은 이 클래스를 상속하여
+    render를 구현하고 _RENDERERS와 FORMATS에 등록한다.
+    """
+
+    # 렌더러 이름 (FORMATS에서 사용)
+    name = ""
+    # 출력 파일 확장자
+    extension = ""
+    # True: 첨부 파일, False: 이메일 HTML 본문
+    attach = True
+
+    def filename(self, date: str, number: Optional[int] = None) -> str:
+        """
+        출력 파일명을 만드는 함수
+
+        Args:
+            date (str): 날짜 문자열 (YYYYMMDD)
+            number (Optional[int]): 다이제스트 번호 (구독자별 다이제스트가 여러 개인 경우)
+
+        Returns:
+            str: news_summary_{date}[_{number}].{extension}
+        """
+        suffix = f"_{number}" if number is not None else ""
+        return f"news_summary_{date}{suffix}.{self.extension}"
+
+    def render(self, articles: Iterable[Article], date: str, path: str, skipped: Sequence[Dict] = (),
+               title: Optional[str] = None) -> Optional[int]:
+        """
+        기사 목록을 파일로 렌더링하는 함수
+
+        Args:
+            articles (Iterable[Article]): 요약된 기사 (이터레이터면 도착하는 대로 렌더링할 수 있음)
+            date (str): 문서 제목에 사용할 날짜 문자열
+            path (str): 출력 파일 경로
+            skipped (Sequence[Dict]): 작업 시간 예산 초과로 포함하지 못한 기사 (본문 형식만 표시)
+            title (Optional[str]): 다이제스트 제목 (None이면 digest_title로 기사 카테고리에서 만듦,
+                이터레이터는 렌더링 전에 카테고리를 알 수 없으므로 호출하는 쪽에서 지정)
+
+        Returns:
+            Optional[int]: 성공 시 기록한 바이트 수, 실패 시 None
+        """
+        raise NotImplementedError
+
+    def render_many(self, articles: Sequence[Article], selections: Dict[str, Sequence[int]], date: str,
+                    skipped: Sequence[Dict] = ()) -> Dict[str, bool]:
+        """
+        같은 기사 목록에서 고른 기사로 파일 여러 개를 렌더링하는 함수 (구독자별 다이제스트용)
+
+        Args:
+            articles (Sequence[Article]): 요약된 기사 목록
+            selections (Dict[str, Sequence[int]]): {출력 파일 경로: 포함할 기사 번호 목록}
+            date (str): 문서 제목에 사용할 날짜 문자열
+            skipped (Sequence[Dict]): 작업 시간 예산 초과로 포함하지 못한 기사
+
+        Returns:
+            Dict[str, bool]: 파일별 생성 성공 여부
+
+        Note:
+            - 기본 구현은 현재 프로세스에서 순서대로 렌더링 (PDF는 프로세스 풀 사용)
+            - 제목은 파일마다 고른 기사의 카테고리로 만듦 (digest_title)
+        """
+        return {path: self.render([articles[idx] for idx in indices], date, path, skipped) is not None
+                for path, indices in selections.items()}
+
+def digest_title(categories: Iterable[str]) -> str:
+    """
+    다이제스트에 포함된 섹션으로 제목을 만드는 함수
+
+    Args:
+        categories (Iterable[str]): 기사 카테고리(섹션 이름) 목록 (중복 가능)
+
+    Returns:
+        str: "세계 뉴스 요약", "경제·IT/과학 뉴스 요약" 등
+            (섹션이 없거나 TITLE_SECTIONS개보다 많으면 "뉴스 요약")
+    """
+    names = list(dict.fromkeys(category for category in categories if category))
+    if not names or len(names) > TITLE_SECTIONS:
+        return "뉴스 요약"
+    return f"{'·'.join(names)} 뉴스 요약"
+
+def renderer_names(digest_format: str) -> Tuple[str, ...]:
+    """
+    다이제스트 형식에 사용할 렌더러 이름을 반환하는 함수
+
+    Args:
+        digest_format (str): 다이제스트 형식 (pdf, html, both)
+
+    Returns:
+        Tuple[str, ...]: 렌더러 이름 (본문 렌더러 먼저)
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    names = FORMATS.get(digest_format)
+    if names is None:
+        raise ValueError(f"지원하지 않는 다이제스트 형식: {digest_format} (pdf, html, both 중 선택)")
+    return names
+
+_renderers: Dict[str, DigestRenderer] = {}
+_renderers_lock = threading.Lock()
+
+def get_renderer(name: str) -> DigestRenderer:
+    """
+    프로세스 전체에서 공유하는 렌더러를 반환하는 함수
+
+    Args:
+        name (str): 렌더러 이름 (pdf, html)
+
+    Returns:
+        DigestRenderer: 렌더러 (모듈은 처음 요청할 때 임포트하고 템플릿 등은 렌더러가 한 번만 준비)
+
+    Raises:
+        ValueError: 등록되지 않은 렌더러인 경우
+    """
+    renderer = _renderers.get(name)
+    if renderer is None:
+        if name not in _RENDERERS:
+            raise ValueError(f"등록되지 않은 렌더러: {name}")
+        with _renderers_lock:
+            renderer = _renderers.get(name)
+            if renderer is None:
+                module, cls = _RENDERERS[name]
+                renderer = _renderers[name] = getattr(importlib.import_module(module), cls)()
+    return renderer
@@ -0,0 +1,253 @@
+import os
+import time
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, tzinfo
+from typing import Callable, List, Optional
+from zoneinfo import ZoneInfo
+
+# 파일 잠금은 POSIX에서만 사용 (다른 프로세스와의 중복 실행 방지)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from modules.article_cache import CACHE_DIR
+
+# 스케줄 설정
+# BRIEFY_SCHEDULE: 발송 시각 목록 (쉼표 구분, "HH:MM" 또는 "HH:MM@시간대", 예: 08:00@Asia/Seoul,20:00)
+# BRIEFY_PREFETCH_LEAD: 발송 몇 분 전에 미리 수집/요약을 시작할지 (0: 사용 안 함)
+# BRIEFY_PREFETCH_INTERVAL: 발송 전까지 미리 수집을 반복할 간격 (분, 0: 발송 전 한 번만)
+SCHEDULE = os.getenv("BRIEFY_SCHEDULE", "08:00")
+PREFETCH_LEAD = float(os.getenv("BRIEFY_PREFETCH_LEAD", "15"))
+PREFETCH_INTERVAL = float(os.getenv("BRIEFY_PREFETCH_INTERVAL", "0"))
+LOCK_PATH = os.path.join(CACHE_DIR, "briefy.lock")
+
+# 긴 대기는 나누어 잠들어 절전 복귀나 시계 변경 후에도 예정 시각을 놓치지 않음
+_MAX_SLEEP = 60
+
+class ScheduledJob:
+    """
+    매일 정해진 시각(시간대 기준)에 실행할 작업
+
+    발송 시각 전에 prefetch 함수를 실행하여 수집과 요약을 미리 끝내 두면
+    발송 시각에는 마지막 변경분 수집, 렌더링, 발송만 남는다.
+    """
+
+    def __init__(self, name: str, at: str, deliver: Callable[[float], None],
+                 prefetch: Optional[Callable[[], None]] = None, tz: Optional[tzinfo] = None,
+                 prefetch_lead: float = PREFETCH_LEAD, prefetch_interval: float = PREFETCH_INTERVAL):
+        """
+        Args:
+            name (str): 작업 이름 (로그용)
+            at (str): 실행 시각 ("HH:MM")
+            deliver (Callable[[float], None]): 발송 함수 (예정 시각의 Unix 시간을 인자로 받음)
+            prefetch (Optional[Callable[[], None]]): 미리 수집/요약하는 함수
+            tz (Optional[tzinfo]): 시간대 (기본값: 시스템 시간대)
+            prefetch_lead (float): 발송 몇 분 전에 미리 수집을 시작할지
+            prefetch_interval (float): 미리 수집 반복 간격 (분, 0이면 한 번만)
+        """
+        hour, minute = (int(part) for part in at.split(":"))
+        self.name = name
+        self.hour = hour
+        self.minute = minute
+        self.deliver = deliver
+        self.prefetch = prefetch
+        self.tz = tz
+        self.prefetch_lead = prefetch_lead * 60
+        self.prefetch_interval = prefetch_interval * 60
+
+    def next_run(self, after: Optional[float] = None) -> float:
+        """
+        다음 실행 시각을 Unix 시간으로 반환하는 함수
+
+        Note:
+            - 날짜와 시각을 시간대 기준으로 조합하므로 일광 절약 시간 전환일에도 현지 시각 유지
+        """
+        now = datetime.fromtimestamp(after if after is not None else time.time(), self.tz)
+        candidate = datetime.combine(now.date(), datetime.min.time().replace(hour=self.hour, minute=self.minute),
+                                     tzinfo=now.tzinfo)
+        if candidate.timestamp() <= now.timestamp():
+            candidate = datetime.combine(now.date() + timedelta(days=1), candidate.timetz())
+        return candidate.timestamp()
+
+def parse_schedule(spec: str, deliver: Callable[[float], None],
+                   prefetch: Optional[Callable[[], None]] = None) -> List[ScheduledJob]:
+    """
+    BRIEFY_SCHEDULE 형식의 문자열로 작업 목록을 만드는 함수
+
+    Args:
+        spec (str): 쉼표로 구분한 "HH:MM" 또는 "HH:MM@시간대" 목록
+        deliver (Callable[[float], None]): 발송 함수
+        prefetch (Optional[Callable[[], None]]): 미리 수집/요약하는 함수
+
+    Returns:
+        List[ScheduledJob]: 작업 목록
+    """
+    jobs = []
+    for entry in (part.strip() for part in spec.split(",")):
+        if not entry:
+            continue
+        at, _, zone = entry.partition("@")
+        tz = ZoneInfo(zone) if zone else None
+        jobs.append(ScheduledJob(entry, at, deliver, prefetch, tz=tz))
+    return jobs
+
+class ProcessLock:
+    """
+    다른 프로세스(cron으로 동시에 실행된 main.py run 등)와의 중복 실행을 막는 파일 잠금
+
+    job과 prefetch가 직접 잡으므로 run, serve, 스케줄러 어느 경로로 실행해도 한 번에 하나만 실행된다.
+    같은 프로세스 안에서는 재진입할 수 있어, 스케줄러가 잡은 잠금을 스레드에서 실행되는 job이 그대로 사용한다
+    (프로세스 안의 실행 순서는 스케줄러의 asyncio 잠금이 보장).
+
+    사용법:
+        lock = ProcessLock()
+        if lock.acquire():
+            with lock:
+                ...
+    """
+
+    # 이 프로세스가 잡은 잠금: 경로 -> [파일, 중첩 횟수]
+    _held = {}
+    _guard = threading.Lock()
+
+    def __init__(self, path: str = LOCK_PATH):
+        self.path = path
+        self._acquired = False
+
+    def acquire(self) -> bool:
+        """잠금을 기다리지 않고 잡는 함수 (다른 프로세스가 잡고 있으면 False)"""
+        if fcntl is None:
+            return True
+        with self._guard:
+            held = self._held.get(self.path)
+            if held is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                file = open(self.path, "w")
+                try:
+                    fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    file.close()
+                    return False
+                held = self._held[self.path] = [file, 0]
+            held[1] += 1
+            self._acquired = True
+        return True
+
+    def release(self):
+        with self._guard:
+            if not self._acquired:
+                return
+            self._acquired = False
+            held = self._held[self.path]
+            held[1] -= 1
+            if not held[1]:
+                del self._held[self.path]
+                fcntl.flock(held[0], fcntl.LOCK_UN)
+                held[0].close()
+
+    def __enter__(self) -> "ProcessLock":
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+class AsyncScheduler:
+    """
+    여러 작업을 asyncio로 실행하는 스케줄러
+
+    작업마다 발송 시각까지 기다리는 태스크를 하나씩 두고, 수집/요약/발송은 스레드에서 실행한다.
+    모든 작업은 하나의 잠금을 공유하므로 실행이 겹치지 않는다. 실행 전에 job/prefetch와 같은
+    프로세스 잠금(ProcessLock)을 잡아, 다른 프로세스가 실행 중이면 기다리지 않고 이번 회차를 건너뛴다.
+    """
+
+    def __init__(self, jobs: Optional[List[ScheduledJob]] = None):
+        self.jobs = list(jobs or [])
+        self._lock: Optional[asyncio.Lock] = None
+
+    def add(self, job: ScheduledJob):
+        self.jobs.append(job)
+
+    async def _sleep_until(self, timestamp: float):
+        while True:
+            remaining = timestamp - time.time()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, _MAX_SLEEP))
+
+    async def _run_exclusive(self, label: str, func: Callable, *args) -> bool:
+        """
+        잠금을 잡고 함수를 스레드에서 실행하는 함수
+
+        Returns:
+            bool: 실행했으면 True, 다른 프로세스가 실행 중이라 건너뛰었으면 False
+        """
+        async with self._lock:
+            process_lock = ProcessLock()
+            if not process_lock.acquire():
+                logging.warning(f"다른 프로세스가 작업을 실행 중이어서 건너뜁니다: {label}")
+                return False
+            try:
+                await asyncio.to_thread(func, *args)
+            except Exception as e:
+                logging.error(f"예약 작업 실행 중 오류 발생: {label} - {e}")
+            finally:
+                process_lock.release()
+        return True
+
+    async def _prefetch_phase(self, job: ScheduledJob, scheduled_at: float):
+        """발송 시각 전까지 미리 수집/요약을 실행 (다른 실행과 겹치면 이번 회차는 건너뜀)"""
+        start = scheduled_at - job.prefetch_lead
+        next_at = max(start, time.time())
+        if job.prefetch_interval:
+            next_at = min(next_at, time.time() + job.prefetch_interval)
+
+        while next_at < scheduled_at:
+            await self._sleep_until(next_at)
+            if self._lock.locked():
+                logging.info(f"실행 중인 작업이 있어 미리 수집을 건너뜁니다: {job.name}")
+            else:
+                begin = time.time()
+                if await self._run_exclusive(f"{job.name} 미리 수집", job.prefetch):
+                    logging.info(f"미리 수집 완료: {job.name} ({time.time() - begin:.1f}초)")
+            if not job.prefetch_interval:
+                break
+            next_at = time.time() + job.prefetch_interval
+
+    async def _job_loop(self, job: ScheduledJob):
+        while True:
+            scheduled_at = job.next_run()
+            scheduled = datetime.fromtimestamp(scheduled_at, job.tz)
+            logging.info(f"다음 실행 예정: {job.name} - {scheduled.isoformat(timespec='minutes')}")
+
+            if job.prefetch and (job.prefetch_lead or job.prefetch_interval):
+                await self._prefetch_phase(job, scheduled_at)
+
+            await self._sleep_until(scheduled_at)
+            if self._lock.locked():
+                logging.info(f"실행 중인 작업이 끝나기를 기다립니다: {job.name}")
+            started = None
+
+            def deliver():
+                nonlocal started
+                started = time.time()
+                job.deliver(scheduled_at)
+
+            if await self._run_exclusive(job.name, deliver):
+                logging.info(
+                    f"예약 작업 완료: {job.name} - 예정 시각 대비 시작 +{started - scheduled_at:.1f}초, "
+                    f"완료 +{time.time() - scheduled_at:.1f}초"
+                )
+
+            # 같은 시각에 다시 실행하지 않도록 예정 시각이 지난 뒤 다음 회차 계산
+            await self._sleep_until(scheduled_at + 1)
+
+    async def run(self):
+        """모든 작업을 실행 (취소될 때까지 반환하지 않음)"""
+        self._lock = asyncio.Lock()
+        if not self.jobs:
+            logging.warning("예약된 작업이 없습니다")
+            return
+        await asyncio.gather(*(self._job_loop(job) for job in self.jobs))
@@ -1,12 +1,36 @@
 from dotenv import load_dotenv
 import yagmail
 import os
+import time
+import queue
+import random
+import smtplib
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.message import EmailMessage
+from email.policy import SMTP
+from email.utils import formatdate, make_msgid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from modules.rate_limiter import TokenBucket
 
 # .env 파일 강제 로드
 load_dotenv()
 
+# 대량 발송 설정
+# BRIEFY_SMTP_HOST / BRIEFY_SMTP_PORT: SMTP 서버 주소 (로컬 테스트 서버로 바꿔 사용 가능)
+# BRIEFY_SMTP_SSL: SMTPS(465) 사용 여부 (0이면 평문 연결 후 서버가 지원하면 STARTTLS)
+# BRIEFY_SMTP_POOL_SIZE: 유지할 인증된 SMTP 연결 수 (동시 발송 수)
+# BRIEFY_SMTP_RATE: 초당 최대 발송 수
+# BRIEFY_SMTP_RETRIES: 일시적 오류 시 최대 재시도 횟수
+SMTP_HOST = os.getenv("BRIEFY_SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("BRIEFY_SMTP_PORT", "465"))
+SMTP_SSL = os.getenv("BRIEFY_SMTP_SSL", "1") == "1"
+SMTP_POOL_SIZE = int(os.getenv("BRIEFY_SMTP_POOL_SIZE", "4"))
+SMTP_RATE = float(os.getenv("BRIEFY_SMTP_RATE", "5"))
+SMTP_RETRIES = int(os.getenv("BRIEFY_SMTP_RETRIES", "3"))
+
 def send_email(
     recipient: str,
     subject: str,
@@ -60,3 +84,268 @@ def send_email(
     except Exception as e:
         logging.error(f"이메일 전송 실패: {e}")
         return False
+
+class SMTPConnectionPool:
+    """
+    인증된 SMTP 연결을 재사용하는 연결 풀
+
+    연결은 처음 필요할 때 생성하여 로그인하고, 발송이 끝나면 풀에 반환한다.
+    끊어진 연결은 버리고 다음 요청 시 새로 연결한다.
+    """
+
+    def __init__(self, sender: str, password: Optional[str], size: int = SMTP_POOL_SIZE,
+                 host: str = SMTP_HOST, port: int = SMTP_PORT, use_ssl: bool = SMTP_SSL,
+                 timeout: float = 30):
+        """
+        Args:
+            sender (str): 발신자 이메일 주소 (로그인 계정)
+            password (Optional[str]): 비밀번호 (없으면 로그인하지 않음, 로컬 테스트 서버용)
+            size (int): 최대 연결 수
+            host (str): SMTP 서버 호스트
+            port (int): SMTP 서버 포트
+            use_ssl (bool): SMTPS 사용 여부
+            timeout (float): 연결 제한 시간 (초)
+        """
+        self.sender = sender
+        self.password = password
+        self.host = host
+        self.port = port
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._available = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.use_ssl:
+            conn = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            conn.ehlo()
+            if conn.has_extn("starttls"):
+                conn.starttls()
+                conn.ehlo()
+        if self.password:
+            conn.login(self.sender, self.password)
+        with self._lock:
+            self.opened += 1
+        return conn
+
+    def acquire(self) -> smtplib.SMTP:
+        """유휴 연결을 꺼내거나 새로 연결 (최대 연결 수에 도달하면 대기)"""
+        self._available.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect()
+        except Exception:
+            self._available.release()
+            raise
+
+    def release(self, conn: smtplib.SMTP, broken: bool = False):
+        """연결을 풀에 반환 (끊어진 연결은 닫고 버림)"""
+        if broken:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        else:
+            self._idle.put(conn)
+        self._available.release()
+
+    def close(self):
+        """모든 유휴 연결을 종료"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.quit()
+            except Exception:
+                conn.close()
+
+def _is_transient(error: Exception) -> bool:
+    """재시도로 해결될 수 있는 오류인지 판단 (연결 오류 및 4xx 응답)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError))
+
+def build_message(sender: str, subject: str, body: str, attachment: Optional[str] = None,
+                  html: Optional[str] = None) -> bytes:
+    """
+    수신자 헤더를 제외한 이메일 메시지를 한 번만 MIME 인코딩하는 함수
+
+    Args:
+        sender (str): 발신자 이메일 주소
+        subject (str): 이메일 제목
+        body (str): 이메일 본문 (HTML 본문이 있으면 HTML을 표시하지 못하는 클라이언트용 텍스트)
+        attachment (Optional[str]): 첨부 파일 경로
+        html (Optional[str]): HTML 본문 (multipart/alternative로 텍스트 본문과 함께 포함)
+
+    Returns:
+        bytes: SMTP로 전송할 수 있는 메시지 바이트 (To 헤더 없음)
+
+    Note:
+        - Date와 Message-ID(발신자 도메인)는 메시지를 만들 때 한 번 정하고 모든 수신자에게 같은 값을 사용
+          (없으면 릴레이 서버가 임의로 붙이거나 스팸 점수가 올라감)
+    """
+    message = EmailMessage()
+    message["From"] = sender
+    message["Subject"] = subject
+    message["Date"] = formatdate(localtime=True)
+    message["Message-ID"] = make_msgid(domain=sender.rpartition("@")[2] or None)
+    message.set_content(body)
+    if html:
+        # 앞부분(ASCII 헤더)만 보고 quoted-printable이 선택되면 한글 본문이 세 배로 커지므로 base64로 고정
+        message.add_alternative(html, subtype="html", cte="base64")
+
+    if attachment and os.path.exists(attachment):
+        with open(attachment, "rb") as f:
+            data = f.read()
+        maintype, subtype = ("application", "pdf") if attachment.lower().endswith(".pdf") else ("application", "octet-stream")
+        message.add_attachment(data, maintype=maintype, subtype=subtype, filename=os.path.basename(attachment))
+        logging.info(f"첨부파일 추가: {os.path.abspath(attachment)}")
+    elif attachment:
+        logging.warning(f"첨부파일을 찾을 수 없음: {attachment}")
+
+    return message.as_bytes(policy=SMTP)
+
+def send_bulk_email(
+    recipients: List[str],
+    subject: str,
+    body: str,
+    attachment: Optional[str] = None,
+    html: Optional[str] = None,
+    pool_size: int = SMTP_POOL_SIZE,
+    rate: float = SMTP_RATE,
+    retries: int = SMTP_RETRIES,
+    host: str = SMTP_HOST,
+    port: int = SMTP_PORT,
+    use_ssl: bool = SMTP_SSL
+) -> Dict[str, Dict]:
+    """
+    여러 수신자에게 같은 이메일을 동시에 전송하는 함수
+
+    Args:
+        recipients (List[str]): 수신자 이메일 주소 목록
+        subject (str): 이메일 제목
+        body (str): 이메일 본문
+        attachment (Optional[str]): 첨부 파일 경로 (선택사항)
+        html (Optional[str]): HTML 본문 (선택사항, body는 텍스트 대체 본문)
+        pool_size (int): 인증된 SMTP 연결 수 (동시 발송 수)
+        rate (float): 초당 최대 발송 수
+        retries (int): 일시적 오류 시 최대 재시도 횟수
+        host (str): SMTP 서버 호스트
+        port (int): SMTP 서버 포트
+        use_ssl (bool): SMTPS 사용 여부
+
+    Returns:
+        Dict[str, Dict]: 수신자별 전송 결과
+        각 딕셔너리는 다음 키를 포함:
+        - ok: 전송 성공 여부
+        - attempts: 시도 횟수
+        - error: 실패 시 마지막 오류 메시지
+
+    Note:
+        - 첨부 파일은 한 번만 MIME 인코딩하고 수신자별로 To 헤더만 붙여 재사용
+        - 로그인된 연결을 풀에서 재사용하므로 수신자마다 로그인하지 않음
+        - 연결 오류와 4xx 응답은 지터가 포함된 지수 백오프로 재시도, 5xx 응답은 즉시 실패
+        - 로컬 테스트 서버(aiosmtpd 등)는 host/port와 use_ssl=False로 지정
+    """
+    return send_bulk_emails([(recipients, subject, body, attachment, html)], pool_size=pool_size, rate=rate,
+                            retries=retries, host=host, port=port, use_ssl=use_ssl)
+
+def send_bulk_emails(
+    batches: Iterable[Tuple[List[str], str, str, Optional[str], Optional[str]]],
+    pool_size: int = SMTP_POOL_SIZE,
+    rate: float = SMTP_RATE,
+    retries: int = SMTP_RETRIES,
+    host: str = SMTP_HOST,
+    port: int = SMTP_PORT,
+    use_ssl: bool = SMTP_SSL
+) -> Dict[str, Dict]:
+    """
+    수신자 묶음마다 다른 이메일을 하나의 연결 풀로 전송하는 함수 (구독자별 다이제스트용)
+
+    Args:
+        batches (Iterable[Tuple[List[str], str, str, Optional[str], Optional[str]]]):
+            (수신자 목록, 제목, 본문, 첨부 파일 경로, HTML 본문) 목록 - 같은 묶음의 수신자는 같은 메시지를 받음
+        pool_size, rate, retries, host, port, use_ssl: send_bulk_email과 동일
+
+    Returns:
+        Dict[str, Dict]: 수신자별 전송 결과 (send_bulk_email과 같은 형식)
+
+    Note:
+        - 메시지는 묶음마다 한 번만 MIME 인코딩
+        - 모든 묶음이 연결 풀과 발송 속도 제한을 공유하므로 묶음이 많아도 로그인 횟수는 pool_size 이하
+        - 발송 대기 중인 메시지는 pool_size의 두 배까지만 만들어 두므로 첨부 파일이 많아도 메모리 사용량이 일정
+    """
+    sender = os.getenv("EMAIL_USERNAME")
+    password = os.getenv("EMAIL_PASSWORD")
+    if not sender:
+        raise ValueError("이메일 설정이 올바르지 않습니다.")
+
+    pool = SMTPConnectionPool(sender, password, size=pool_size, host=host, port=port, use_ssl=use_ssl)
+    limiter = TokenBucket(rate) if rate > 0 else None
+
+    def deliver(recipient: str, payload: bytes) -> Dict:
+        data = f"To: {recipient}\r\n".encode("utf-8") + payload
+        error = None
+        for attempt in range(1, retries + 2):
+            if limiter:
+                limiter.acquire()
+            try:
+                conn = pool.acquire()
+            except Exception as e:
+                error = e
+            else:
+                try:
+                    conn.sendmail(sender, [recipient], data)
+                    pool.release(conn)
+                    return {"ok": True, "attempts": attempt, "error": None}
+                except Exception as e:
+                    error = e
+                    # 수신자 거부는 연결 자체에는 문제가 없으므로 재사용
+                    pool.release(conn, broken=not isinstance(e, smtplib.SMTPRecipientsRefused))
+
+            if not _is_transient(error) or attempt > retries:
+                break
+            time.sleep(min(2 ** (attempt - 1), 30) * (0.5 + random.random()))
+
+        logging.error(f"이메일 전송 실패: {recipient} - {error}")
+        return {"ok": False, "attempts": attempt, "error": str(error)}
+
+    def deliveries():
+        for recipients, subject, body, attachment, html in batches:
+            payload = build_message(sender, subject, body, attachment, html)
+            for recipient in recipients:
+                yield recipient, payload
+
+    start = time.perf_counter()
+    results = {}
+    pending = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max(pool_size, 1)) as executor:
+            for recipient, payload in deliveries():
+                if len(pending) >= max(pool_size, 1) * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+                pending[executor.submit(deliver, recipient, payload)] = recipient
+            for future in list(pending):
+                results[pending.pop(future)] = future.result()
+    finally:
+        pool.close()
+
+    sent = sum(1 for result in results.values() if result["ok"])
+    logging.info(
+        f"대량 이메일 전송 완료: {sent}/{len(results)}명 성공, "
+        f"SMTP 연결 {pool.opened}개, {time.perf_counter() - start:.1f}초"
+    )
+    return results
@@ -0,0 +1,163 @@
+import re
+from typing import Iterator, List, Sequence, Tuple
+
+# 요약 후보 문장 길이 제한 (문자 수, 문장 부호 포함)
+MIN_LENGTH = 30
+MAX_LENGTH = 200
+# 닫히지 않은 따옴표로 보고 무시할 인용문 길이 (문자 수)
+MAX_QUOTE = 300
+
+_TERMINATORS = '.!?…'
+_TERMINATORS_SET = frozenset(_TERMINATORS)
+_CLOSERS = '\'’)]」』"”'
+
+# 큰따옴표 또는 문장 부호(뒤에 붙은 작은따옴표/괄호, 공백 포함)를 찾는 패턴
+# (첫 글자를 문자 집합으로 시작해야 정규식 엔진이 후보 위치로 바로 건너뜀)
+_TOKEN = re.compile(r'[“”".!?…](?:(?<=[.!?…])[.!?…]*[\'’)\]」』]*)?(\s*)')
+# 요약에서 제외할 문장 (언론사 정보, 기자/저작권 문구, 안내 문구)
+_BOILERPLATE = re.compile(r'제공|특파원|기자|저작권|구독|뉴스|기사|전재')
+_EXCLUDED_PREFIXES = ('▶', '■', '※', '☞', '#', '@')
+_NON_SPACE = re.compile(r'\S')
+_QUOTES = frozenset('“”"')
+# 뒤에 공백이 와도 문장이 끝나지 않는 영문 약어 (마침표 앞 단어)
+_INITIALS = re.compile(r'(?:[A-Za-z]\.)+[A-Za-z]')  # U.S, U.K, E.U
+_ABBREVIATIONS = frozenset(('Mr', 'Mrs', 'Ms', 'Dr', 'Prof', 'Gen', 'Sen', 'Rep', 'St', 'Jr', 'Sr', 'vs'))
+
+Span = Tuple[int, int]
+
+def _is_abbreviation(text: str, pos: int) -> bool:
+    """pos의 마침표가 영문 약어("U.S.", "Mr.")를 끝내는 마침표인지 확인하는 함수"""
+    start = pos
+    while start > 0 and text[start - 1].isascii() and (text[start - 1].isalpha() or text[start - 1] == '.'):
+        start -= 1
+    word = text[start:pos]
+    return word in _ABBREVIATIONS or _INITIALS.fullmatch(word) is not None
+
+def _scan(text: str) -> Iterator[Span]:
+    """
+    문장 경계를 한 번 훑으며 문장 구간을 만드는 생성기
+
+    Note:
+        - 문장 부호 뒤에 공백이 있거나 글이 끝나면 문장 경계
+        - 공백 없이 붙어 있어도 한글 뒤의 문장 부호("했다.이번")는 문장 경계
+          (get_text(strip=True)로 추출한 본문은 문단 사이 공백이 사라짐)
+        - 숫자와 영문 사이의 마침표(3.5%, example.com, U.S)는 경계가 아님
+        - 영문 약어 뒤의 마침표("U.S. 정부", "Mr. Kim")는 뒤에 공백이 있어도 경계가 아님
+          (글 끝의 약어는 그대로 마지막 문장에 포함)
+        - 큰따옴표 안의 문장 부호는 경계가 아니며, 인용문이 문장 부호로 끝나면("...했다.")
+          닫는 따옴표 뒤에 공백이 올 때만 경계 (바로 조사가 붙으면("...했다."라고) 문장이 계속됨)
+        - Python 반복은 문장 부호와 따옴표마다 한 번만 수행하고 문자열은 복사하지 않음
+    """
+    match = _NON_SPACE.search(text)
+    if match is None:
+        return
+    length = len(text)
+    start = match.start()
+    quote_open = -1  # 열린 큰따옴표 위치 (-1: 인용문 밖)
+    for match in _TOKEN.finditer(text, start):
+        pos = match.start()
+        space, end = match.span(1)
+        char = text[pos]
+        if char in _QUOTES:
+            if quote_open < 0:
+                if char != '”':
+                    quote_open = pos
+                continue
+            if char == '“':
+                continue
+            quote_open = -1
+            # 인용문이 문장 부호로 끝나고 뒤에 공백이나 글 끝이 오는 경우만 경계
+            if text[pos - 1] not in _TERMINATORS_SET or (space == end and end < length):
+                continue
+        else:
+            if space == end and end < length and not '가' <= text[pos - 1] <= '힣':
+                continue
+            if char == '.' and text[pos - 1].isascii() and text[pos - 1].isalpha() and _is_abbreviation(text, pos):
+                continue
+            if quote_open >= 0:
+                if pos - quote_open <= MAX_QUOTE:
+                    continue
+                quote_open = -1  # 닫히지 않은 따옴표는 무시
+        if space > start:
+            yield start, space
+        start = end
+
+    if start < length:
+        end = length
+        while text[end - 1].isspace():
+            end -= 1
+        yield start, end
+
+def sentence_spans(text: str) -> List[Span]:
+    """
+    기사 본문을 문장으로 나누는 함수
+
+    Args:
+        text (str): 기사 본문 텍스트
+
+    Returns:
+        List[Tuple[int, int]]: 문장별 (시작, 끝) 위치 (앞뒤 공백 제외, 원문 순서)
+    """
+    return list(_scan(text))
+
+def candidate_spans(text: str, min_length: int = MIN_LENGTH, max_length: int = MAX_LENGTH) -> List[Span]:
+    """
+    기사 본문을 문장으로 나누면서 요약 후보가 아닌 문장을 걸러내는 함수
+
+    Args:
+        text (str): 기사 본문 텍스트
+        min_length (int): 최소 문장 길이
+        max_length (int): 최대 문장 길이
+
+    Returns:
+        List[Tuple[int, int]]: 요약 후보 문장의 (시작, 끝) 위치 (원문 순서)
+
+    Note:
+        - 제외 문구는 미리 컴파일한 정규식 하나로 본문 전체를 한 번 훑어 찾고,
+          문장 분리와 함께 위치만 비교 (문장 문자열을 만들지 않고, 문장마다 정규식을 실행하지 않음)
+        - 길이 제한, 언론사/기자/저작권 문구, 안내 기호(▶, ■ 등)로 시작하는 문장 제외
+    """
+    # 제외 문구는 본문 전체에서 한 번에 찾고, 문장마다 다음 문구 위치와만 비교
+    hits = [match.start() for match in _BOILERPLATE.finditer(text)]
+    hits.append(len(text))
+    hit = 0
+    spans = []
+    for start, end in _scan(text):
+        while hits[hit] < start:
+            hit += 1
+        if (min_length <= end - start <= max_length and hits[hit] >= end and
+                not text.startswith(_EXCLUDED_PREFIXES, start)):
+            spans.append((start, end))
+    return spans
+
+def candidate_spans_batch(texts: Sequence[str], min_length: int = MIN_LENGTH,
+                          max_length: int = MAX_LENGTH) -> List[List[Span]]:
+    """
+    여러 기사의 요약 후보 문장 위치를 한 번에 구하는 함수
+
+    Args:
+        texts (Sequence[str]): 기사 본문 목록
+        min_length (int): 최소 문장 길이
+        max_length (int): 최대 문장 길이
+
+    Returns:
+        List[List[Tuple[int, int]]]: 입력 순서대로의 기사별 후보 문장 위치 (빈 본문은 빈 목록)
+    """
+    return [candidate_spans(text, min_length, max_length) if text else [] for text in texts]
+
+def join_sentences(text: str, spans: Sequence[Span]) -> str:
+    """
+    문장 위치 목록으로 요약문을 만드는 함수
+
+    Args:
+        text (str): 기사 본문 텍스트
+        spans (Sequence[Tuple[int, int]]): 이어 붙일 문장 위치
+
+    Returns:
+        str: 공백 하나로 이어 붙인 문장 (문장 부호로 끝나지 않는 문장에는 마침표 추가)
+    """
+    parts = []
+    for start, end in spans:
+        sentence = text[start:end]
+        parts.append(sentence if sentence.rstrip(_CLOSERS)[-1:] in _TERMINATORS_SET else sentence + '.')
+    return ' '.join(parts)
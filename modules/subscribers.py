@@ -0,0 +1,217 @@
+import os
+import json
+import logging
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from modules.article import Article
+from modules.keywords import KeywordMatcher
+from modules.renderers import DIGEST_FORMAT, renderer_names
+
+# 구독자 설정
+# BRIEFY_SUBSCRIBERS: 구독자별 관심사 JSON 파일 경로 (파일이 없으면 수신자 전원에게 같은 다이제스트)
+# BRIEFY_DIGEST_LIMIT: 구독자 한 명의 다이제스트에 넣을 기본 최대 기사 수
+SUBSCRIBERS_FILE = os.getenv("BRIEFY_SUBSCRIBERS", "subscribers.json")
+DIGEST_LIMIT = int(os.getenv("BRIEFY_DIGEST_LIMIT", "10"))
+
+def _section_name(section: str) -> str:
+    """섹션 번호("105")를 카테고리 이름("IT/과학")으로 바꾸는 함수 (이름은 그대로)"""
+    from modules.fetch_news import SECTION_NAMES
+
+    return SECTION_NAMES.get(section, section)
+
+class Subscriber:
+    """
+    구독자 한 명과 관심사
+
+    keywords, sections, press 조건은 모두 만족해야 하고(AND), 한 조건 안의 값은 하나만 맞으면 된다(OR).
+    비어 있는 조건으로는 거르지 않으므로 관심사가 없는 구독자는 이번 실행의 모든 기사를 받는다.
+    다이제스트 형식(format)은 받을 기사에는 영향을 주지 않고 이메일 구성만 바꾼다.
+    """
+
+    def __init__(self, email: str, keywords: Iterable[str] = (), sections: Iterable[str] = (),
+                 press: Iterable[str] = (), limit: int = DIGEST_LIMIT, format: str = DIGEST_FORMAT):
+        """
+        Args:
+            email (str): 이메일 주소
+            keywords (Iterable[str]): 제목이나 요약에 포함되어야 하는 키워드
+            sections (Iterable[str]): 섹션 번호 또는 카테고리 이름 (예: "105", "IT/과학")
+            press (Iterable[str]): 언론사 (같은 기사를 보도한 다른 언론사 포함)
+            limit (int): 다이제스트에 넣을 최대 기사 수
+            format (str): 다이제스트 형식 (pdf: PDF 첨부, html: HTML 본문, both: HTML 본문과 PDF 첨부)
+
+        Raises:
+            ValueError: 지원하지 않는 형식인 경우
+        """
+        self.email = email
+        self.keywords = frozenset(keyword.strip().casefold() for keyword in keywords if keyword.strip())
+        self.sections = frozenset(_section_name(str(section).strip()) for section in sections if str(section).strip())
+        self.press = frozenset(name.strip() for name in press if name.strip())
+        self.limit = limit
+        self.format = format.strip().lower()
+        renderer_names(self.format)
+
+    @property
+    def personalized(self) -> bool:
+        """관심사 조건이 있거나 기사 수, 형식이 기본값과 다르면 True (모두 False면 수신자 전원이 같은 다이제스트)"""
+        return (bool(self.keywords or self.sections or self.press) or self.limit != DIGEST_LIMIT or
+                self.format != DIGEST_FORMAT)
+
+    @property
+    def preferences(self) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str], int]:
+        """관심사가 같은 구독자는 같은 기사를 받으므로 기사 선택을 한 번만 하기 위한 키 (형식은 제외)"""
+        return self.keywords, self.sections, self.press, self.limit
+
+    def __repr__(self) -> str:
+        return f"Subscriber({self.email!r})"
+
+def load_subscribers(path: str = SUBSCRIBERS_FILE, recipients: Sequence[str] = ()) -> List[Subscriber]:
+    """
+    구독자 목록을 불러오는 함수
+
+    Args:
+        path (str): 구독자 JSON 파일 경로. 형식:
+            [{"email": "a@example.com", "keywords": ["반도체"], "sections": ["105"],
+              "press": ["연합뉴스"], "limit": 5, "format": "html"}, ...]
+            (email 외의 항목은 생략 가능)
+        recipients (Sequence[str]): 파일이 없을 때 사용할 수신자 주소 (관심사 없음)
+
+    Returns:
+        List[Subscriber]: 구독자 목록 (같은 주소는 처음 항목만 사용)
+
+    Raises:
+        ValueError: 파일 형식이 올바르지 않거나(관심사 항목이 목록이 아닌 경우 포함)
+            지원하지 않는 다이제스트 형식이 있는 경우
+    """
+    if not path or not os.path.exists(path):
+        return [Subscriber(address) for address in dict.fromkeys(recipients)]
+
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"구독자 파일은 목록이어야 합니다: {path}")
+
+    subscribers = {}
+    for entry in entries:
+        email = str(entry.get("email", "")).strip() if isinstance(entry, dict) else ""
+        if not email:
+            logging.warning(f"이메일 주소가 없는 구독자 항목을 무시합니다: {entry}")
+            continue
+        if email in subscribers:
+            continue
+        for key in ("keywords", "sections", "press"):
+            # 문자열 하나("반도체")를 그대로 쓰면 글자마다 조건이 되므로 목록만 허용
+            if not isinstance(entry.get(key, []), list):
+                raise ValueError(f"구독자 {email}의 {key}는 목록이어야 합니다: {entry[key]!r}")
+        subscribers[email] = Subscriber(email, entry.get("keywords", ()), entry.get("sections", ()),
+                                        entry.get("press", ()), int(entry.get("limit", DIGEST_LIMIT)),
+                                        str(entry.get("format", DIGEST_FORMAT)))
+    logging.info(f"구독자 {len(subscribers)}명 불러옴: {path}")
+    return list(subscribers.values())
+
+class ArticleIndex:
+    """
+    이번 실행에서 요약한 기사의 역색인 (키워드, 섹션, 언론사 -> 기사 번호 집합)
+
+    기사마다 모든 구독자 키워드를 한 번에 찾아(KeywordMatcher) 색인을 만든 뒤, 구독자별 기사 선택은
+    조건별 기사 번호 집합의 합집합/교집합으로 처리한다. 구독자마다 기사를 다시 훑지 않으므로
+    구독자 한 명의 비용은 관심사 수와 결과 크기에만 비례한다.
+    """
+
+    def __init__(self, articles: Sequence[Article], keywords: Iterable[str] = ()):
+        """
+        Args:
+            articles (Sequence[Article]): 요약된 기사 목록 (다이제스트 순서)
+            keywords (Iterable[str]): 색인할 키워드 (모든 구독자 키워드의 합집합)
+        """
+        self.articles = articles
+        self.all: Set[int] = set(range(len(articles)))
+        self.terms: Dict[str, Set[int]] = {}
+        self.sections: Dict[str, Set[int]] = {}
+        self.press: Dict[str, Set[int]] = {}
+
+        matcher = KeywordMatcher(keywords)
+        for idx, article in enumerate(articles):
+            self.sections.setdefault(article.category, set()).add(idx)
+            self.press.setdefault(article.press, set()).add(idx)
+            for alternate in article.alternates:
+                self.press.setdefault(alternate.get("press", "Unknown"), set()).add(idx)
+            if matcher:
+                for keyword in matcher.find(f"{article.title}\n{article.summary or ''}"):
+                    self.terms.setdefault(keyword.casefold(), set()).add(idx)
+
+    def select(self, subscriber: Subscriber) -> Tuple[int, ...]:
+        """
+        구독자 관심사에 맞는 기사 번호를 고르는 함수
+
+        Args:
+            subscriber (Subscriber): 구독자
+
+        Returns:
+            Tuple[int, ...]: 다이제스트 순서의 기사 번호 (최대 subscriber.limit개)
+        """
+        conditions = []
+        for postings, values in ((self.terms, subscriber.keywords), (self.sections, subscriber.sections),
+                                 (self.press, subscriber.press)):
+            if not values:
+                continue
+            matched = set()
+            for value in values:
+                matched |= postings.get(value, set())
+            if not matched:
+                return ()
+            conditions.append(matched)
+
+        if not conditions:
+            selected = self.all
+        else:
+            # 작은 집합부터 교집합 (결과가 빨리 줄어듦)
+            conditions.sort(key=len)
+            selected = conditions[0].intersection(*conditions[1:])
+        return tuple(sorted(selected)[:subscriber.limit])
+
+    def group(self, subscribers: Iterable[Subscriber]) -> Dict[Tuple[int, ...], List[Subscriber]]:
+        """
+        구독자를 받을 기사 묶음별로 나누는 함수
+
+        Args:
+            subscribers (Iterable[Subscriber]): 구독자 목록
+
+        Returns:
+            Dict[Tuple[int, ...], List[Subscriber]]: {기사 번호 묶음: 구독자 목록}
+            (받을 기사가 없는 구독자는 빈 튜플에 모임)
+
+        Note:
+            - 관심사가 같은 구독자는 기사 선택을 한 번만 수행
+            - 같은 기사 묶음을 받는 구독자는 PDF 하나와 MIME 인코딩 한 번을 공유
+        """
+        selections: Dict[Tuple, Tuple[int, ...]] = {}
+        groups: Dict[Tuple[int, ...], List[Subscriber]] = {}
+        for subscriber in subscribers:
+            key = subscriber.preferences
+            selection = selections.get(key)
+            if selection is None:
+                selection = selections[key] = self.select(subscriber)
+            groups.setdefault(selection, []).append(subscriber)
+        return groups
+
+def collection_sections(subscribers: Iterable[Subscriber], default: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    구독자가 원하는 섹션을 모두 포함하는 수집 대상 섹션 번호 목록을 만드는 함수
+
+    Args:
+        subscribers (Iterable[Subscriber]): 구독자 목록
+        default (Optional[Sequence[str]]): 기본 수집 섹션 (기본값: BRIEFY_SECTIONS)
+
+    Returns:
+        List[str]: 기본 섹션 뒤에 구독자 섹션을 덧붙인 섹션 번호 목록 (중복 없음)
+    """
+    from modules.fetch_news import SECTIONS, SECTION_NAMES
+
+    numbers = {name: sid for sid, name in SECTION_NAMES.items()}
+    sections = list(default or SECTIONS)
+    for subscriber in subscribers:
+        for name in sorted(subscriber.sections):
+            sid = numbers.get(name, name)
+            if sid not in sections:
+                sections.append(sid)
+    return sections
@@ -1,14 +1,24 @@
-from typing import Optional
+from typing import List, Optional
 import logging
-import re
 
-def summarize_article(text: str, summary_length: int = 3) -> Optional[str]:
+from modules import metrics
+from modules.sentences import candidate_spans, candidate_spans_batch, join_sentences
+from modules.summary_cache import get_summary_cache, summary_key
+
+# 요약 로직 버전 (요약 결과가 바뀌는 수정 시 올려서 기존 캐시 무효화)
+SUMMARIZER_VERSION = "extractive-2"
+TEXTRANK_VERSION = "textrank-3"
+
+def summarize_article(text: str, summary_length: int = 3, use_cache: bool = True,
+                      mode: str = "extractive") -> Optional[str]:
     """
     뉴스 기사 텍스트를 요약하는 함수
     
     Args:
         text (str): 요약할 뉴스 기사 본문 텍스트
-        summary_length (int): 기본 요약 문장 수 (기본값: 3)
+        summary_length (int): 기본 요약 문장 수 (기본값: 3, 실제 문장 수는 원문 길이로 정함 - target_length)
+        use_cache (bool): 콘텐츠 해시 기반 요약 캐시 사용 여부 (기본값: True)
+        mode (str): 요약 방식 ("extractive" 또는 "abstractive", 기본값: "extractive")
         
     Returns:
         Optional[str]: 성공 시 요약된 텍스트, 실패 시 None
@@ -19,56 +29,192 @@ def summarize_article(text: str, summary_length: int = 3) -> Optional[str]:
         - 불필요한 문장 필터링 (메타 정보, 광고 등)
         - 최소/최대 길이 제한 적용
         - 문장 정제 및 포맷팅 수행
+        - 같은 본문(공백 정규화 기준)은 한 번만 요약하고 캐시된 결과를 재사용
+        - abstractive 방식은 로컬 seq2seq 모델로 생성형 요약 (summarize_articles 참고)
+    """
+    if mode == "abstractive":
+        return summarize_articles([text], use_cache=use_cache, engine="abstractive")[0]
+    
+    if not use_cache or not text:
+        return _summarize(text, summary_length)
+
+    try:
+        cache = get_summary_cache()
+        # summary_length는 결과에 영향이 없으므로(target_length로 정함) 키에 넣지 않음
+        key = summary_key(text, SUMMARIZER_VERSION)
+        summary = cache.get(key)
+        if summary is not None:
+            metrics.incr("summary_cache_hits")
+            logging.debug("요약 캐시 재사용")
+            return summary
+        metrics.incr("summary_cache_misses")
+    except Exception as e:
+        logging.warning(f"요약 캐시 조회 실패: {e}")
+        return _summarize(text, summary_length)
+
+    summary = _summarize(text, summary_length)
+    if summary:
+        try:
+            cache.put(key, summary)
+        except Exception as e:
+            logging.warning(f"요약 캐시 저장 실패: {e}")
+    return summary
+
+def split_sentences(text: str) -> List[str]:
+    """
+    기사 본문을 문장으로 분리하고 불필요한 문장을 걸러내는 함수
+    
+    Args:
+        text (str): 기사 본문 텍스트
+        
+    Returns:
+        List[str]: 요약 후보 문장 목록 (원문 순서)
+        
+    Note:
+        - 문장 위치만 필요하면 modules.sentences.candidate_spans 사용 (문자열을 복사하지 않음)
+    """
+    return [text[start:end] for start, end in candidate_spans(text)]
+
+def target_length(text: str) -> int:
+    """
+    원문 길이에 따라 요약 문장 수를 정하는 함수
+    
+    Args:
+        text (str): 기사 본문 텍스트
+        
+    Returns:
+        int: 요약 문장 수 (3~5)
+    """
+    text_length = len(text)
+    if text_length > 2000:
+        return 5  # 긴 기사는 5문장
+    elif text_length > 1000:
+        return 4  # 중간 길이 기사는 4문장
+    return 3  # 짧은 기사는 3문장
+
+def summarize_articles(texts: List[str], use_cache: bool = True, engine: str = "textrank") -> List[Optional[str]]:
+    """
+    여러 기사를 한 번에 요약하는 함수
+    
+    Args:
+        texts (List[str]): 요약할 기사 본문 목록
+        use_cache (bool): 콘텐츠 해시 기반 요약 캐시 사용 여부 (기본값: True)
+        engine (str): 요약 엔진 ("textrank" 또는 "abstractive", 기본값: "textrank")
+        
+    Returns:
+        List[Optional[str]]: 입력 순서대로의 요약 결과 (실패한 기사는 None)
+        
+    Note:
+        - textrank: 배치 전체 문장으로 TF-IDF 행렬(IDF는 기사별)을 만들고 기사별 문장 그래프의
+          PageRank 점수가 높은 문장을 원문 순서대로 선택 (문장 필터링은 summarize_article과 동일)
+        - 기사의 요약은 함께 배치된 기사와 무관하므로 기사 본문만으로 캐시 키를 만듦
+        - abstractive: 로컬 seq2seq 모델로 생성형 요약 (modules.abstractive 참고)
+        - 캐시에 없는 기사만 배치로 계산
+    """
+    if engine == "textrank":
+        version, compute = TEXTRANK_VERSION, _textrank_batch
+    elif engine == "abstractive":
+        # 지연 임포트: 생성형 요약을 쓰지 않으면 torch 관련 모듈을 불러오지 않음
+        from modules import abstractive
+        version, compute = abstractive.model_version(), abstractive.summarize_batch
+    else:
+        raise ValueError(f"지원하지 않는 요약 엔진입니다: {engine}")
+    
+    results: List[Optional[str]] = [None] * len(texts)
+    cache = get_summary_cache() if use_cache else None
+    keys = {}
+    pending = []
+    
+    for idx, text in enumerate(texts):
+        if not text or len(text) < 100:
+            continue
+        if cache:
+            keys[idx] = summary_key(text, version)
+            cached = cache.get(keys[idx])
+            if cached is not None:
+                metrics.incr("summary_cache_hits")
+                results[idx] = cached
+                continue
+            metrics.incr("summary_cache_misses")
+        pending.append(idx)
+    
+    if not pending:
+        return results
+    
+    try:
+        summaries = compute([texts[idx] for idx in pending])
+    except Exception as e:
+        logging.error(f"배치 요약 실패: {e}")
+        return results
+    
+    for idx, summary in zip(pending, summaries):
+        if not summary:
+            continue
+        results[idx] = summary
+        if cache:
+            cache.put(keys[idx], summary)
+    
+    logging.debug(f"배치 요약 완료 (기사 {len(texts)}개, 계산 {len(pending)}개)")
+    return results
+
+def _textrank_batch(texts: List[str]) -> List[Optional[str]]:
+    """
+    캐시 없이 TextRank 배치 요약을 수행하는 함수 (summarize_articles 참고)
+    """
+    # 지연 임포트: 추출적 요약만 사용할 때 scikit-learn 로딩 비용을 피함
+    from modules.textrank import textrank_select
+    
+    span_lists = candidate_spans_batch(texts)
+    sentence_lists = [[text[start:end] for start, end in spans] for text, spans in zip(texts, span_lists)]
+    lengths = [target_length(text) for text in texts]
+    selections = textrank_select(sentence_lists, lengths)
+    
+    summaries: List[Optional[str]] = []
+    for text, spans, selected in zip(texts, span_lists, selections):
+        if len(spans) < 2:
+            summaries.append(None)
+            continue
+        summary = join_sentences(text, [spans[i] for i in selected])
+        if len(summary) > 1000:
+            summary = summary[:997] + "..."
+        summaries.append(summary)
+    return summaries
+
+def _summarize(text: str, summary_length: int) -> Optional[str]:
+    """
+    캐시 없이 추출적 요약을 수행하는 함수 (summarize_article 참고)
     """
     try:
         if not text or len(text) < 100:
             logging.warning("텍스트가 너무 짧아 요약할 수 없습니다")
             return None
             
-        # 문장 분리 (개선된 정규식)
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        
-        # 문장 필터링 강화
-        filtered_sentences = []
-        for s in sentences:
-            s = s.strip()
-            if (30 <= len(s) <= 200 and  # 길이 제한
-                not re.search(r'(제공|특파원|기자|저작권|구독|뉴스|기사|전재)', s) and
-                not s.startswith(('▶', '■', '※', '☞', '#', '@'))):
-                filtered_sentences.append(s)
+        # 문장 분리와 필터링을 한 번에 수행하고 위치만 사용 (문장 문자열은 요약문에 들어갈 것만 복사)
+        spans = candidate_spans(text)
         
-        if not filtered_sentences:
+        if not spans:
             logging.warning("유효한 문장을 찾을 수 없습니다")
             return None
             
         # 원문 길이에 따른 동적 요약 길이 조정
-        text_length = len(text)
-        if text_length > 2000:
-            summary_length = 5  # 긴 기사는 5문장
-        elif text_length > 1000:
-            summary_length = 4  # 중간 길이 기사는 4문장
-        else:
-            summary_length = 3  # 짧은 기사는 3문장
+        summary_length = target_length(text)
             
         # 최소 요약 길이 보장
-        if len(filtered_sentences) <= summary_length:
-            if len(filtered_sentences) < 2:  # 너무 짧은 경우
+        if len(spans) <= summary_length:
+            if len(spans) < 2:  # 너무 짧은 경우
                 return None
-            return '. '.join(filtered_sentences) + '.'
+            return join_sentences(text, spans)
             
         # 요약문 생성
-        summary = '. '.join(filtered_sentences[:summary_length]) + '.'
-        summary = re.sub(r'\.+', '.', summary)
+        summary = join_sentences(text, spans[:summary_length])
         
         # 최종 요약문 길이 제한 및 최소 길이 보장
         if len(summary) > 1000:
             summary = summary[:997] + "..."
         elif len(summary) < 200:  # 요약문이 너무 짧은 경우
             # 추가 문장 포함
-            additional_sentences = filtered_sentences[summary_length:summary_length+2]
-            if additional_sentences:
-                summary = '. '.join(filtered_sentences[:summary_length+2]) + '.'
-                summary = re.sub(r'\.+', '.', summary)
+            if len(spans) > summary_length:
+                summary = join_sentences(text, spans[:summary_length+2])
         
         logging.debug(f"요약 완료 (원본: {len(text)}자, 요약: {len(summary)}자, 문장 수: {summary_length})")
         return summary
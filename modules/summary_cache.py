@@ -0,0 +1,162 @@
+import os
+import re
+import time
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from contextlib import closing
+from typing import Optional
+
+from cachetools import LRUCache
+
+from modules.article_cache import CACHE_DIR
+
+# 요약 캐시 설정
+# BRIEFY_SUMMARY_CACHE_SIZE: 메모리 캐시에 유지할 최대 요약 수
+# BRIEFY_SUMMARY_CACHE_PERSIST: 디스크 캐시 사용 여부 (1: 사용, 0: 메모리만 사용)
+# BRIEFY_SUMMARY_CACHE_MAX_ENTRIES: 디스크 캐시에 유지할 최대 요약 수
+MEMORY_SIZE = int(os.getenv("BRIEFY_SUMMARY_CACHE_SIZE", "1024"))
+PERSIST = os.getenv("BRIEFY_SUMMARY_CACHE_PERSIST", "1") == "1"
+MAX_ENTRIES = int(os.getenv("BRIEFY_SUMMARY_CACHE_MAX_ENTRIES", "10000"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_accessed_at ON summaries(accessed_at);
+"""
+
+def summary_key(text: str, version: str, **params) -> str:
+    """
+    요약 캐시 키를 생성하는 함수
+
+    Args:
+        text (str): 요약할 원문 텍스트
+        version (str): 요약기 버전 (요약 로직 변경 시 올려서 기존 캐시 무효화)
+        **params: 요약 결과에 영향을 주는 매개변수
+
+    Returns:
+        str: 정규화된 텍스트, 버전, 매개변수의 SHA-256 해시
+
+    Note:
+        - 공백을 정규화하므로 공백만 다른 본문(통신사 기사 재배포 등)은 같은 키를 가짐
+    """
+    normalized = re.sub(r'\s+', ' ', text).strip()
+    digest = hashlib.sha256()
+    digest.update(version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalized.encode("utf-8"))
+    return digest.hexdigest()
+
+class SummaryCache:
+    """
+    콘텐츠 해시를 키로 요약 결과를 저장하는 2단계 캐시
+
+    메모리 LRU 캐시를 먼저 조회하고, 없으면 디스크(SQLite) 캐시를 조회한다.
+    디스크 캐시는 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거된다.
+    """
+
+    def __init__(self, memory_size: int = MEMORY_SIZE, path: Optional[str] = None,
+                 persist: bool = PERSIST, max_entries: int = MAX_ENTRIES):
+        """
+        Args:
+            memory_size (int): 메모리 캐시에 유지할 최대 요약 수
+            path (Optional[str]): 디스크 캐시 파일 경로 (기본값: BRIEFY_CACHE_DIR/summaries.sqlite3)
+            persist (bool): 디스크 캐시 사용 여부
+            max_entries (int): 디스크 캐시에 유지할 최대 요약 수
+        """
+        self._memory = LRUCache(maxsize=memory_size)
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.path = None
+
+        if persist:
+            if path is None:
+                path = os.path.join(CACHE_DIR, "summaries.sqlite3")
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            self.path = path
+            with closing(self._connect()) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 요약을 조회하는 함수
+
+        Args:
+            key (str): summary_key로 생성한 캐시 키
+
+        Returns:
+            Optional[str]: 캐시된 요약, 없으면 None
+        """
+        with self._lock:
+            summary = self._memory.get(key)
+        if summary is not None or self.path is None:
+            return summary
+
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+
+        with self._lock:
+            self._memory[key] = row[0]
+        return row[0]
+
+    def put(self, key: str, summary: str):
+        """
+        요약을 캐시에 저장하는 함수
+
+        Args:
+            key (str): summary_key로 생성한 캐시 키
+            summary (str): 저장할 요약
+        """
+        with self._lock:
+            self._memory[key] = summary
+        if self.path is None:
+            return
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, accessed_at) VALUES (?, ?, ?)",
+                (key, summary, time.time())
+            )
+            # 최대 항목 수를 넘는 LRU 항목 제거
+            conn.execute(
+                "DELETE FROM summaries WHERE key IN ("
+                "SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+_cache: Optional[SummaryCache] = None
+_cache_lock = threading.Lock()
+
+def get_summary_cache() -> SummaryCache:
+    """
+    프로세스 전체에서 공유하는 요약 캐시를 반환하는 함수
+
+    Returns:
+        SummaryCache: 공유 캐시 (디스크 캐시를 열 수 없으면 메모리 캐시만 사용)
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = SummaryCache()
+                except Exception as e:
+                    logging.warning(f"요약 디스크 캐시를 열 수 없어 메모리 캐시만 사용합니다: {e}")
+                    _cache = SummaryCache(persist=False)
+    return _cache
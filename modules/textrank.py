@@ -0,0 +1,143 @@
+from typing import List
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer
+
+def _tfidf(sentences: List[str], doc_ids: np.ndarray) -> sp.csr_matrix:
+    """
+    배치 전체 문장에 대해 기사별 IDF로 가중한 TF-IDF 행렬을 생성하는 함수
+
+    Args:
+        sentences (List[str]): 모든 기사의 문장 (기사 순서대로 이어 붙임)
+        doc_ids (np.ndarray): 문장별 기사 번호
+
+    Returns:
+        sp.csr_matrix: 문장 x 용어 TF-IDF 행렬
+
+    Note:
+        - 형태소 분석기 없이 한국어를 다루기 위해 단어 경계 안의 음절 bigram 사용
+          (조사가 붙은 어절도 어간 bigram을 공유)
+        - 문서 빈도(df)와 문서 수는 같은 기사 안의 문장으로만 계산하므로, 기사마다 TfidfVectorizer
+          (sublinear_tf, smooth_idf)를 따로 학습한 것과 같은 값이 되고 요약이 함께 계산한 기사에 따라 달라지지 않음
+        - 각 행은 L2 정규화되므로 내적이 곧 코사인 유사도
+    """
+    counts = CountVectorizer(analyzer="char_wb", ngram_range=(2, 2), dtype=np.float32).fit_transform(sentences).tocsr()
+    counts.sort_indices()
+    n_terms = counts.shape[1]
+    row_docs = np.repeat(doc_ids, np.diff(counts.indptr))
+
+    # (기사, 용어) 쌍마다 그 용어를 포함한 기사 안 문장 수 (CSR 항목은 문장-용어 쌍마다 하나)
+    _, inverse, df = np.unique(row_docs * n_terms + counts.indices, return_inverse=True, return_counts=True)
+    n_sentences = np.bincount(doc_ids)[row_docs]
+    idf = np.log((1 + n_sentences) / (1 + df[inverse])) + 1
+    weights = ((1 + np.log(counts.data)) * idf).astype(np.float32)
+
+    row_lengths = np.diff(counts.indptr)
+    rows = np.repeat(np.arange(counts.shape[0]), row_lengths)
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=counts.shape[0]))
+    weights /= norms[rows].astype(np.float32)
+    return sp.csr_matrix((weights, counts.indices, counts.indptr), shape=counts.shape)
+
+def _block_similarity(matrix: sp.csr_matrix, doc_ids: np.ndarray, n_docs: int) -> sp.csr_matrix:
+    """
+    같은 기사 안의 문장 쌍만 포함하는 블록 대각 유사도 행렬을 계산하는 함수
+
+    Note:
+        - 용어 열을 기사별로 분리(열 번호 += 기사 번호 * 용어 수)하면
+          한 번의 희소 행렬 곱으로 기사 간 유사도 없이 블록 대각 행렬을 얻음
+    """
+    n_terms = matrix.shape[1]
+    row_docs = np.repeat(doc_ids, np.diff(matrix.indptr))
+    shifted = sp.csr_matrix(
+        (matrix.data, matrix.indices + row_docs * n_terms, matrix.indptr),
+        shape=(matrix.shape[0], n_terms * n_docs)
+    )
+    similarity = (shifted @ shifted.T).tocsr()
+    similarity.setdiag(0)
+    similarity.eliminate_zeros()
+    return similarity
+
+def _pagerank(similarity: sp.csr_matrix, doc_ids: np.ndarray, n_docs: int,
+              damping: float, max_iter: int, tol: float) -> np.ndarray:
+    """
+    모든 기사의 문장 그래프에 대해 PageRank를 동시에 계산하는 함수
+
+    Note:
+        - 블록 대각 행렬 하나로 반복하므로 기사별 반복문이 없음
+        - 연결된 문장이 없는 문장(dangling)의 점수는 같은 기사 안에 균등 분배
+    """
+    n = similarity.shape[0]
+    doc_sizes = np.bincount(doc_ids, minlength=n_docs).astype(float)
+    uniform = 1.0 / doc_sizes[doc_ids]
+
+    out_weight = np.asarray(similarity.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    inv_weight = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    transition = sp.diags(inv_weight) @ similarity
+    transition_t = transition.T.tocsr()
+
+    scores = uniform.copy()
+    for _ in range(max_iter):
+        dangling_mass = np.bincount(doc_ids, weights=scores * dangling, minlength=n_docs)
+        updated = (1 - damping) * uniform + damping * (
+            transition_t @ scores + dangling_mass[doc_ids] / doc_sizes[doc_ids]
+        )
+        converged = np.abs(updated - scores).sum() < tol * n_docs
+        scores = updated
+        if converged:
+            break
+    return scores
+
+def textrank_select(sentence_lists: List[List[str]], lengths: List[int],
+                    damping: float = 0.85, max_iter: int = 50, tol: float = 1e-6) -> List[List[int]]:
+    """
+    여러 기사의 문장을 TextRank 점수로 한 번에 선택하는 함수
+
+    Args:
+        sentence_lists (List[List[str]]): 기사별 문장 목록
+        lengths (List[int]): 기사별 선택할 문장 수
+        damping (float): PageRank 감쇠 계수 (기본값: 0.85)
+        max_iter (int): 최대 반복 횟수 (기본값: 50)
+        tol (float): 수렴 판정 기준 (기본값: 1e-6)
+
+    Returns:
+        List[List[int]]: 기사별로 선택된 문장 인덱스 (원문 순서)
+
+    Note:
+        - 배치 전체 문장으로 TF-IDF 행렬 하나를 만들고(IDF는 기사별),
+          유사도 계산과 PageRank, 상위 문장 선택을 모두 벡터 연산으로 처리
+        - 기사별 선택 결과는 같은 배치의 다른 기사와 무관 (요약 캐시 키는 기사 본문만 사용)
+    """
+    n_docs = len(sentence_lists)
+    counts = np.array([len(sentences) for sentences in sentence_lists], dtype=np.int64)
+    if n_docs == 0 or counts.sum() == 0:
+        return [[] for _ in range(n_docs)]
+
+    doc_ids = np.repeat(np.arange(n_docs), counts)
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    local_index = np.arange(len(doc_ids)) - offsets[doc_ids]
+    all_sentences = [sentence for sentences in sentence_lists for sentence in sentences]
+
+    try:
+        matrix = _tfidf(all_sentences, doc_ids)
+    except ValueError:
+        # 모든 문장에서 특성을 추출할 수 없는 경우 앞 문장부터 선택
+        matrix = None
+
+    if matrix is None:
+        scores = -local_index.astype(float)
+    else:
+        similarity = _block_similarity(matrix, doc_ids, n_docs)
+        scores = _pagerank(similarity, doc_ids, n_docs, damping, max_iter, tol)
+
+    # 기사별 점수 내림차순(동점이면 앞 문장 우선) 정렬 후 순위가 선택 수 이내인 문장 선택
+    order = np.lexsort((local_index, -scores, doc_ids))
+    rank = np.arange(len(order)) - offsets[doc_ids[order]]
+    limits = np.asarray(lengths, dtype=np.int64)
+    chosen = order[rank < limits[doc_ids[order]]]
+
+    # 원문 순서로 복원
+    chosen = chosen[np.lexsort((local_index[chosen], doc_ids[chosen]))]
+    split_points = np.searchsorted(doc_ids[chosen], np.arange(1, n_docs))
+    return [indices.tolist() for indices in np.split(local_index[chosen], split_points)]